@@ -37,8 +37,10 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from fake_useragent import UserAgent
 
 import sickrage
+from sickrage.core.caches.metadata_cache import srMetadataCache
 from sickrage.core.caches.name_cache import srNameCache
-from sickrage.core.classes import AttrDict, srIntervalTrigger
+from sickrage.core.caches.provider_cache import srProviderCache
+from sickrage.core.classes import AttrDict, srIntervalTrigger, srShowList
 from sickrage.core.common import SD, SKIPPED, WANTED
 from sickrage.core.databases.cache import CacheDB
 from sickrage.core.databases.failed import FailedDB
@@ -47,11 +49,13 @@ from sickrage.core.google import googleAuth
 from sickrage.core.helpers import findCertainShow, \
     generateCookieSecret, makeDir, get_lan_ip, restoreSR, getDiskSpaceUsage, getFreeSpace, launch_browser
 from sickrage.core.helpers.encoding import get_sys_encoding, ek, patch_modules
+from sickrage.core.nameparser import name_parser_cache
 from sickrage.core.nameparser.validator import check_force_season_folders
 from sickrage.core.processors import auto_postprocessor
 from sickrage.core.processors.auto_postprocessor import srPostProcessor
 from sickrage.core.queues.search import srSearchQueue
 from sickrage.core.queues.show import srShowQueue
+from sickrage.core.search import srProviderSearchPool
 from sickrage.core.searchers.backlog_searcher import srBacklogSearcher
 from sickrage.core.searchers.daily_searcher import srDailySearcher
 from sickrage.core.searchers.proper_searcher import srProperSearcher
@@ -60,6 +64,7 @@ from sickrage.core.searchers.trakt_searcher import srTraktSearcher
 from sickrage.core.srconfig import srConfig
 from sickrage.core.srlogger import srLogger
 from sickrage.core.tv.show import TVShow
+from sickrage.core.tv.show.stats import ShowStats
 from sickrage.core.ui import Notifications
 from sickrage.core.updaters.show_updater import srShowUpdater
 from sickrage.core.updaters.tz_updater import update_network_dict
@@ -116,10 +121,19 @@ class Core(object):
         # name cache
         self.NAMECACHE = srNameCache()
 
+        # provider cache
+        self.PROVIDERCACHE = srProviderCache()
+
+        # release metadata cache
+        self.METADATACACHE = srMetadataCache()
+
         # queues
         self.SHOWQUEUE = srShowQueue()
         self.SEARCHQUEUE = srSearchQueue()
 
+        # provider search pool
+        self.SEARCHPOOL = srProviderSearchPool()
+
         # updaters
         self.VERSIONUPDATER = srVersionUpdater()
         self.SHOWUPDATER = srShowUpdater()
@@ -142,7 +156,7 @@ class Core(object):
         self.ADBA_CONNECTION = None
 
         # show list
-        self.SHOWLIST = []
+        self.SHOWLIST = srShowList()
 
         self.USER_AGENT = 'SiCKRAGE.CE.1/({};{};{})'.format(platform.system(), platform.release(), str(uuid.uuid1()))
 
@@ -151,6 +165,15 @@ class Core(object):
         # patch modules with encoding kludge
         patch_modules()
 
+    @property
+    def SHOWLIST(self):
+        return self._SHOWLIST
+
+    @SHOWLIST.setter
+    def SHOWLIST(self, value):
+        # keep the show list indexed when it gets replaced
+        self._SHOWLIST = value if isinstance(value, srShowList) else srShowList(value)
+
     def start(self):
         self.started = True
 
@@ -224,6 +247,9 @@ class Core(object):
             # misc database cleanups
             db.cleanup()
 
+        # rebuild missing or outdated show statistics
+        ShowStats.check()
+
         # compact main database
         if not self.srConfig.DEVELOPER and self.srConfig.LAST_DB_COMPACT < time.time() - 604800:  # 7 days
             self.mainDB.compact()
@@ -232,6 +258,12 @@ class Core(object):
         # load name cache
         self.NAMECACHE.load()
 
+        # load provider cache
+        self.PROVIDERCACHE.load()
+
+        # size name parser cache
+        name_parser_cache.resize(self.srConfig.NAMEPARSER_CACHE_SIZE)
+
         # load data for shows from database
         self.load_shows()
 
@@ -341,6 +373,17 @@ class Core(object):
             id="SHOWUPDATER"
         )
 
+        # add name cache job
+        self.srScheduler.add_job(
+            self.NAMECACHE.run,
+            srIntervalTrigger(
+                **{'minutes': self.srConfig.NAMECACHE_FREQ,
+                   'min': self.srConfig.MIN_NAMECACHE_FREQ,
+                   'start_date': datetime.datetime.now() + datetime.timedelta(minutes=1)}),
+            name="NAMECACHE",
+            id="NAMECACHE"
+        )
+
         # add show next episode job
         self.srScheduler.add_job(
             self.SHOWUPDATER.nextEpisode,
@@ -461,11 +504,19 @@ class Core(object):
                 self.SEARCHQUEUE.shutdown()
                 del self.SEARCHQUEUE
 
+            # shutdown provider search pool
+            if self.SEARCHPOOL:
+                self.srLogger.debug("Shutting down provider search pool")
+                self.SEARCHPOOL.shutdown()
+
             # log out of ADBA
             if self.ADBA_CONNECTION:
                 self.srLogger.debug("Shutting down ANIDB connection")
                 self.ADBA_CONNECTION.stop()
 
+            # close web client session connection pools and http cache
+            self.srWebSession.close()
+
             # save all show and config settings
             self.save_all()
 
@@ -494,6 +545,9 @@ class Core(object):
             except:
                 continue
 
+        # write pending name cache changes
+        self.NAMECACHE.save()
+
         # save config
         self.srConfig.save()
 
@@ -0,0 +1,78 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+# Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+
+class srMetadataCache(object):
+    """
+    Bounded LRU cache of release metadata (total size and file list) shared by all providers, entries expire
+    after ttl seconds so a release is only downloaded and decoded once per search run. Failed fetches expire
+    after negative_ttl seconds so a release that was temporarily unavailable is tried again soon.
+    """
+
+    def __init__(self, maxsize=500, ttl=3600, negative_ttl=60):
+        self.lock = threading.RLock()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.items = OrderedDict()
+
+    @staticmethod
+    def make_key(url):
+        """
+        Torrents are keyed by info-hash so magnets and mirror urls for the same release share an entry
+        """
+        try:
+            return str(re.findall(r'urn:btih:([\w]{32,40})', url)[0]).upper()
+        except IndexError:
+            return url
+
+    def get(self, url):
+        key = self.make_key(url)
+
+        with self.lock:
+            if key not in self.items:
+                return None
+
+            expires, metadata = self.items.pop(key)
+            if expires < time.time():
+                return None
+
+            self.items[key] = (expires, metadata)
+            return metadata
+
+    def set(self, url, metadata, failed=False):
+        key = self.make_key(url)
+
+        with self.lock:
+            self.items.pop(key, None)
+            self.items[key] = (time.time() + (self.ttl, self.negative_ttl)[failed], metadata)
+
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
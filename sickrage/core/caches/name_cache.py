@@ -19,11 +19,10 @@
 
 from __future__ import unicode_literals
 
-import time
+import threading
+from collections import defaultdict
 from datetime import datetime, timedelta
 
-from CodernityDB.database import RecordNotFound
-
 import sickrage
 from sickrage.core.helpers import full_sanitizeSceneName
 from sickrage.core.scene_exceptions import retrieve_exceptions, get_scene_seasons, get_scene_exceptions
@@ -31,19 +30,67 @@ from sickrage.core.scene_exceptions import retrieve_exceptions, get_scene_season
 
 class srNameCache(object):
     def __init__(self, *args, **kwargs):
+        self.name = "NAMECACHE"
+        self.amActive = False
         self.min_time = 10
         self.last_update = {}
+        self.lock = threading.RLock()
+
+        # name -> indexer_id, plus a reverse map so a show's names can be dropped without a full scan
         self.cache = {}
+        self.shows = defaultdict(set)
+
+        # name -> indexer_id as currently stored in cache.db, and names changed since the last save
+        self.stored = {}
+        self.dirty = set()
+
+        self.hits = 0
+        self.misses = 0
+
+    def run(self, force=False):
+        """
+        Refreshes scene exceptions, rebuilds the names of shows whose exceptions changed and
+        writes pending name changes to cache.db
+        """
+
+        if self.amActive:
+            return
+
+        self.amActive = True
+
+        # set thread name
+        threading.currentThread().setName(self.name)
+
+        try:
+            updated = retrieve_exceptions()
+            for show in sickrage.srCore.SHOWLIST:
+                if force or show.indexerid in updated:
+                    self.build(show, force=True)
+
+            self.save()
+        finally:
+            self.amActive = False
 
     def should_update(self, show):
         # if we've updated recently then skip the update
-        if datetime.today() - (self.last_update.get(show.name) or datetime.fromtimestamp(
-                int(time.mktime(datetime.today().timetuple())))) < timedelta(minutes=self.min_time):
-            return True
+        last_update = self.last_update.get(show.indexerid)
+        return not last_update or datetime.today() - last_update > timedelta(minutes=self.min_time)
+
+    def _add(self, name, indexer_id):
+        self.cache[name] = indexer_id
+        self.shows[indexer_id].add(name)
+        self.dirty.add(name)
+
+    def _remove(self, name):
+        indexer_id = self.cache.pop(name, None)
+        if indexer_id is not None:
+            self.shows[indexer_id].discard(name)
+            self.dirty.add(name)
 
     def put(self, name, indexer_id=0):
         """
-        Adds the show & tvdb id to the scene_names table in cache.db.
+        Adds the show & tvdb id to the name cache, changes are written to the scene_names
+        table in cache.db on the next save.
 
         :param name: The show name to cache
         :param indexer_id: the TVDB id that this show should be cached with (can be None/0 for unknown)
@@ -51,84 +98,114 @@ class srNameCache(object):
 
         # standardize the name we're using to account for small differences in providers
         name = full_sanitizeSceneName(name)
-        if name not in self.cache:
-            self.cache[name] = int(indexer_id)
 
-            try:
-                dbData = [x['doc'] for x in sickrage.srCore.cacheDB.db.get_many('scene_names', name, with_doc=True) if
-                          x['doc']['indexer_id'] == indexer_id]
-
-                if not len(dbData):
-                    # insert name into cache
-                    sickrage.srCore.cacheDB.db.insert({
-                        '_t': 'scene_names',
-                        'indexer_id': indexer_id,
-                        'name': name
-                    })
-            except RecordNotFound:
-                # insert name into cache
-                sickrage.srCore.cacheDB.db.insert({
-                    '_t': 'scene_names',
-                    'indexer_id': indexer_id,
-                    'name': name
-                })
+        with self.lock:
+            if name not in self.cache:
+                self._add(name, int(indexer_id or 0))
 
     def get(self, name):
         """
-        Looks up the given name in the scene_names table in cache.db.
+        Looks up the given name in the name cache.
 
         :param name: The show name to look up.
         :return: the TVDB id that resulted from the cache lookup or None if the show wasn't found in the cache
         """
         name = full_sanitizeSceneName(name)
-        if name in self.cache:
-            return int(self.cache[name])
+
+        indexer_id = self.cache.get(name)
+        if indexer_id is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return indexer_id
 
     def clear(self, indexerid=0):
         """
-        Deletes all "unknown" entries from the cache (names with indexer_id of 0).
+        Deletes all names of the given show and all "unknown" entries (names with indexer_id of 0) from the cache.
         """
-        [sickrage.srCore.cacheDB.db.delete(x['doc']) for x in
-         sickrage.srCore.cacheDB.db.all('scene_names', with_doc=True)
-         if x['doc']['indexer_id'] in [indexerid, 0]]
+        with self.lock:
+            for indexer_id in set([int(indexerid or 0), 0]):
+                for name in list(self.shows.pop(indexer_id, [])):
+                    self._remove(name)
 
-        for item in [self.cache[key] for key, value in self.cache.items() if value == 0 or value == indexerid]:
-            del item
+    def invalidate(self, show):
+        """
+        Drops the cached names of a show, they are rebuilt on the next build of the show.
+        """
+        with self.lock:
+            self.clear(show.indexerid)
+            self.last_update.pop(show.indexerid, None)
 
     def load(self):
-        self.cache = dict(
-            [(key, d['doc'][key]) for d in sickrage.srCore.cacheDB.db.all('scene_names', with_doc=True) for key in
-             d['doc']])
+        """Bulk load the scene_names table from cache.db, dropping duplicate rows"""
+        cache = {}
+        duplicates = []
+
+        for dbData in [x['doc'] for x in sickrage.srCore.cacheDB.db.all('scene_names', with_doc=True)]:
+            if dbData['name'] in cache:
+                duplicates.append(dbData)
+                continue
+            cache[dbData['name']] = int(dbData['indexer_id'] or 0)
+
+        for dbData in duplicates:
+            sickrage.srCore.cacheDB.db.delete(dbData)
+
+        with self.lock:
+            self.cache = cache
+            self.stored = cache.copy()
+            self.dirty = set()
+            self.shows = defaultdict(set)
+            for name, indexer_id in cache.items():
+                self.shows[indexer_id].add(name)
 
     def save(self):
-        """Commit cache to database file"""
-        for name, indexer_id in self.cache.items():
-            try:
-                dbData = [x['doc'] for x in sickrage.srCore.cacheDB.db.get_many('scene_names', name, with_doc=True) if
-                          x['doc']['indexer_id'] == indexer_id]
-                if len(dbData): continue
-            except RecordNotFound:
-                pass
-
-            # insert name into cache
-            sickrage.srCore.cacheDB.db.insert({
-                '_t': 'scene_names',
-                'indexer_id': indexer_id,
-                'name': name
-            })
-
-    def build(self, show):
+        """Commit pending name cache changes to database file"""
+        with self.lock:
+            changes = dict((name, self.cache.get(name)) for name in self.dirty
+                           if self.cache.get(name) != self.stored.get(name))
+            self.dirty = set()
+
+            for name, indexer_id in changes.items():
+                if name in self.stored:
+                    for dbData in [x['doc'] for x in
+                                   sickrage.srCore.cacheDB.db.get_many('scene_names', name, with_doc=True)]:
+                        sickrage.srCore.cacheDB.db.delete(dbData)
+                    del self.stored[name]
+
+                if indexer_id is not None:
+                    sickrage.srCore.cacheDB.db.insert({
+                        '_t': 'scene_names',
+                        'indexer_id': indexer_id,
+                        'name': name
+                    })
+                    self.stored[name] = indexer_id
+
+        if changes:
+            sickrage.srCore.srLogger.debug("Saved {} name cache changes".format(len(changes)))
+
+    @property
+    def stats(self):
+        return {
+            'names': len(self.cache),
+            'shows': len([x for x in self.shows.values() if x]),
+            'pending': len(self.dirty),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def build(self, show, force=False):
         """Build internal name cache
 
-        :param show: Specify show to build name cache for, if None, just do all shows
+        :param show: Specify show to build name cache for
+        :param force: rebuild even if the show was built recently
         """
 
-        retrieve_exceptions()
+        if force or self.should_update(show):
+            with self.lock:
+                self.last_update[show.indexerid] = datetime.today()
 
-        if self.should_update(show):
-            self.last_update[show.name] = datetime.fromtimestamp(int(time.mktime(datetime.today().timetuple())))
-
-            self.clear(show.indexerid)
-            for curSeason in [-1] + get_scene_seasons(show.indexerid):
-                for name in list(set(get_scene_exceptions(show.indexerid, season=curSeason) + [show.name])):
-                    self.put(name, show.indexerid)
+                self.clear(show.indexerid)
+                for curSeason in [-1] + get_scene_seasons(show.indexerid):
+                    for name in list(set(get_scene_exceptions(show.indexerid, season=curSeason) + [show.name])):
+                        self.put(name, show.indexerid)
@@ -0,0 +1,161 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+# Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import bisect
+import threading
+
+from CodernityDB.database import RecordNotFound
+
+import sickrage
+
+
+class srProviderCache(object):
+    """
+    In-memory index over the provider results stored in cache.db, every write goes to the database
+    and the index so lookups by url, episode and time never have to scan a providers results.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.lock = threading.RLock()
+        self.urls = {}
+        self.episodes = {}
+        self.times = {}
+        self.feed_generation = 0
+
+    @staticmethod
+    def _episode_keys(doc):
+        for episode in [x for x in str(doc.get('episodes', '')).split('|') if x]:
+            try:
+                yield int(doc['indexerid'] or 0), int(doc['season']), int(episode)
+            except ValueError:
+                continue
+
+    def _add(self, doc):
+        provider_id = doc['provider']
+
+        self.urls.setdefault(provider_id, {})[doc['url']] = doc
+        for key in self._episode_keys(doc):
+            self.episodes.setdefault(provider_id, {}).setdefault(key, []).append(doc)
+        bisect.insort(self.times.setdefault(provider_id, []), (int(doc.get('time', 0)), doc['url']))
+
+    def load(self):
+        """
+        Builds the index from the providers table in cache.db
+        """
+        with self.lock:
+            self.urls, self.episodes, self.times = {}, {}, {}
+
+            for doc in [x['doc'] for x in sickrage.srCore.cacheDB.db.all('providers', with_doc=True)]:
+                if doc['url'] in self.urls.get(doc['provider'], {}):
+                    # remove duplicate results
+                    sickrage.srCore.cacheDB.db.delete(doc)
+                    continue
+
+                self._add(doc)
+
+    def add(self, doc):
+        """
+        Adds a result to cache.db and the index, results with a url already cached for the provider are ignored
+
+        :param doc: provider result document
+        :return: True if the result was added
+        """
+        with self.lock:
+            if self.has_url(doc['provider'], doc['url']):
+                return False
+
+            sickrage.srCore.cacheDB.db.insert(doc)
+            self._add(doc)
+
+        return True
+
+    def has_url(self, provider_id, url):
+        return url in self.urls.get(provider_id, {})
+
+    def get_all(self, provider_id):
+        with self.lock:
+            return self.urls.get(provider_id, {}).values()
+
+    def get_episode(self, provider_id, indexerid, season, episode):
+        with self.lock:
+            return list(self.episodes.get(provider_id, {}).get((int(indexerid), int(season), int(episode)), []))
+
+    def get_since(self, provider_id, timestamp):
+        """
+        Returns all results for a provider that where added at or after timestamp
+        """
+        with self.lock:
+            times = self.times.get(provider_id, [])
+            return [self.urls[provider_id][url] for __, url in times[bisect.bisect_left(times, (int(timestamp),)):]]
+
+    def clear(self, provider_id):
+        """
+        Deletes all results of a provider from cache.db and the index
+        """
+        with self.lock:
+            [sickrage.srCore.cacheDB.db.delete(x['doc']) for x in
+             sickrage.srCore.cacheDB.db.get_many('providers', provider_id, with_doc=True)]
+
+            self.urls.pop(provider_id, None)
+            self.episodes.pop(provider_id, None)
+            self.times.pop(provider_id, None)
+
+    def get_feed_state(self, provider_id):
+        """
+        Returns the feed validators and the ids of the items seen on the last update of a provider, together
+        with the generation they belong to
+        """
+        with self.lock:
+            try:
+                doc = sickrage.srCore.cacheDB.db.get('feed_state', provider_id, with_doc=True)['doc']
+                state = {'validators': doc.get('validators') or {}, 'seen': doc.get('seen') or []}
+            except RecordNotFound:
+                state = {'validators': {}, 'seen': []}
+
+            return state, self.feed_generation
+
+    def set_feed_state(self, provider_id, state, generation):
+        """
+        Stores the feed state of a provider, the state is dropped if the feed states were reset since it was
+        loaded and nothing is written if it did not change
+        """
+        with self.lock:
+            if generation != self.feed_generation:
+                return
+
+            try:
+                doc = sickrage.srCore.cacheDB.db.get('feed_state', provider_id, with_doc=True)['doc']
+                if doc.get('validators') == state['validators'] and doc.get('seen') == state['seen']:
+                    return
+                doc.update(state)
+                sickrage.srCore.cacheDB.db.update(doc)
+            except RecordNotFound:
+                sickrage.srCore.cacheDB.db.insert(dict({'_t': 'feed_state', 'provider': provider_id}, **state))
+
+    def reset_feed_states(self):
+        """
+        Forgets the feed state of all providers so items that were already seen are parsed again, used when a
+        show or scene exception is added and existing releases may now match
+        """
+        with self.lock:
+            self.feed_generation += 1
+            [sickrage.srCore.cacheDB.db.delete(x['doc']) for x in
+             sickrage.srCore.cacheDB.db.all('feed_state', with_doc=True)]
@@ -19,7 +19,9 @@
 from __future__ import unicode_literals
 
 import datetime
+import threading
 import time
+import urllib
 import urllib2
 
 from CodernityDB.database import RecordNotFound
@@ -33,16 +35,19 @@ from sickrage.core.rssfeeds import getFeed
 
 
 class TVCache(object):
+    # minimum number of ids of the newest feed items kept between updates
+    max_seen = 200
+
     def __init__(self, provider, min_time=10, search_params=None):
         self.provider = provider
         self.providerID = self.provider.id
         self.min_time = min_time
         self.search_params = search_params or {'RSS': ['']}
+        self.local = threading.local()
 
     def clear(self):
         if self.shouldClearCache():
-            [sickrage.srCore.cacheDB.db.delete(x['doc']) for x in
-             sickrage.srCore.cacheDB.db.get_many('providers', self.providerID, with_doc=True)]
+            sickrage.srCore.PROVIDERCACHE.clear(self.providerID)
 
     def _get_title_and_url(self, item):
         return self.provider._get_title_and_url(item)
@@ -61,6 +66,8 @@ class TVCache(object):
         # check if we should update
         if self.should_update():
             try:
+                self._begin_update()
+
                 data = self._get_rss_data()
                 if not self.check_auth(data):
                     return False
@@ -71,7 +78,8 @@ class TVCache(object):
                 # set updated
                 self.last_update = datetime.datetime.today()
 
-                [self._parseItem(item) for item in data['entries']]
+                self._parseItems(data['entries'])
+                self._end_update()
             except AuthException as e:
                 sickrage.srCore.srLogger.warning("Authentication error: {}".format(e.message))
                 return False
@@ -79,9 +87,80 @@ class TVCache(object):
                 sickrage.srCore.srLogger.debug(
                     "Error while searching {}, skipping: {}".format(self.provider.name, repr(e)))
                 return False
+            finally:
+                self._reset_update()
 
         return True
 
+    def _begin_update(self):
+        """
+        Loads the feed validators and the items seen on the last update, a cache that is about to be cleared
+        is refreshed in full
+        """
+        self.local.validators = {}
+        self.local.seen = set()
+        self.local.new_seen = []
+        self.local.previous = []
+
+        state, self.local.generation = sickrage.srCore.PROVIDERCACHE.get_feed_state(self.providerID)
+        if not self.shouldClearCache():
+            self.local.validators = state['validators']
+            self.local.seen = set(state['seen'])
+            self.local.previous = state['seen']
+
+    def _end_update(self):
+        """
+        Stores the feed validators and the ids of the newest items, items from feeds that didn't change are
+        kept so they are still skipped next time. The number of ids kept grows to fit the largest update of
+        the provider so feeds returning more than max_seen items are not parsed again in full
+        """
+        new_seen = getattr(self.local, 'new_seen', [])
+        previous = getattr(self.local, 'previous', [])
+        limit = max(self.max_seen, len(set(new_seen)), len(previous))
+
+        seen = []
+        kept = set()
+        for item_id in new_seen + previous:
+            if item_id not in kept:
+                kept.add(item_id)
+                seen.append(item_id)
+            if len(seen) == limit:
+                break
+
+        sickrage.srCore.PROVIDERCACHE.set_feed_state(self.providerID, {
+            'validators': getattr(self.local, 'validators', None) or {},
+            'seen': seen
+        }, getattr(self.local, 'generation', None))
+
+    def _reset_update(self):
+        self.local.validators = None
+        self.local.seen = set()
+        self.local.new_seen = []
+        self.local.previous = []
+        self.local.generation = None
+
+    def _get_item_id(self, item):
+        try:
+            return item.get('id') or item.get('guid') or item.get('link')
+        except AttributeError:
+            return None
+
+    def _parseItems(self, items):
+        """
+        Parses feed items into the cache, items already seen on the last update are skipped before parsing
+        """
+        seen = getattr(self.local, 'seen', set())
+        new_seen = getattr(self.local, 'new_seen', [])
+
+        for item in items or []:
+            item_id = self._get_item_id(item)
+            if item_id:
+                new_seen.append(item_id)
+                if item_id in seen:
+                    continue
+
+            self._parseItem(item)
+
     def getRSSFeed(self, url, params=None):
         handlers = []
 
@@ -91,7 +170,23 @@ class TVCache(object):
             address = sickrage.srCore.srConfig.PROXY_SETTING if scheme else 'http://' + sickrage.srCore.srConfig.PROXY_SETTING
             handlers = [urllib2.ProxyHandler({'http': address, 'https': address})]
 
-        return getFeed(url, params=params, handlers=handlers)
+        # conditional requests are only made while updating the cache, searches always need the entries
+        validators = getattr(self.local, 'validators', None)
+        if validators is None:
+            return getFeed(url, params=params, handlers=handlers)
+
+        key = url + ('?' + urllib.urlencode(sorted(params.items())) if params else '')
+        etag, modified = validators.get(key, (None, None))
+
+        data = getFeed(url, params=params, handlers=handlers, etag=etag, modified=modified)
+        if data.get('status') == 304:
+            sickrage.srCore.srLogger.debug("{} feed not modified since last update".format(self.provider.name))
+        elif data.get('etag') or data.get('modified'):
+            validators[key] = (data.get('etag'), data.get('modified'))
+        else:
+            validators.pop(key, None)
+
+        return data
 
     def _translateTitle(self, title):
         return '' + title.replace(' ', '.')
@@ -177,8 +272,7 @@ class TVCache(object):
 
     def addCacheEntry(self, name, url, parse_result=None, indexer_id=0):
         # check for existing entry in cache
-        if len([x for x in sickrage.srCore.cacheDB.db.get_many('providers', self.providerID, with_doc=True) if
-                x['doc']['url'] == url]): return
+        if sickrage.srCore.PROVIDERCACHE.has_url(self.providerID, url): return
 
         # check if we passed in a parsed result or should we try and create one
         if not parse_result:
@@ -208,7 +302,7 @@ class TVCache(object):
                 version = parse_result.version
 
                 # add to DB
-                sickrage.srCore.cacheDB.db.insert({
+                sickrage.srCore.PROVIDERCACHE.add({
                     '_t': 'providers',
                     'provider': self.providerID,
                     'name': name,
@@ -225,22 +319,18 @@ class TVCache(object):
                 sickrage.srCore.srLogger.debug("RSS ITEM:[%s] ADDED!", name)
 
     def list_propers(self, date=None):
-        return [x['doc'] for x in sickrage.srCore.cacheDB.db.get_many('providers', self.providerID, with_doc=True)
-                if ('.PROPER.' in x['doc']['name'] or '.REPACK.' in x['doc']['name'])
-                and x['doc']['time'] >= str(int(time.mktime(date.timetuple())))
-                and x['doc']['indexerid']]
+        return [x for x in
+                sickrage.srCore.PROVIDERCACHE.get_since(self.providerID, int(time.mktime(date.timetuple())))
+                if ('.PROPER.' in x['name'] or '.REPACK.' in x['name']) and x['indexerid']]
 
     def search_cache(self, episode=None, manualSearch=False, downCurQuality=False):
         neededEps = {}
 
         if not episode:
-            dbData = [x['doc'] for x in
-                      sickrage.srCore.cacheDB.db.get_many('providers', self.providerID, with_doc=True)]
+            dbData = sickrage.srCore.PROVIDERCACHE.get_all(self.providerID)
         else:
-            dbData = [x['doc'] for x in sickrage.srCore.cacheDB.db.get_many('providers', self.providerID, with_doc=True)
-                      if x['doc']['indexerid'] == episode.show.indexerid
-                      and x['doc']['season'] == episode.season
-                      and "|" + str(episode.episode) + "|" in x['doc']['episodes']]
+            dbData = sickrage.srCore.PROVIDERCACHE.get_episode(self.providerID, episode.show.indexerid,
+                                                               episode.season, episode.episode)
 
         # for each cache entry
         for curResult in dbData:
@@ -296,8 +386,6 @@ class TVCache(object):
             result.release_group = curReleaseGroup
             result.version = curVersion
             result.content = None
-            result.size = self.provider._get_size(url)
-            result.files = self.provider._get_files(url)
 
             # add it to the list
             if epObj not in neededEps:
@@ -22,6 +22,7 @@ from __future__ import unicode_literals
 import datetime
 import re
 import sys
+import threading
 
 from apscheduler.triggers.interval import IntervalTrigger
 from dateutil import parser
@@ -56,8 +57,8 @@ class SearchResult(object):
         # release name
         self.name = ""
 
-        # size of the release (-1 = n/a)
-        self.size = -1
+        # size of the release (-1 = n/a), fetched from the provider on first access
+        self._size = None
 
         # release group
         self.release_group = ""
@@ -77,8 +78,38 @@ class SearchResult(object):
         # result type
         self.resultType = ''
 
-        # dict of files and their sizes
-        self.files = {}
+        # dict of files and their sizes, fetched from the provider on first access
+        self._files = None
+
+    def _load_metadata(self):
+        metadata = {'size': -1, 'files': {}}
+        if self.provider and self.url:
+            metadata = self.provider._get_metadata(self.url)
+
+        if self._size is None:
+            self._size = metadata['size']
+        if self._files is None:
+            self._files = metadata['files']
+
+    @property
+    def size(self):
+        if self._size is None:
+            self._load_metadata()
+        return self._size
+
+    @size.setter
+    def size(self, value):
+        self._size = value
+
+    @property
+    def files(self):
+        if self._files is None:
+            self._load_metadata()
+        return self._files
+
+    @files.setter
+    def files(self, value):
+        self._files = value
 
     def __str__(self):
 
@@ -287,6 +318,110 @@ class AttrDict(dict):
             raise AttributeError("No such attribute: " + name)
 
 
+class srShowList(list):
+    """
+    Ordered list of shows that also indexes the shows by indexerid and by (indexer, indexerid)
+    """
+
+    def __init__(self, shows=None):
+        super(srShowList, self).__init__()
+        self.lock = threading.RLock()
+        self.by_indexerid = {}
+        self.by_indexer = {}
+        self.extend(shows or [])
+
+    def _register(self, show):
+        self.by_indexerid.setdefault(show.indexerid, []).append(show)
+        self.by_indexer.setdefault((show.indexer, show.indexerid), []).append(show)
+
+    def _unregister(self, show):
+        for index, key in [(self.by_indexerid, show.indexerid), (self.by_indexer, (show.indexer, show.indexerid))]:
+            shows = [x for x in index.get(key, []) if x is not show]
+            if shows:
+                index[key] = shows
+            else:
+                index.pop(key, None)
+
+    def _reindex(self):
+        self.by_indexerid = {}
+        self.by_indexer = {}
+        for show in self:
+            self._register(show)
+
+    def find(self, indexerid, indexer=None):
+        """
+        Returns the shows matching indexerid, or any of the indexerids if a list is given
+
+        :param indexerid: indexer id or list of indexer ids
+        :param indexer: optionally only match shows from this indexer
+        :return: list of shows
+        """
+        indexer_ids = indexerid if isinstance(indexerid, list) else [indexerid]
+
+        with self.lock:
+            if indexer is None:
+                return [show for x in indexer_ids for show in self.by_indexerid.get(x, [])]
+            return [show for x in indexer_ids for show in self.by_indexer.get((indexer, x), [])]
+
+    def append(self, show):
+        with self.lock:
+            super(srShowList, self).append(show)
+            self._register(show)
+
+    def extend(self, shows):
+        with self.lock:
+            for show in shows:
+                self.append(show)
+
+    def __iadd__(self, shows):
+        self.extend(shows)
+        return self
+
+    def insert(self, i, show):
+        with self.lock:
+            super(srShowList, self).insert(i, show)
+            self._register(show)
+
+    def remove(self, show):
+        with self.lock:
+            super(srShowList, self).remove(show)
+            self._unregister(show)
+
+    def remove_show(self, indexerid):
+        """
+        Removes all shows with the given indexerid
+        """
+        with self.lock:
+            for show in self.find(indexerid):
+                self.remove(show)
+
+    def pop(self, i=-1):
+        with self.lock:
+            show = super(srShowList, self).pop(i)
+            self._unregister(show)
+            return show
+
+    def __setitem__(self, i, value):
+        with self.lock:
+            super(srShowList, self).__setitem__(i, value)
+            self._reindex()
+
+    def __delitem__(self, i):
+        with self.lock:
+            super(srShowList, self).__delitem__(i)
+            self._reindex()
+
+    def __setslice__(self, i, j, value):
+        with self.lock:
+            super(srShowList, self).__setslice__(i, j, value)
+            self._reindex()
+
+    def __delslice__(self, i, j):
+        with self.lock:
+            super(srShowList, self).__delslice__(i, j)
+            self._reindex()
+
+
 class srIntervalTrigger(IntervalTrigger):
     def __init__(self, weeks=0, days=0, hours=0, minutes=0, seconds=0, start_date=None, end_date=None, timezone=None,
                  **kwargs):
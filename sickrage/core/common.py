@@ -86,6 +86,47 @@ multiEpStrings = {NAMING_REPEAT: "Repeat", NAMING_SEPARATED_REPEAT: "Repeat (Sep
                   NAMING_LIMITED_EXTEND_E_PREFIXED: "Extend (Limited, E-prefixed)"}
 
 
+class _QualityTokens(dict):
+    """
+    Lazily evaluated quality tokens of a release name, each token pattern is searched at most once per name
+    """
+
+    patterns = dict((key, re.compile(pattern, re.I)) for key, pattern in {
+        'sd_source': r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip",
+        'sd_codec': r"xvid|divx|[xh].?26[45]",
+        'dvd_source': r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray",
+        'hd_resolution': r"(720|1080)[pi]",
+        'hr_ws_pdtv': r"hr.ws.pdtv.[xh].?26[45]",
+        '720p': r"720p",
+        '1080p': r"1080p",
+        '1080pi': r"1080[pi]",
+        '720p_1080i': r"720p|1080i",
+        '1080pi_hdtv': r"1080[pi].hdtv",
+        '2160p': r"2160p",
+        '4320p': r"4320p",
+        'hdtv': r"hd.?tv",
+        'web': r"\bweb\b|web.?dl|web(rip|mux|hd)",
+        'itunes': r"itunes",
+        'bluray': r"blue?-?ray|hddvd|b[rd](rip|mux)",
+        'x264': r"[xh].?26[45]",
+        'h264': r"h.?26[45]",
+        'mpeg2': r"mpeg-?2",
+        'anime_dvd': r"dvd",
+        'anime_bluray': r"BD|blue?-?ray",
+        'anime_sd': r"360p|480p|848x480|XviD",
+        'anime_hd': r"720p|1280x720|960x720",
+        'anime_fullhd': r"1080p|1920x1080",
+    }.items())
+
+    def __init__(self, name):
+        super(_QualityTokens, self).__init__()
+        self.name = name
+
+    def __missing__(self, key):
+        self[key] = self.patterns[key].search(self.name) is not None
+        return self[key]
+
+
 # pylint: disable=W0232
 class Quality(object):
     NONE = 0  # 0
@@ -191,6 +232,38 @@ class Quality(object):
                       SNATCHED_BEST: "Snatched (Best)",
                       ARCHIVED: "Archived"}
 
+    # scene quality decision tables, each quality is matched when all required tokens and none of the
+    # excluded tokens of one of its rules are found in the name, see _QualityTokens for the token patterns
+    _sceneQualityRules = [
+        (SDTV, [(('sd_source', 'sd_codec'), ('hd_resolution', 'hr_ws_pdtv'))]),
+        (SDDVD, [(('dvd_source', 'sd_codec'), ('hd_resolution', 'hr_ws_pdtv'))]),
+        (HDTV, [(('720p', 'hdtv', 'x264'), ()), (('hr_ws_pdtv',), ('1080pi',))]),
+        (RAWHDTV, [(('720p_1080i', 'hdtv', 'mpeg2'), ()), (('1080pi_hdtv', 'h264'), ())]),
+        (FULLHDTV, [(('1080p', 'hdtv', 'x264'), ())]),
+        (HDWEBDL, [(('720p', 'web'), ()), (('720p', 'itunes', 'x264'), ())]),
+        (FULLHDWEBDL, [(('1080p', 'web'), ()), (('1080p', 'itunes', 'x264'), ())]),
+        (HDBLURAY, [(('720p', 'bluray', 'x264'), ())]),
+        (FULLHDBLURAY, [(('1080p', 'bluray', 'x264'), ())]),
+        (UHD_4K_TV, [(('2160p', 'hdtv', 'x264'), ())]),
+        (UHD_8K_TV, [(('4320p', 'hdtv', 'x264'), ())]),
+        (UHD_4K_WEBDL, [(('2160p', 'web'), ()), (('2160p', 'itunes', 'x264'), ())]),
+        (UHD_8K_WEBDL, [(('4320p', 'web'), ()), (('4320p', 'itunes', 'x264'), ())]),
+        (UHD_4K_BLURAY, [(('2160p', 'bluray', 'x264'), ())]),
+        (UHD_8K_BLURAY, [(('4320p', 'bluray', 'x264'), ())]),
+    ]
+
+    _animeQualityRules = [
+        (SDTV, [(('anime_sd',), ('anime_bluray', 'anime_dvd'))]),
+        (SDDVD, [(('anime_dvd',), ())]),
+        (HDTV, [(('anime_hd',), ('anime_bluray', 'anime_fullhd'))]),
+        (FULLHDTV, [(('anime_fullhd',), ('anime_bluray', 'anime_hd'))]),
+        (HDBLURAY, [(('anime_bluray', 'anime_hd'), ('anime_fullhd',))]),
+        (FULLHDBLURAY, [(('anime_bluray', 'anime_fullhd'), ('anime_hd',))]),
+    ]
+
+    _splitQualityCache = {}
+    _splitCompositeStatusCache = {}
+
     @staticmethod
     def _getStatusStrings(status):
         """
@@ -217,15 +290,19 @@ class Quality(object):
 
     @staticmethod
     def splitQuality(quality):
-        anyQualities = []
-        bestQualities = []
-        for curQual in Quality.qualityStrings.keys():
-            if curQual & quality:
-                anyQualities.append(curQual)
-            if curQual << 16 & quality:
-                bestQualities.append(curQual)
+        if quality not in Quality._splitQualityCache:
+            anyQualities = []
+            bestQualities = []
+            for curQual in sorted(Quality.qualityStrings.keys()):
+                if curQual & quality:
+                    anyQualities.append(curQual)
+                if curQual << 16 & quality:
+                    bestQualities.append(curQual)
+
+            Quality._splitQualityCache[quality] = (tuple(anyQualities), tuple(bestQualities))
 
-        return (sorted(anyQualities), sorted(bestQualities))
+        anyQualities, bestQualities = Quality._splitQualityCache[quality]
+        return (list(anyQualities), list(bestQualities))
 
     @staticmethod
     def nameQuality(name, anime=False):
@@ -261,81 +338,16 @@ class Quality(object):
         :return: Quality prefix
         """
 
-        # pylint: disable=R0912
-
         ret = Quality.UNKNOWN
         if not name:
             return ret
 
-        name = os.path.basename(name)
-
-        check_name = lambda l, func: func([re.search(x, name, re.I) for x in l])
-
-        if anime:
-            dvdOptions = check_name([r"dvd", r"dvdrip"], any)
-            blueRayOptions = check_name([r"BD", r"blue?-?ray"], any)
-            sdOptions = check_name([r"360p", r"480p", r"848x480", r"XviD"], any)
-            hdOptions = check_name([r"720p", r"1280x720", r"960x720"], any)
-            fullHD = check_name([r"1080p", r"1920x1080"], any)
-
-            if sdOptions and not blueRayOptions and not dvdOptions:
-                ret = Quality.SDTV
-            elif dvdOptions:
-                ret = Quality.SDDVD
-            elif hdOptions and not blueRayOptions and not fullHD:
-                ret = Quality.HDTV
-            elif fullHD and not blueRayOptions and not hdOptions:
-                ret = Quality.FULLHDTV
-            elif hdOptions and not blueRayOptions and not fullHD:
-                ret = Quality.HDWEBDL
-            elif blueRayOptions and hdOptions and not fullHD:
-                ret = Quality.HDBLURAY
-            elif blueRayOptions and fullHD and not hdOptions:
-                ret = Quality.FULLHDBLURAY
+        tokens = _QualityTokens(os.path.basename(name))
 
-            return ret
-
-        if (check_name([r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip", r"xvid|divx|[xh].?26[45]"],
-                       all)
-            and not check_name([r"(720|1080)[pi]"], all)
-            and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
-            ret = Quality.SDTV
-        elif (check_name([r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray", r"xvid|divx|[xh].?26[45]"], all)
-              and not check_name([r"(720|1080)[pi]"], all)
-              and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
-            ret = Quality.SDDVD
-        elif (check_name([r"720p", r"hd.?tv", r"[xh].?26[45]"], all)
-              or check_name([r"hr.ws.pdtv.[xh].?26[45]"], any) and not check_name([r"1080[pi]"], all)):
-            ret = Quality.HDTV
-        elif (check_name([r"720p|1080i", r"hd.?tv", r"mpeg-?2"], all)
-              or check_name([r"1080[pi].hdtv", r"h.?26[45]"], all)):
-            ret = Quality.RAWHDTV
-        elif check_name([r"1080p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Quality.FULLHDTV
-        elif (check_name([r"720p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"720p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.HDWEBDL
-        elif (check_name([r"1080p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"1080p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.FULLHDWEBDL
-        elif check_name([r"720p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.HDBLURAY
-        elif check_name([r"1080p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.FULLHDBLURAY
-        elif check_name([r"2160p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_4K_TV
-        elif check_name([r"4320p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_8K_TV
-        elif (check_name([r"2160p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"2160p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.UHD_4K_WEBDL
-        elif (check_name([r"4320p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"4320p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.UHD_8K_WEBDL
-        elif check_name([r"2160p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_4K_BLURAY
-        elif check_name([r"4320p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_8K_BLURAY
+        for quality, rules in (Quality._animeQualityRules if anime else Quality._sceneQualityRules):
+            for required, excluded in rules:
+                if all(tokens[x] for x in required) and not any(tokens[x] for x in excluded):
+                    return quality
 
         return ret
 
@@ -350,14 +362,19 @@ class Quality(object):
     @staticmethod
     def splitCompositeStatus(status):
         """Returns a tuple containing (status, quality)"""
-        if status == UNKNOWN:
-            return (UNKNOWN, Quality.UNKNOWN)
+        if status not in Quality._splitCompositeStatusCache:
+            if status == UNKNOWN:
+                result = (UNKNOWN, Quality.UNKNOWN)
+            else:
+                result = (status, Quality.NONE)
+                for q in sorted(Quality.qualityStrings.keys(), reverse=True):
+                    if status > q * 100:
+                        result = (status - q * 100, q)
+                        break
 
-        for q in sorted(Quality.qualityStrings.keys(), reverse=True):
-            if status > q * 100:
-                return (status - q * 100, q)
+            Quality._splitCompositeStatusCache[status] = result
 
-        return (status, Quality.NONE)
+        return Quality._splitCompositeStatusCache[status]
 
     @staticmethod
     def qualityFromFileMeta(filename):
@@ -174,6 +174,7 @@ class srDatabase(object):
                     for x in exists:
                         os.unlink(x)
 
+                    sickrage.srCore.srLogger.info('Building {} database index {}'.format(self.name, index_name))
                     self.db.add_index(self._indexes[index_name](self.db.path, index_name))
                     self.db.reindex_index(index_name)
                 else:
@@ -183,6 +184,7 @@ class srDatabase(object):
 
                     # Only edit index if versions are different
                     if previous_version < current_version:
+                        sickrage.srCore.srLogger.info('Rebuilding {} database index {}'.format(self.name, index_name))
                         self.db.destroy_index(self.db.indexes_names[index_name])
                         self.db.add_index(self._indexes[index_name](self.db.path, index_name))
                         self.db.reindex_index(index_name)
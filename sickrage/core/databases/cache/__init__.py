@@ -23,7 +23,8 @@ import os
 import sickrage
 from sickrage.core.databases import srDatabase
 from sickrage.core.databases.cache.index import CacheLastUpdateIndex, CacheLastSearchIndex, CacheSceneExceptionsIndex, \
-    CacheSceneNamesIndex, CacheNetworkTimezonesIndex, CacheSceneExceptionsRefreshIndex, CacheProvidersIndex
+    CacheSceneNamesIndex, CacheNetworkTimezonesIndex, CacheSceneExceptionsRefreshIndex, CacheProvidersIndex, \
+    CacheFeedStateIndex
 
 
 class CacheDB(srDatabase):
@@ -35,6 +36,7 @@ class CacheDB(srDatabase):
         'network_timezones': CacheNetworkTimezonesIndex,
         'scene_exceptions_refresh': CacheSceneExceptionsRefreshIndex,
         'providers': CacheProvidersIndex,
+        'feed_state': CacheFeedStateIndex,
     }
 
     _migrate_list = {
@@ -126,3 +126,18 @@ class CacheProvidersIndex(HashIndex):
 
     def make_key(self, key):
         return md5(key.encode('utf-8')).hexdigest()
+
+
+class CacheFeedStateIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(CacheFeedStateIndex, self).__init__(*args, **kwargs)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'feed_state' and data.get('provider'):
+            return self.make_key(data.get('provider')), None
+
+    def make_key(self, key):
+        return md5(key.encode('utf-8')).hexdigest()
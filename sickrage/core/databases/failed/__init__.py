@@ -22,13 +22,19 @@ import os
 
 import sickrage
 from sickrage.core.databases import srDatabase
-from sickrage.core.databases.failed.index import FailedIndex, FailedHistoryIndex
+from sickrage.core.databases.failed.index import FailedIndex, FailedHistoryIndex, FailedReleaseSizeProviderIndex, \
+    FailedHistoryReleaseIndex, FailedHistoryReleaseSizeProviderIndex, FailedHistoryEpisodeIndex, FailedHistoryDateIndex
 
 
 class FailedDB(srDatabase):
     _indexes = {
         'failed': FailedIndex,
+        'failed_release_size_provider': FailedReleaseSizeProviderIndex,
         'history': FailedHistoryIndex,
+        'history_release': FailedHistoryReleaseIndex,
+        'history_release_size_provider': FailedHistoryReleaseSizeProviderIndex,
+        'history_episode': FailedHistoryEpisodeIndex,
+        'history_date': FailedHistoryDateIndex,
     }
 
     _migrate_list = {
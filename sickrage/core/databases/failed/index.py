@@ -21,10 +21,11 @@ from __future__ import unicode_literals
 from hashlib import md5
 
 from CodernityDB.hash_index import HashIndex
+from CodernityDB.tree_index import TreeBasedIndex
 
 
 class FailedIndex(HashIndex):
-    _version = 2
+    _version = 3
 
     def __init__(self, *args, **kwargs):
         kwargs['key_format'] = '32s'
@@ -32,11 +33,27 @@ class FailedIndex(HashIndex):
 
     def make_key_value(self, data):
         if data.get('_t') == 'failed' and data.get('release'):
-            return md5(data.get('release')).hexdigest(), None
+            return self.make_key(data.get('release')), None
 
     def make_key(self, key):
         return md5(key.encode('utf-8')).hexdigest()
 
+
+class FailedReleaseSizeProviderIndex(HashIndex):
+    _version = 2
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(FailedReleaseSizeProviderIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return md5(u'{}-{}-{}'.format(*key).encode('utf-8')).hexdigest()
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'failed' and data.get('release'):
+            return self.make_key((data.get('release'), data.get('size'), data.get('provider'))), None
+
+
 class FailedHistoryIndex(HashIndex):
     _version = 1
 
@@ -50,3 +67,63 @@ class FailedHistoryIndex(HashIndex):
     def make_key_value(self, data):
         if data.get('_t') == 'history' and data.get('showid'):
             return data.get('showid'), None
+
+
+class FailedHistoryReleaseIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(FailedHistoryReleaseIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return md5(key.encode('utf-8')).hexdigest()
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'history' and data.get('release'):
+            return self.make_key(data.get('release')), None
+
+
+class FailedHistoryReleaseSizeProviderIndex(HashIndex):
+    _version = 2
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(FailedHistoryReleaseSizeProviderIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return md5(u'{}-{}-{}'.format(*key).encode('utf-8')).hexdigest()
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'history' and data.get('release'):
+            return self.make_key((data.get('release'), data.get('size'), data.get('provider'))), None
+
+
+class FailedHistoryEpisodeIndex(HashIndex):
+    _version = 2
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(FailedHistoryEpisodeIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return md5(u'{}-{}-{}'.format(*key).encode('utf-8')).hexdigest()
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'history' and data.get('showid'):
+            return self.make_key((data.get('showid'), data.get('season'), data.get('episode'))), None
+
+
+class FailedHistoryDateIndex(TreeBasedIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = 'Q'
+        super(FailedHistoryDateIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return int(key)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'history' and str(data.get('date')).isdigit():
+            return self.make_key(data.get('date')), None
@@ -24,13 +24,22 @@ import sickrage
 from sickrage.core.databases import srDatabase
 from sickrage.core.databases.main.index import MainTVShowsIndex, MainTVEpisodesIndex, MainIMDBInfoIndex, \
     MainXEMRefreshIndex, MainSceneNumberingIndex, MainIndexerMappingIndex, MainHistoryIndex, MainInfoIndex, \
-    MainBlacklistIndex, MainWhitelistIndex
+    MainBlacklistIndex, MainWhitelistIndex, MainTVEpisodesSeasonEpisodeIndex, MainTVEpisodesAbsoluteNumberIndex, \
+    MainTVEpisodesAirdateIndex, MainTVEpisodesAirdateOrderIndex, MainTVEpisodesReleaseNameIndex, MainTVStatsIndex, \
+    MainHistoryResourceIndex, MainHistoryReleaseIndex, MainHistoryDateIndex, MainTVEpisodesSubtitlesIndex
 
 
 class MainDB(srDatabase):
     _indexes = {
         'tv_shows': MainTVShowsIndex,
         'tv_episodes': MainTVEpisodesIndex,
+        'tv_episodes_season_episode': MainTVEpisodesSeasonEpisodeIndex,
+        'tv_episodes_absolute_number': MainTVEpisodesAbsoluteNumberIndex,
+        'tv_episodes_airdate': MainTVEpisodesAirdateIndex,
+        'tv_episodes_airdate_order': MainTVEpisodesAirdateOrderIndex,
+        'tv_episodes_release_name': MainTVEpisodesReleaseNameIndex,
+        'tv_episodes_subtitles': MainTVEpisodesSubtitlesIndex,
+        'tv_stats': MainTVStatsIndex,
         'imdb_info': MainIMDBInfoIndex,
         'xem_refresh': MainXEMRefreshIndex,
         'scene_numbering': MainSceneNumberingIndex,
@@ -39,6 +48,9 @@ class MainDB(srDatabase):
         'blacklist': MainBlacklistIndex,
         'whitelist': MainWhitelistIndex,
         'history': MainHistoryIndex,
+        'history_resource': MainHistoryResourceIndex,
+        'history_release': MainHistoryReleaseIndex,
+        'history_date': MainHistoryDateIndex,
     }
 
     _migrate_list = {
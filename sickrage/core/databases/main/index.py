@@ -18,7 +18,10 @@
 
 from __future__ import unicode_literals
 
-from CodernityDB.hash_index import HashIndex
+from hashlib import md5
+
+from CodernityDB.hash_index import HashIndex, MultiHashIndex
+from CodernityDB.tree_index import TreeBasedIndex
 
 
 class MainTVShowsIndex(HashIndex):
@@ -51,6 +54,113 @@ class MainTVEpisodesIndex(HashIndex):
             return data.get('showid'), None
 
 
+class MainTVStatsIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = 'I'
+        super(MainTVStatsIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return key
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_stats' and data.get('showid'):
+            return data.get('showid'), None
+
+
+class MainTVEpisodesSeasonEpisodeIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainTVEpisodesSeasonEpisodeIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return md5('{}-{}-{}'.format(*key).encode('utf-8')).hexdigest()
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid') \
+                and data.get('season') is not None and data.get('episode') is not None:
+            return self.make_key((data.get('showid'), data.get('season'), data.get('episode'))), None
+
+
+class MainTVEpisodesAbsoluteNumberIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainTVEpisodesAbsoluteNumberIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return md5('{}-{}'.format(*key).encode('utf-8')).hexdigest()
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid') and data.get('absolute_number'):
+            return self.make_key((data.get('showid'), data.get('absolute_number'))), None
+
+
+class MainTVEpisodesAirdateIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainTVEpisodesAirdateIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return md5('{}-{}'.format(*key).encode('utf-8')).hexdigest()
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('showid') and data.get('airdate'):
+            return self.make_key((data.get('showid'), data.get('airdate'))), None
+
+
+class MainTVEpisodesAirdateOrderIndex(TreeBasedIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = 'I'
+        super(MainTVEpisodesAirdateOrderIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return key
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('airdate') > 0:
+            return int(data.get('airdate')), None
+
+
+class MainTVEpisodesSubtitlesIndex(TreeBasedIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = 'I'
+        super(MainTVEpisodesSubtitlesIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return key
+
+    def make_key_value(self, data):
+        # episodes still wanting subtitles, keyed by the time they may be searched again
+        if data.get('_t') == 'tv_episodes' and data.get('subtitles_nextsearch') > 0:
+            return int(data.get('subtitles_nextsearch')), None
+
+
+class MainTVEpisodesReleaseNameIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainTVEpisodesReleaseNameIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return md5(key.encode('utf-8')).hexdigest()
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'tv_episodes' and data.get('release_name'):
+            return self.make_key(data.get('release_name')), None
+
+
 class MainIMDBInfoIndex(HashIndex):
     _version = 1
 
@@ -169,3 +279,82 @@ class MainWhitelistIndex(HashIndex):
     def make_key_value(self, data):
         if data.get('_t') == 'whitelist' and data.get('show_id'):
             return data.get('show_id'), None
+
+
+class MainHistoryResourceIndex(HashIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainHistoryResourceIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        # resources are indexed by file name, snatches store a release name and downloads a full path
+        return md5(key.replace('\\', '/').rpartition('/')[2].encode('utf-8')).hexdigest()
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'history' and isinstance(data.get('resource'), basestring) and data.get('resource'):
+            return self.make_key(data.get('resource')), None
+
+
+class MainHistoryReleaseIndex(MultiHashIndex):
+    _version = 2
+
+    custom_header = 'from CodernityDB.hash_index import MultiHashIndex'
+
+    # index source is stored by the database, so extensions are listed here instead of imported
+    extensions = ('avi', 'mkv', 'mpg', 'mpeg', 'wmv', 'ogm', 'mp4', 'iso', 'img', 'divx', 'm2ts', 'm4v', 'ts', 'flv',
+                  'f4v', 'mov', 'rmvb', 'vob', 'dvr-ms', 'wtv', 'ogv', '3gp', 'webm', 'tp', 'nzb', 'torrent')
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = '32s'
+        super(MainHistoryReleaseIndex, self).__init__(*args, **kwargs)
+
+    def stem(self, key):
+        # release name stem: file name only, without extension, case and separator insensitive
+        stem = key.replace('\\', '/').rpartition('/')[2].strip().lower()
+        if stem.rpartition('.')[2] in self.extensions:
+            stem = stem.rpartition('.')[0]
+        return stem.replace(' ', '.').replace('_', '.')
+
+    def strip_tags(self, stem):
+        # drops site prefixes and bracketed tags added in front of or after the release name, like
+        # www.site.com.-.name, [site].name or name-grp[rartv]
+        brackets = {'[': ']', '{': '}'}
+        opening = dict((v, k) for k, v in brackets.items())
+
+        while stem:
+            if stem.startswith('www.') and '.-.' in stem:
+                stem = stem.partition('.-.')[2]
+            elif stem[0] in brackets and brackets[stem[0]] in stem:
+                stem = stem.partition(brackets[stem[0]])[2]
+            elif stem[-1] in brackets.values() and opening[stem[-1]] in stem:
+                stem = stem.rpartition(opening[stem[-1]])[0]
+            else:
+                break
+            stem = stem.strip('.-')
+
+        return stem
+
+    def make_key(self, key):
+        return md5(self.stem(key).encode('utf-8')).hexdigest()
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'history' and isinstance(data.get('resource'), basestring) and data.get('resource'):
+            stem = self.stem(data.get('resource'))
+            return set(md5(x.encode('utf-8')).hexdigest() for x in (stem, self.strip_tags(stem)) if x), None
+
+
+class MainHistoryDateIndex(TreeBasedIndex):
+    _version = 1
+
+    def __init__(self, *args, **kwargs):
+        kwargs['key_format'] = 'Q'
+        super(MainHistoryDateIndex, self).__init__(*args, **kwargs)
+
+    def make_key(self, key):
+        return int(key)
+
+    def make_key_value(self, data):
+        if data.get('_t') == 'history' and str(data.get('date')).isdigit():
+            return self.make_key(data.get('date')), None
@@ -417,7 +417,12 @@ def findCertainShow(showList, indexerid):
         return None
 
     indexer_ids = [indexerid] if not isinstance(indexerid, list) else indexerid
-    results = [show for show in showList if show.indexerid in indexer_ids]
+
+    # the core show list keeps an index of its shows
+    if hasattr(showList, 'by_indexerid'):
+        results = showList.find(indexer_ids)
+    else:
+        results = [show for show in showList if show.indexerid in indexer_ids]
 
     if not results:
         return None
@@ -1672,8 +1677,10 @@ def clean_url(url):
 
 
 def overall_stats():
+    from sickrage.core.tv.show.stats import ShowStats
+
     shows = sickrage.srCore.SHOWLIST
-    today = str(datetime.date.today().toordinal())
+    today = datetime.date.today().toordinal()
 
     downloaded_status = Quality.DOWNLOADED + Quality.ARCHIVED
     snatched_status = Quality.SNATCHED + Quality.SNATCHED_PROPER
@@ -1692,20 +1699,14 @@ def overall_stats():
         'total_size': 0
     }
 
-    for result in [x['doc'] for x in sickrage.srCore.mainDB.db.all('tv_episodes', with_doc=True)]:
-        if not (result['season'] > 0 and result['episode'] > 0 and result['airdate'] > 1):
-            continue
-
-        if result['status'] in downloaded_status:
-            stats['episodes']['downloaded'] += 1
-            stats['episodes']['total'] += 1
-        elif result['status'] in snatched_status:
-            stats['episodes']['snatched'] += 1
-            stats['episodes']['total'] += 1
-        elif result['airdate'] <= today and result['status'] in total_status:
-            stats['episodes']['total'] += 1
+    for show_stats in ShowStats.all().values():
+        downloaded = ShowStats.count(show_stats, downloaded_status)
+        snatched = ShowStats.count(show_stats, snatched_status)
 
-        stats['total_size'] += result['file_size']
+        stats['episodes']['downloaded'] += downloaded
+        stats['episodes']['snatched'] += snatched
+        stats['episodes']['total'] += downloaded + snatched + ShowStats.count(show_stats, total_status, today)
+        stats['total_size'] += show_stats['file_size']
 
     return stats
 
@@ -21,6 +21,7 @@ from __future__ import unicode_literals
 import fnmatch
 import os
 import re
+import threading
 from datetime import date
 from functools import partial
 
@@ -44,6 +45,70 @@ if hasattr('General', 'ignored_subs_list') and sickrage.srCore.srConfig.IGNORED_
     resultFilters.append("(" + sickrage.srCore.srConfig.IGNORED_SUBS_LIST.replace(",", "|") + ")sub(bed|ed|s)?")
 
 
+class WordMatcher(object):
+    """
+    Matches release names against a list of words with a single precompiled alternation regex
+    """
+
+    def __init__(self, words):
+        if isinstance(words, basestring):
+            words = words.split(',')
+
+        self.words = [word.strip() for word in words]
+        self.regex = re.compile(r'(^|[\W_])(%s)($|[\W_])' % '|'.join(map(re.escape, self.words)), re.I)
+        self.regexes = {}
+
+    def search(self, name):
+        """
+        Returns the first word of the list found in name or False if none of the words are found
+        """
+
+        if not self.words or not self.regex.search(name):
+            return False
+
+        # report the first matching word in list order
+        for word in self.words:
+            if word not in self.regexes:
+                self.regexes[word] = re.compile(r'(^|[\W_])%s($|[\W_])' % re.escape(word), re.I)
+            if self.regexes[word].search(name):
+                return word
+
+        return False
+
+
+word_matchers = {}
+word_matchers_lock = threading.Lock()
+
+
+def get_word_matcher(words):
+    """
+    Returns a cached WordMatcher for the words, keyed on the word list string
+
+    :param words: string of words separated by a ',' or list of words
+    :rtype: WordMatcher
+    """
+    key = words if isinstance(words, basestring) else tuple(words)
+
+    matcher = word_matchers.get(key)
+    if matcher is None:
+        matcher = WordMatcher(words)
+        with word_matchers_lock:
+            # stale word lists are left behind when settings change, keep the cache from growing unbounded
+            if len(word_matchers) > 100:
+                word_matchers.clear()
+            word_matchers[key] = matcher
+
+    return matcher
+
+
+def clear_word_matchers():
+    """
+    Drops all cached word matchers, called when ignore/require word settings change
+    """
+    with word_matchers_lock:
+        word_matchers.clear()
+
+
 def containsAtLeastOneWord(name, words):
     """
     Filters out results based on filter_words
@@ -58,13 +123,7 @@ def containsAtLeastOneWord(name, words):
     :return:
     :rtype: unicode
     """
-    if isinstance(words, basestring):
-        words = words.split(',')
-    items = [(re.compile('(^|[\W_])%s($|[\W_])' % re.escape(word.strip()), re.I), word.strip()) for word in words]
-    for regexp, word in items:
-        if regexp.search(name):
-            return word
-    return False
+    return get_word_matcher(words).search(name)
 
 
 def filterBadReleases(name, parse=True):
@@ -93,9 +152,9 @@ def filterBadReleases(name, parse=True):
     #    return False
 
     # if any of the bad strings are in the name then say no
-    ignore_words = list(resultFilters)
+    ignore_words = resultFilters
     if sickrage.srCore.srConfig.IGNORE_WORDS:
-        ignore_words.extend(sickrage.srCore.srConfig.IGNORE_WORDS.split(','))
+        ignore_words = resultFilters + sickrage.srCore.srConfig.IGNORE_WORDS.split(',')
     word = containsAtLeastOneWord(name, ignore_words)
     if word:
         sickrage.srCore.srLogger.debug("Invalid scene release: " + name + " contains " + word + ", ignoring it")
@@ -44,6 +44,8 @@ class NameParser(object):
     NORMAL_REGEX = 1
     ANIME_REGEX = 2
 
+    _compiled_regexes = {}
+
     def __init__(self, file_name=True, showObj=None, tryIndexers=False, naming_pattern=False, validate_show=True):
         self.file_name = file_name
         self.showObj = showObj
@@ -52,11 +54,13 @@ class NameParser(object):
         self.validate_show = validate_show
 
         if self.showObj and not self.showObj.is_anime:
-            self._compile_regexes(self.NORMAL_REGEX)
+            self.regexMode = self.NORMAL_REGEX
         elif self.showObj and self.showObj.is_anime:
-            self._compile_regexes(self.ANIME_REGEX)
+            self.regexMode = self.ANIME_REGEX
         else:
-            self._compile_regexes(self.ALL_REGEX)
+            self.regexMode = self.ALL_REGEX
+
+        self.compiled_regexes = self._compile_regexes(self.regexMode)
 
     def get_show(self, name):
         show = None
@@ -118,18 +122,26 @@ class NameParser(object):
         series_name = re.sub(r"^\[.*\]", "", series_name)
         return series_name.strip()
 
-    def _compile_regexes(self, regexMode):
-        if regexMode == self.ANIME_REGEX:
+    @classmethod
+    def _compile_regexes(cls, regexMode):
+        """
+        Returns the compiled regexes for a regex mode, they are compiled once and shared by all parsers
+        """
+
+        if regexMode in cls._compiled_regexes:
+            return cls._compiled_regexes[regexMode]
+
+        if regexMode == cls.ANIME_REGEX:
             dbg_str = "ANIME"
             uncompiled_regex = [regexes.anime_regexes]
-        elif regexMode == self.NORMAL_REGEX:
+        elif regexMode == cls.NORMAL_REGEX:
             dbg_str = "NORMAL"
             uncompiled_regex = [regexes.normal_regexes]
         else:
             dbg_str = "ALL"
             uncompiled_regex = [regexes.normal_regexes, regexes.anime_regexes]
 
-        self.compiled_regexes = []
+        compiled_regexes = []
         for regexItem in uncompiled_regex:
             for cur_pattern_num, (cur_pattern_name, cur_pattern) in enumerate(regexItem):
                 try:
@@ -139,7 +151,9 @@ class NameParser(object):
                         "WARNING: Invalid episode_pattern using %s regexs, %s. %s" % (
                             dbg_str, errormsg, cur_pattern))
                 else:
-                    self.compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex))
+                    compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex))
+
+        return cls._compiled_regexes.setdefault(regexMode, tuple(compiled_regexes))
 
     def _parse_string(self, name, skip_scene_detection=False):
         if not name:
@@ -268,8 +282,9 @@ class NameParser(object):
                 airdate = bestResult.air_date.toordinal()
 
                 dbData = [x['doc'] for x in
-                          sickrage.srCore.mainDB.db.get_many('tv_episodes', bestResult.show.indexerid, with_doc=True)
-                          if x['doc']['indexer'] == bestResult.show.indexer and x['doc']['airdate'] == airdate]
+                          sickrage.srCore.mainDB.db.get_many('tv_episodes_airdate',
+                                                             (bestResult.show.indexerid, airdate), with_doc=True)
+                          if x['doc']['indexer'] == bestResult.show.indexer]
 
                 season_number = None
                 episode_numbers = []
@@ -443,10 +458,15 @@ class NameParser(object):
         if self.naming_pattern:
             cache_result = False
 
-        cached = name_parser_cache.get(name)
+        cache_key = (name, self.regexMode, self.showObj.indexerid if self.showObj else None, bool(self.file_name),
+                     self.validate_show, skip_scene_detection)
+
+        cached = name_parser_cache.get(cache_key)
         if cached:
             return cached
 
+        start_time = time.time()
+
         # break it into parts if there are any (dirname, file name, extension)
         dir_name, file_name = os.path.split(name)
 
@@ -506,8 +526,10 @@ class NameParser(object):
         if final_result.season_number is None and not final_result.episode_numbers and final_result.air_date is None and not final_result.ab_episode_numbers and not final_result.series_name:
             raise InvalidNameException("Unable to parse {}".format(name))
 
+        name_parser_cache.parsed(time.time() - start_time)
+
         if cache_result:
-            name_parser_cache.add(name, final_result)
+            name_parser_cache.add(cache_key, final_result)
 
         sickrage.srCore.srLogger.debug("Parsed {} into {}".format(name, final_result))
         return final_result
@@ -633,23 +655,65 @@ class ParseResult(object):
 
 
 class NameParserCache(object):
-    def __init__(self):
+    def __init__(self, max_size=1000):
         self.lock = Lock()
         self.data = OrderedDict()
-        self.max_size = 200
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+        self.parses = 0
+        self.parse_time = 0.0
 
     def get(self, key):
         with self.lock:
-            value = self.data.get(key)
-            if value:
-                sickrage.srCore.srLogger.debug("Using cached parse result for: {}".format(key))
-            return value
+            value = self.data.pop(key, None)
+            if not value:
+                self.misses += 1
+                return
+
+            # re-insert to mark as most recently used
+            self.data[key] = value
+            self.hits += 1
+
+        sickrage.srCore.srLogger.debug("Using cached parse result for: {}".format(key[0]))
+        return value
 
     def add(self, key, value):
         with self.lock:
-            self.data.update({key: value})
+            self.data.pop(key, None)
+            self.data[key] = value
+            while len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+
+    def parsed(self, parse_time):
+        with self.lock:
+            self.parses += 1
+            self.parse_time += parse_time
+
+    def resize(self, max_size):
+        with self.lock:
+            self.max_size = max(int(max_size), 1)
             while len(self.data) > self.max_size:
-                self.data.pop(list(self.data.keys())[0], None)
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+    @property
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.data),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(float(self.hits) / lookups, 4) if lookups else 0,
+                'parses': self.parses,
+                'parses_per_second': round(self.parses / self.parse_time, 2) if self.parse_time else 0
+            }
 
 
 name_parser_cache = NameParserCache()
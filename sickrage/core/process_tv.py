@@ -21,6 +21,9 @@ from __future__ import unicode_literals
 import os
 import shutil
 import stat
+import threading
+import time
+from collections import OrderedDict
 
 import UnRAR2
 from UnRAR2.rar_exceptions import ArchiveHeaderBroken, FileOpenError, \
@@ -36,6 +39,11 @@ from sickrage.core.nameparser import InvalidNameException, InvalidShowException,
     NameParser
 from sickrage.core.processors import failed_processor, post_processor
 
+try:
+    from futures import ThreadPoolExecutor
+except ImportError:
+    from concurrent.futures import ThreadPoolExecutor
+
 
 class ProcessResult(object):
     def __init__(self):
@@ -43,6 +51,29 @@ class ProcessResult(object):
         self.output = ''
         self.missedfiles = []
         self.aggresult = True
+        self.timings = {}
+        self.lock = threading.Lock()
+
+    def add_timing(self, stage, seconds):
+        with self.lock:
+            self.timings[stage] = self.timings.get(stage, 0) + seconds
+
+    def merge(self, other):
+        """
+        Append the results of a file processed on its own, in the order files were queued
+
+        :param other: ProcessResult of the processed file(s)
+        """
+        self.result = other.result
+        self.output += other.output
+        self.missedfiles += other.missedfiles
+        self.aggresult = self.aggresult and other.aggresult
+        for stage, seconds in other.timings.items():
+            self.add_timing(stage, seconds)
+
+    @property
+    def timings_summary(self):
+        return ", ".join("{}: {:.2f}s".format(stage, seconds) for stage, seconds in sorted(self.timings.items()))
 
 
 def delete_folder(folder, check_empty=True):
@@ -188,7 +219,9 @@ def processDir(dirName, nzbName=None, process_method=None, force=False, is_prior
         result.output += logHelper("PostProcessing Dirs: [%s]" % ", ".join(dirs), sickrage.srCore.srLogger.DEBUG)
 
         rarFiles = [x for x in files if isRarFile(x)]
+        start = time.time()
         rarContent = unRAR(path, rarFiles, force, result)
+        result.add_timing('unrar', time.time() - start)
         files += rarContent
         videoFiles = [x for x in files if isMediaFile(x)]
         videoInRar = [x for x in rarContent if isMediaFile(x)]
@@ -214,16 +247,15 @@ def processDir(dirName, nzbName=None, process_method=None, force=False, is_prior
         if process_method in ('hardlink', 'symlink') and videoInRar:
             process_media(path, videoInRar, nzbName, 'move', force, is_priority, result)
             delete_files(path, rarContent, result)
-            for video in set(videoFiles) - set(videoInRar):
-                process_media(path, [video], nzbName, process_method, force, is_priority, result)
+            process_media(path, set(videoFiles) - set(videoInRar), nzbName, process_method, force, is_priority,
+                          result)
         elif sickrage.srCore.srConfig.DELRARCONTENTS and videoInRar:
             process_media(path, videoInRar, nzbName, process_method, force, is_priority, result)
             delete_files(path, rarContent, result, True)
-            for video in set(videoFiles) - set(videoInRar):
-                process_media(path, [video], nzbName, process_method, force, is_priority, result)
+            process_media(path, set(videoFiles) - set(videoInRar), nzbName, process_method, force, is_priority,
+                          result)
         else:
-            for video in videoFiles:
-                process_media(path, [video], nzbName, process_method, force, is_priority, result)
+            process_media(path, videoFiles, nzbName, process_method, force, is_priority, result)
 
     else:
         result.output += logHelper("Found temporary sync files, skipping post processing for: %s" % path)
@@ -250,7 +282,9 @@ def processDir(dirName, nzbName=None, process_method=None, force=False, is_prior
 
             if not postpone:
                 rarFiles = [x for x in fileList if isRarFile(x)]
+                start = time.time()
                 rarContent = unRAR(processPath, rarFiles, force, result)
+                result.add_timing('unrar', time.time() - start)
                 fileList = set(fileList + rarContent)
                 videoFiles = [x for x in fileList if isMediaFile(x)]
                 videoInRar = [x for x in rarContent if isMediaFile(x)]
@@ -293,6 +327,10 @@ def processDir(dirName, nzbName=None, process_method=None, force=False, is_prior
                 result.output += logHelper("Sync Files: [%s] in path %s" % (", ".join(SyncFiles), processPath))
                 result.missedfiles.append("%s : Syncfiles found" % processPath)
 
+    if result.timings:
+        result.output += logHelper("Processing stage timings: " + result.timings_summary,
+                                   sickrage.srCore.srLogger.DEBUG)
+
     if result.aggresult:
         result.output += logHelper("Processing completed")
         if result.missedfiles:
@@ -501,12 +539,13 @@ def already_postprocessed(dirName, videofile, force, result):
         return False
 
     # Avoid processing the same dir again if we use a process method <> move
-    if [x for x in sickrage.srCore.mainDB.db.all('tv_episodes', with_doc=True)
+    if [x for x in sickrage.srCore.mainDB.db.get_many('tv_episodes_release_name', dirName, with_doc=True)
         if x['doc']['release_name'] == dirName]:
         return True
     else:
-        if [x for x in sickrage.srCore.mainDB.db.all('tv_episodes', with_doc=True)
-            if x['doc']['release_name'] == [videofile.rpartition('.')[0]]]: return True
+        if [x for x in sickrage.srCore.mainDB.db.get_many('tv_episodes_release_name', videofile.rpartition('.')[0],
+                                                          with_doc=True)
+            if x['doc']['release_name'] == videofile.rpartition('.')[0]]: return True
 
         # Needed if we have downloaded the same episode @ different quality
         # But we need to make sure we check the history of the episode we're going to PP, and not others
@@ -516,7 +555,7 @@ def already_postprocessed(dirName, videofile, force, result):
         except:
             parse_result = False
 
-        for h in [h['doc'] for h in sickrage.srCore.mainDB.db.all('history', with_doc=True)
+        for h in [h['doc'] for h in sickrage.srCore.mainDB.db.get_many('history_resource', videofile, with_doc=True)
                   if h['doc']['resource'].endswith(videofile)]:
             for e in [e['doc'] for e in sickrage.srCore.mainDB.db.get_many('tv_episodes', h['showid'], with_doc=True)
                       if h['season'] == e['doc']['season']
@@ -538,7 +577,7 @@ def already_postprocessed(dirName, videofile, force, result):
 
 def process_media(processPath, videoFiles, nzbName, process_method, force, is_priority, result):
     """
-    Postprocess mediafiles
+    Postprocess mediafiles, files for different episodes are processed concurrently
 
     :param processPath: Path to postprocess in
     :param videoFiles: Filenames to look for and postprocess
@@ -549,11 +588,80 @@ def process_media(processPath, videoFiles, nzbName, process_method, force, is_pr
     :param result: Previous results
     """
 
-    processor = None
+    videoFiles = list(videoFiles)
+    workers = min(max(1, sickrage.srCore.srConfig.POSTPROCESS_THREADS), len(videoFiles))
+    groups = group_media(videoFiles) if workers > 1 else [videoFiles]
+    workers = min(workers, len(groups))
+    if workers < 2:
+        for files in groups:
+            process_media_files(processPath, files, nzbName, process_method, force, is_priority, result)
+        return
+
+    start = time.time()
+    executor = ThreadPoolExecutor(workers)
+
+    try:
+        futures = []
+        for files in groups:
+            futures += [executor.submit(process_media_files, processPath, files, nzbName, process_method, force,
+                                        is_priority, ProcessResult())]
+
+        for future in futures:
+            result.merge(future.result())
+    finally:
+        executor.shutdown(wait=True)
+
+    result.output += logHelper("Processed {} files on {} workers in {:.2f}s".format(
+        sum(len(files) for files in groups), workers, time.time() - start), sickrage.srCore.srLogger.DEBUG)
+
+
+def group_media(videoFiles):
+    """
+    Groups media files by the episodes their names parse to, files of a group are processed one after another
+    and in the order they were found. Files that can't be parsed get a group of their own.
+
+    :param videoFiles: Filenames to group
+    :return: list of lists of filenames
+    """
+
+    groups = OrderedDict()
     for cur_video_file in videoFiles:
+        key = cur_video_file
+        try:
+            parse_result = NameParser(True).parse(cur_video_file)
+            key = (parse_result.show.indexerid, parse_result.season_number, tuple(parse_result.episode_numbers),
+                   tuple(parse_result.ab_episode_numbers), parse_result.air_date)
+        except (InvalidNameException, InvalidShowException):
+            pass
+
+        groups.setdefault(key, []).append(cur_video_file)
+
+    return groups.values()
+
+
+def process_media_files(processPath, videoFiles, nzbName, process_method, force, is_priority, result):
+    """
+    Postprocess mediafiles one after another
+
+    :param processPath: Path to postprocess in
+    :param videoFiles: Filenames to look for and postprocess
+    :param nzbName: Name of NZB file related
+    :param process_method: auto/manual
+    :param force: Postprocess currently postprocessing file
+    :param is_priority: Boolean, is this a priority download
+    :param result: Previous results
+    :return: result
+    """
+
+    for cur_video_file in videoFiles:
+        processor = None
         cur_video_file_path = os.path.join(processPath, cur_video_file)
 
-        if already_postprocessed(processPath, cur_video_file, force, result):
+        start = time.time()
+        postprocessed = already_postprocessed(processPath, cur_video_file, force, result)
+        result.add_timing('check', time.time() - start)
+
+        if postprocessed:
             result.output += logHelper("Already Processed " + cur_video_file_path + " : Skipping",
                                        sickrage.srCore.srLogger.DEBUG)
             continue
@@ -568,6 +676,8 @@ def process_media(processPath, videoFiles, nzbName, process_method, force, is_pr
 
         if processor:
             result.output += processor.log
+            for stage, seconds in processor.timings.items():
+                result.add_timing(stage, seconds)
 
         if result.result:
             result.output += logHelper("Processing succeeded for " + cur_video_file_path)
@@ -577,6 +687,8 @@ def process_media(processPath, videoFiles, nzbName, process_method, force, is_pr
             result.missedfiles.append(cur_video_file_path + " : Processing failed: " + process_fail_message)
             result.aggresult = False
 
+    return result
+
 
 def get_path_dir_files(dirName, nzbName, proc_type):
     """
@@ -18,12 +18,16 @@
 
 from __future__ import unicode_literals
 
+import datetime
 import fnmatch
 import glob
 import os
 import re
 import stat
 import subprocess
+import threading
+import time
+from weakref import WeakValueDictionary
 
 from adba import aniDBAbstracter
 
@@ -52,6 +56,10 @@ class PostProcessor(object):
 
     IGNORED_FILESTRINGS = [".AppleDouble", ".DS_Store"]
 
+    # locks per (indexerid, season, episode) so two files for the same episode are never processed at once
+    episode_locks = WeakValueDictionary()
+    episode_locks_lock = threading.Lock()
+
     PROCESS_METHOD_COPY = "copy"
     PROCESS_METHOD_MOVE = "move"
     PROCESS_METHOD_HARDLINK = "hardlink"
@@ -104,6 +112,10 @@ class PostProcessor(object):
 
         self.anidbEpisode = None
 
+        # seconds spent in each processing stage
+        self.timings = {}
+        self._stage_time = time.time()
+
     def _log(self, message, level=None):
         """
         A wrapper for the internal logger which also keeps track of messages and saves them to a string for later.
@@ -114,6 +126,28 @@ class PostProcessor(object):
         sickrage.srCore.srLogger.log(level or sickrage.srCore.srLogger.INFO, message)
         self.log += message + '\n'
 
+    def _mark(self, stage):
+        """
+        Adds the time spent since the previous stage to the timings of the given stage
+
+        :param stage: name of the stage that just finished
+        """
+        now = time.time()
+        self.timings[stage] = self.timings.get(stage, 0) + now - self._stage_time
+        self._stage_time = now
+
+    @staticmethod
+    def _episode_locks(show, season, episodes):
+        """
+        Get the locks guarding the episodes a file is processed into, in a stable order so files processed
+        concurrently can't deadlock on each other
+
+        :return: list of locks
+        """
+        with PostProcessor.episode_locks_lock:
+            return [PostProcessor.episode_locks.setdefault(key, threading.RLock())
+                    for key in sorted(set((show.indexerid, season, episode) for episode in episodes))]
+
     def _checkForExistingFile(self, existing_file):
         """
         Checks if a file exists already and if it does whether it's bigger or smaller than
@@ -492,10 +526,17 @@ class PostProcessor(object):
             names.append(self.file_name)
             if '.' in self.file_name: names.append(self.file_name.rpartition(".")[0])
 
-        # search the database for a possible match and return immediately if we find one
+        # search the database for a possible match and return immediately if we find one, names that are not the
+        # snatched release name with or without its tags are only searched for in the recent history
+        recent_history = None
         for curName in names:
-            dbData = [x['doc'] for x in sickrage.srCore.mainDB.db.all('history', with_doc=True)
-                      if curName in x['doc']['resource']]
+            dbData = [x['doc'] for x in
+                      sickrage.srCore.mainDB.db.get_many('history_release', curName, with_doc=True)]
+
+            if len(dbData) == 0:
+                if recent_history is None:
+                    recent_history = self._recent_history()
+                dbData = [x for x in recent_history if curName in x['resource']]
 
             if len(dbData) == 0:
                 continue
@@ -523,6 +564,16 @@ class PostProcessor(object):
         self.in_history = False
         return to_return
 
+    @staticmethod
+    def _recent_history(days=30):
+        """
+        History entries of the last days, newest first
+        """
+        since = (datetime.datetime.today() - datetime.timedelta(days=days)).strftime(History.date_format)
+        return [x['doc'] for x in reversed(list(
+            sickrage.srCore.mainDB.db.get_many('history_date', start=since, end=None, with_doc=True)))
+                if isinstance(x['doc'].get('resource'), basestring)]
+
     def _finalize(self, parse_result):
         """
         Store parse result if it is complete and final
@@ -688,9 +739,9 @@ class PostProcessor(object):
 
                 # Ignore season 0 when searching for episode(Conflict between special and regular episode, same air date)
                 dbData = [x['doc'] for x in
-                          sickrage.srCore.mainDB.db.get_many('tv_episodes', show.indexerid, with_doc=True)
+                          sickrage.srCore.mainDB.db.get_many('tv_episodes_airdate', (show.indexerid, airdate),
+                                                             with_doc=True)
                           if x['doc']['indexer'] == show.indexer
-                          and x['doc']['airdate'] == airdate
                           and x['doc']['season'] != 0]
 
                 if dbData:
@@ -699,8 +750,9 @@ class PostProcessor(object):
                 else:
                     # Found no result, try with season 0
                     dbData = [x['doc'] for x in
-                              sickrage.srCore.mainDB.db.get_many('tv_episodes', show.indexerid, with_doc=True)
-                              if x['doc']['indexer'] == show.indexer and x['doc']['airdate'] == airdate]
+                              sickrage.srCore.mainDB.db.get_many('tv_episodes_airdate', (show.indexerid, airdate),
+                                                                 with_doc=True)
+                              if x['doc']['indexer'] == show.indexer]
 
                     if dbData:
                         season = int(dbData[0]['season'])
@@ -914,6 +966,7 @@ class PostProcessor(object):
         """
 
         self._log("Processing {}".format(self.file_path))
+        self._stage_time = time.time()
 
         if os.path.isdir(self.file_path):
             self._log("File %s seems to be a directory" % self.file_path)
@@ -943,6 +996,26 @@ class PostProcessor(object):
             self._log("Not enough information to determine what episode this is. Quitting post-processing")
             return False
 
+        self._mark('identify')
+
+        locks = self._episode_locks(show, season, episodes)
+        for lock in locks:
+            lock.acquire()
+
+        try:
+            self._mark('wait')
+            return self._process_episode(show, season, episodes, quality, version)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _process_episode(self, show, season, episodes, quality, version):
+        """
+        Post-process the file into the given episodes, callers must hold the episode locks
+
+        :return: True on success, False on failure
+        """
+
         # retrieve/create the corresponding TVEpisode objects
         ep_obj = self._get_ep_obj(show, season, episodes)
         _, old_ep_quality = Quality.splitCompositeStatus(ep_obj.status)
@@ -956,6 +1029,7 @@ class PostProcessor(object):
             new_ep_quality = self._get_quality(ep_obj)
 
         sickrage.srCore.srLogger.debug("Quality of the episode we're processing: %s" % new_ep_quality)
+        self._mark('quality')
 
         # see if this is a priority download (is it snatched, in history, PROPER, or BEST)
         priority_download = self._is_priority(ep_obj, new_ep_quality)
@@ -1026,20 +1100,23 @@ class PostProcessor(object):
 
         # if the show directory doesn't exist then make it if allowed
         if not os.path.isdir(ep_obj.show.location) and sickrage.srCore.srConfig.CREATE_MISSING_SHOW_DIRS:
-            self._log("Show directory doesn't exist, creating it", sickrage.srCore.srLogger.DEBUG)
+            with ep_obj.show.lock:
+                # another file of this show may have created it meanwhile
+                if not os.path.isdir(ep_obj.show.location):
+                    self._log("Show directory doesn't exist, creating it", sickrage.srCore.srLogger.DEBUG)
 
-            try:
-                os.mkdir(ep_obj.show.location)
-                chmodAsParent(ep_obj.show.location)
+                    try:
+                        os.mkdir(ep_obj.show.location)
+                        chmodAsParent(ep_obj.show.location)
 
-                # do the library update for synoindex
-                sickrage.srCore.notifiersDict['synoindex'].addFolder(ep_obj.show.location)
-            except (OSError, IOError):
-                raise EpisodePostProcessingFailedException(
-                    "Unable to create the show directory: " + ep_obj.show.location)
+                        # do the library update for synoindex
+                        sickrage.srCore.notifiersDict['synoindex'].addFolder(ep_obj.show.location)
+                    except (OSError, IOError):
+                        raise EpisodePostProcessingFailedException(
+                            "Unable to create the show directory: " + ep_obj.show.location)
 
-            # get metadata for the show (but not episode because it hasn't been fully processed)
-            ep_obj.show.writeMetadata(True)
+                    # get metadata for the show (but not episode because it hasn't been fully processed)
+                    ep_obj.show.writeMetadata(True)
 
         # update the ep info before we rename so the quality & release name go into the name properly
         for cur_ep in [ep_obj] + ep_obj.relatedEps:
@@ -1153,6 +1230,8 @@ class PostProcessor(object):
                 cur_ep.location = os.path.join(dest_path, new_file_name)
                 cur_ep.saveToDB()
 
+        self._mark('transfer')
+
         # set file modify stamp to show airdate
         if sickrage.srCore.srConfig.AIRDATE_EPISODES:
             for cur_ep in [ep_obj] + ep_obj.relatedEps:
@@ -1161,6 +1240,7 @@ class PostProcessor(object):
 
         # generate nfo/tbn
         ep_obj.createMetaFiles()
+        self._mark('metadata')
 
         # log it to history
         History.logDownload(ep_obj, self.file_path, new_ep_quality, self.release_group, new_ep_version)
@@ -1194,5 +1274,6 @@ class PostProcessor(object):
             sickrage.srCore.srLogger.info("Some notifications could not be sent. Continuing with post-processing...")
 
         self._run_extra_scripts(ep_obj)
+        self._mark('notify')
 
         return True
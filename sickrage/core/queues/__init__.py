@@ -19,14 +19,10 @@
 
 from __future__ import unicode_literals
 
-try:
-    from Queue import PriorityQueue, Empty
-except ImportError:
-    from queue import PriorityQueue, Empty
-
-import time
 import datetime
+import heapq
 import threading
+import time
 
 import sickrage
 
@@ -38,47 +34,101 @@ class srQueuePriorities(object):
 
 
 class srQueue(threading.Thread):
-    def __init__(self, name="QUEUE"):
+    def __init__(self, name="QUEUE", workers=1):
         super(srQueue, self).__init__(name=name)
         self.daemon = True
-        self._queue = PriorityQueue()
-        self.currentItem = None
-        self.min_priority = 0
+        self._queue = []
+        self._running = []
+        self._min_priority = 0
+        self.workers = workers
         self.amActive = False
         self.lock = threading.Lock()
+        self.condition = threading.Condition(self.lock)
         self.stop = threading.Event()
 
     def run(self):
         """
-        Process items in this queue
+        Process items in this queue, extra worker threads are started when more than one worker is configured
         """
 
-        while not self.stop.is_set():
-            with self.lock:
-                self.amActive = True
+        for i in range(1, max(1, self.workers)):
+            worker = threading.Thread(target=self.worker, name="{}-WORKER-{}".format(self.name, i))
+            worker.daemon = True
+            worker.start()
 
-                if self.currentItem is None or not self.currentItem.isAlive():
-                    if self.currentItem:
-                        self.currentItem = None
+        self.worker()
 
-                    self.currentItem = self.get()
-                    if self.currentItem.priority < self.min_priority:
-                        self.put(self.currentItem)
-                        self.currentItem = None
-                    else:
-                        self.currentItem.start()
+    def worker(self):
+        while not self.stop.is_set():
+            item = self.get()
+            if item is None:
+                continue
+
+            try:
+                item.start()
+                item.join()
+            finally:
+                with self.condition:
+                    self._running.remove(item)
+                    self.amActive = len(self._running) > 0
+                    self.condition.notify_all()
+
+    @staticmethod
+    def _item_key(item):
+        show = getattr(item, 'show', None)
+        return getattr(show, 'indexerid', None) or getattr(item, 'indexer_id', None)
+
+    def _is_runnable(self, item):
+        if item.priority < self.min_priority:
+            return False
+
+        # never run two items for the same show at once
+        key = self._item_key(item)
+        return key is None or key not in [self._item_key(x) for x in self._running]
 
-                self.amActive = False
+    @property
+    def queue(self):
+        with self.lock:
+            return list(self._queue)
 
-            time.sleep(1)
+    @property
+    def currentItems(self):
+        with self.lock:
+            return list(self._running)
 
     @property
-    def queue(self):
-        return self._queue.queue
+    def currentItem(self):
+        currentItems = self.currentItems
+        return currentItems[0] if currentItems else None
 
-    def get(self, *args, **kwargs):
-        _, _, item = self._queue.get(*args, **kwargs)
-        return item
+    @property
+    def min_priority(self):
+        return self._min_priority
+
+    @min_priority.setter
+    def min_priority(self, value):
+        with self.condition:
+            self._min_priority = value
+            self.condition.notify_all()
+
+    def get(self):
+        """
+        Blocks until an item can be run, items are taken in priority order skipping those for shows that already
+        have an item running
+
+        :return: item or None if the queue is stopping
+        """
+        with self.condition:
+            while not self.stop.is_set():
+                for queue_item in sorted(self._queue):
+                    if self._is_runnable(queue_item[2]):
+                        self._queue.remove(queue_item)
+                        heapq.heapify(self._queue)
+                        self._running.append(queue_item[2])
+                        self.amActive = True
+                        return queue_item[2]
+
+                self.condition.wait()
 
     def put(self, item, *args, **kwargs):
         """
@@ -89,9 +139,23 @@ class srQueue(threading.Thread):
         """
         item.added = datetime.datetime.now()
         item.name = "{}-{}".format(self.name, item.name)
-        self._queue.put((item.priority, time.time(), item), *args, **kwargs)
+
+        with self.condition:
+            heapq.heappush(self._queue, (item.priority, time.time(), item))
+            self.condition.notify_all()
+
         return item
 
+    def remove(self, item):
+        """
+        Removes a queued item that has not started yet
+
+        :param item: Queue object to remove
+        """
+        with self.condition:
+            self._queue = [x for x in self._queue if x[2] is not item]
+            heapq.heapify(self._queue)
+
     def pause(self):
         """Pauses this queue"""
         sickrage.srCore.srLogger.info("Pausing queue")
@@ -104,6 +168,10 @@ class srQueue(threading.Thread):
 
     def shutdown(self):
         self.stop.set()
+
+        with self.condition:
+            self.condition.notify_all()
+
         try:
             self.join(1)
         except:
@@ -89,20 +89,17 @@ class srSearchQueue(srQueue):
 
     def is_manualsearch_in_progress(self):
         # Only referenced in webviews.py, only current running manualsearch or failedsearch is needed!!
-        if isinstance(self.currentItem, (ManualSearchQueueItem, FailedQueueItem)):
-            return True
-
-        return False
+        return any(isinstance(x, (ManualSearchQueueItem, FailedQueueItem)) for x in self.currentItems)
 
     def is_backlog_in_progress(self):
-        for _, _, cur_item in self.queue + [(0, 0, self.currentItem)]:
+        for cur_item in [x for _, _, x in self.queue] + self.currentItems:
             if isinstance(cur_item, BacklogQueueItem):
                 return True
 
         return False
 
     def is_dailysearch_in_progress(self):
-        for _, _, cur_item in self.queue + [(0, 0, self.currentItem)]:
+        for cur_item in [x for _, _, x in self.queue] + self.currentItems:
             if isinstance(cur_item, DailySearchQueueItem):
                 return True
 
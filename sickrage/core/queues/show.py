@@ -43,6 +43,10 @@ class srShowQueue(srQueue):
     def __init__(self):
         srQueue.__init__(self, "SHOWQUEUE")
 
+    def run(self):
+        self.workers = sickrage.srCore.srConfig.SHOW_QUEUE_THREADS
+        super(srShowQueue, self).run()
+
     @property
     def loadingShowList(self):
         return self._getLoadingShowList()
@@ -54,7 +58,7 @@ class srShowQueue(srQueue):
         return show.indexerid in [x.show.indexerid if x.show else 0 for _, _, x in self.queue if x.action_id in actions]
 
     def _isBeing(self, show, actions):
-        return self.currentItem is not None and show == self.currentItem.show and self.currentItem.action_id in actions
+        return any(show == x.show and x.action_id in actions for x in self.currentItems)
 
     def isInUpdateQueue(self, show):
         return self._isInQueue(show, (ShowQueueActions.UPDATE, ShowQueueActions.FORCEUPDATE))
@@ -84,7 +88,7 @@ class srShowQueue(srQueue):
         return self._isBeing(show, (ShowQueueActions.SUBTITLE,))
 
     def _getLoadingShowList(self):
-        return [x for _, _, x in self.queue + [(0, 0, self.currentItem)] if x and x.isLoading]
+        return [x for x in [x for _, _, x in self.queue] + self.currentItems if x and x.isLoading]
 
     def updateShow(self, show, force=False):
 
@@ -154,8 +158,8 @@ class srShowQueue(srQueue):
 
         # remove other queued actions for this show.
         for _, _, x in self.queue:
-            if x and x.show and x != self.currentItem and show.indexerid == x.show.indexerid:
-                self.queue.remove(x)
+            if x and x.show and show.indexerid == x.show.indexerid:
+                self.remove(x)
 
         return self.put(QueueItemRemove(show=show, full=full))
 
@@ -204,7 +208,7 @@ class ShowQueueItem(srQueueItem):
         self.show.flushEpisodes()
 
     def isInQueue(self):
-        return self in sickrage.srCore.SHOWQUEUE.queue + [sickrage.srCore.SHOWQUEUE.currentItem]
+        return self in [x for _, _, x in sickrage.srCore.SHOWQUEUE.queue] + sickrage.srCore.SHOWQUEUE.currentItems
 
     @property
     def show_name(self):
@@ -445,6 +449,9 @@ class QueueItemAdd(ShowQueueItem):
 
         sickrage.srCore.NAMECACHE.build(self.show)
 
+        # releases already seen by the provider caches may belong to the new show
+        sickrage.srCore.PROVIDERCACHE.reset_feed_states()
+
         self.finish()
 
         sickrage.srCore.srLogger.info(
@@ -24,11 +24,26 @@ from feedparser import FeedParserDict
 import sickrage
 
 
-def getFeed(url, params=None, request_headers=None, handlers=None):
+def getFeed(url, params=None, request_headers=None, handlers=None, etag=None, modified=None):
+    """
+    Fetch and parse a feed, when etag or modified are given the request is conditional and a feed that didn't
+    change since is returned without entries and with status 304
+
+    :return: parsed feed with the etag, modified and status of the response
+    """
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if modified:
+        headers['If-Modified-Since'] = modified
+
     try:
-        resp = sickrage.srCore.srWebSession.get(url, params=params, cache=False)
+        resp = sickrage.srCore.srWebSession.get(url, params=params, headers=headers, cache=False)
+        if resp.status_code == 304:
+            return FeedParserDict(feed=FeedParserDict(), entries=[], status=304, etag=etag, modified=modified)
+
         if resp.ok:
-            return feedparser.parse(
+            feed = feedparser.parse(
                 resp.text,
                 agent=sickrage.srCore.USER_AGENT,
                 etag=False,
@@ -36,6 +51,11 @@ def getFeed(url, params=None, request_headers=None, handlers=None):
                 request_headers=request_headers,
                 handlers=handlers
             )
+
+            feed['status'] = resp.status_code
+            feed['etag'] = resp.headers.get('ETag')
+            feed['modified'] = resp.headers.get('Last-Modified')
+            return feed
     except Exception as e:
         sickrage.srCore.srLogger.debug("RSS Error: {}".format(e.message))
 
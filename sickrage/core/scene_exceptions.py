@@ -37,8 +37,9 @@ xem_exception_dict = {}
 
 exceptionsCache = {}
 exceptionsSeasonCache = {}
+exceptionsNameCache = None
 
-exceptionLock = threading.Lock()
+exceptionLock = threading.RLock()
 
 
 def shouldRefresh(exList):
@@ -80,9 +81,11 @@ def retrieve_exceptions(get_xem=True, get_anidb=True):
     """
     Looks up the exceptions on github, parses them into a dict, and inserts them into the
     scene_exceptions table in cache.db. Also clears the scene name cache.
+
+    :return: set of indexer ids whose scene exceptions changed
     """
 
-    updated_exceptions = False
+    updated_exceptions = set()
 
     for indexer in srIndexerApi().indexers:
         indexer_name = srIndexerApi(indexer).name
@@ -132,7 +135,7 @@ def retrieve_exceptions(get_xem=True, get_anidb=True):
 
         for cur_exception, curSeason in dict([(key, d[key]) for d in cur_exception_dict for key in d]).items():
             if cur_exception not in existing_exceptions:
-                updated_exceptions = True
+                updated_exceptions.add(cur_indexer_id)
                 sickrage.srCore.cacheDB.db.insert({
                     '_t': 'scene_exceptions',
                     'indexer_id': cur_indexer_id,
@@ -142,6 +145,13 @@ def retrieve_exceptions(get_xem=True, get_anidb=True):
 
     if updated_exceptions:
         sickrage.srCore.srLogger.debug("Updated scene exceptions")
+
+        for cur_indexer_id in updated_exceptions:
+            exceptionsCache.pop(cur_indexer_id, None)
+            exceptionsSeasonCache.pop(cur_indexer_id, None)
+
+        build_name_cache()
+        sickrage.srCore.PROVIDERCACHE.reset_feed_states()
     else:
         sickrage.srCore.srLogger.debug("No scene exceptions update needed")
 
@@ -150,6 +160,8 @@ def retrieve_exceptions(get_xem=True, get_anidb=True):
     anidb_exception_dict.clear()
     xem_exception_dict.clear()
 
+    return updated_exceptions
+
 
 def get_scene_exceptions(indexer_id, season=-1):
     """
@@ -223,36 +235,66 @@ def get_scene_exception_by_name(show_name):
     return get_scene_exception_by_name_multiple(show_name)[0]
 
 
+def _name_cache_keys(show_name):
+    return show_name.lower(), sanitizeSceneName(show_name).lower().replace('.', ' ')
+
+
+def _add_to_name_cache(show_name, indexer_id, season):
+    for cache, key in zip((exceptionsNameCache['names'], exceptionsNameCache['sanitized']),
+                          _name_cache_keys(show_name)):
+        cache[key] = sorted(cache.get(key, []) + [(int(indexer_id), int(season))], key=lambda x: x[1])
+
+
+def _remove_from_name_cache(show_name, indexer_id, season):
+    for cache, key in zip((exceptionsNameCache['names'], exceptionsNameCache['sanitized']),
+                          _name_cache_keys(show_name)):
+        cache[key] = [x for x in cache.get(key, []) if x != (int(indexer_id), int(season))]
+        if not cache[key]:
+            del cache[key]
+
+
+def build_name_cache():
+    """
+    Rebuilds the map of lowercased and sanitized scene exception names to (indexer_id, season) from cache.db,
+    the new map replaces the old one in a single assignment so lookups never see a partial map.
+    """
+    global exceptionsNameCache
+
+    with exceptionLock:
+        names = {}
+        sanitized = {}
+
+        for cur_exception in sorted([x['doc'] for x in sickrage.srCore.cacheDB.db.all('scene_exceptions',
+                                                                                     with_doc=True)],
+                                    key=lambda d: d['season']):
+            name, sanitized_name = _name_cache_keys(cur_exception['show_name'])
+            value = (int(cur_exception['indexer_id']), int(cur_exception['season']))
+            names.setdefault(name, []).append(value)
+            sanitized.setdefault(sanitized_name, []).append(value)
+
+        exceptionsNameCache = {'names': names, 'sanitized': sanitized}
+
+
 def get_scene_exception_by_name_multiple(show_name):
     """
     Given a show name, return the indexerid of the exception, None if no exception
     is present.
     """
 
-    out = []
-
-    dbData = sorted([x['doc'] for x in sickrage.srCore.cacheDB.db.all('scene_exceptions', with_doc=True)],
-                    key=lambda d: d['season'])
+    if exceptionsNameCache is None:
+        build_name_cache()
 
     # try the obvious case first
-    exception_result = [x for x in dbData if x['show_name'].lower() == show_name.lower()]
+    exception_result = exceptionsNameCache['names'].get(show_name.lower())
+    if exception_result:
+        return list(exception_result)
+
+    exception_result = exceptionsNameCache['sanitized'].get(show_name.lower())
     if exception_result:
-        return [(int(x['indexer_id']), int(x['season'])) for x in exception_result]
-
-    for cur_exception in dbData:
-        cur_exception_name = cur_exception['show_name']
-        cur_indexer_id = int(cur_exception['indexer_id'])
-        cur_season = int(cur_exception['season'])
-
-        if show_name.lower() in (
-                cur_exception_name.lower(),
-                sanitizeSceneName(cur_exception_name).lower().replace('.', ' ')):
-            sickrage.srCore.srLogger.debug(
-                "Scene exception lookup got indexer id " + str(cur_indexer_id) + ", using that")
-            out.append((cur_indexer_id, cur_season))
-
-    if out:
-        return out
+        sickrage.srCore.srLogger.debug(
+            "Scene exception lookup got indexer id " + str(exception_result[0][0]) + ", using that")
+        return list(exception_result)
+
     return [(None, None)]
 
 
@@ -260,24 +302,33 @@ def update_scene_exceptions(indexer_id, scene_exceptions, season=-1):
     """
     Given a indexer_id, and a list of all show scene exceptions, update the db.
     """
-    [sickrage.srCore.cacheDB.db.delete(x['doc']) for x in
-     sickrage.srCore.cacheDB.db.get_many('scene_exceptions', indexer_id, with_doc=True)
-     if x['doc']['season'] == season]
+    with exceptionLock:
+        for dbData in [x['doc'] for x in
+                       sickrage.srCore.cacheDB.db.get_many('scene_exceptions', indexer_id, with_doc=True)
+                       if x['doc']['season'] == season]:
+            sickrage.srCore.cacheDB.db.delete(dbData)
+            if exceptionsNameCache is not None:
+                _remove_from_name_cache(dbData['show_name'], indexer_id, season)
 
-    sickrage.srCore.srLogger.info("Updating scene exceptions")
+        sickrage.srCore.srLogger.info("Updating scene exceptions")
 
-    # A change has been made to the scene exception list. Let's clear the cache, to make this visible
-    if indexer_id in exceptionsCache:
+        # A change has been made to the scene exception list. Let's clear the cache, to make this visible
         exceptionsCache[indexer_id] = {}
-    exceptionsCache[indexer_id][season] = scene_exceptions
+        exceptionsCache[indexer_id][season] = scene_exceptions
 
-    for cur_exception in scene_exceptions:
-        sickrage.srCore.cacheDB.db.insert({
-            '_t': 'scene_exceptions',
-            'indexer_id': indexer_id,
-            'show_name': cur_exception,
-            'season': season
-        })
+        for cur_exception in scene_exceptions:
+            sickrage.srCore.cacheDB.db.insert({
+                '_t': 'scene_exceptions',
+                'indexer_id': indexer_id,
+                'show_name': cur_exception,
+                'season': season
+            })
+
+            if exceptionsNameCache is not None:
+                _add_to_name_cache(cur_exception, indexer_id, season)
+
+        if scene_exceptions:
+            sickrage.srCore.PROVIDERCACHE.reset_feed_states()
 
 
 def _anidb_exceptions_fetcher():
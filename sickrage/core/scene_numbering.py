@@ -260,10 +260,10 @@ def find_xem_numbering(indexer_id, indexer, season, episode):
 
     xem_refresh(indexer_id, indexer)
 
-    dbData = [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes', indexer_id, with_doc=True)
+    dbData = [x['doc'] for x in
+              sickrage.srCore.mainDB.db.get_many('tv_episodes_season_episode', (indexer_id, season, episode),
+                                                 with_doc=True)
               if x['doc']['indexer'] == indexer
-              and x['doc']['season'] == season
-              and x['doc']['episode'] == episode
               and x['doc']['scene_season'] != 0
               and x['doc']['scene_episode'] != 0]
 
@@ -288,9 +288,10 @@ def find_xem_absolute_numbering(indexer_id, indexer, absolute_number):
 
     xem_refresh(indexer_id, indexer)
 
-    dbData = [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes', indexer_id, with_doc=True)
+    dbData = [x['doc'] for x in
+              sickrage.srCore.mainDB.db.get_many('tv_episodes_absolute_number', (indexer_id, absolute_number),
+                                                 with_doc=True)
               if x['doc']['indexer'] == indexer
-              and x['doc']['absolute_number'] == absolute_number
               and x['doc']['scene_absolute_number'] != 0]
 
     if dbData:
@@ -524,11 +525,10 @@ def xem_refresh(indexer_id, indexer, force=False):
 
             for entry in parsedJSON['data']:
                 try:
-                    dbData = \
-                        [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes', indexer_id, with_doc=True)
-                         if x['doc']['season'] == entry[srIndexerApi(indexer).config['xem_origin']]['season']
-                         and x['doc']['episode'] == entry[srIndexerApi(indexer).config['xem_origin']]['episode']][
-                            0]
+                    dbData = [x['doc'] for x in sickrage.srCore.mainDB.db.get_many(
+                        'tv_episodes_season_episode',
+                        (indexer_id, entry[srIndexerApi(indexer).config['xem_origin']]['season'],
+                         entry[srIndexerApi(indexer).config['xem_origin']]['episode']), with_doc=True)][0]
                 except:
                     continue
 
@@ -564,9 +564,9 @@ def get_absolute_number_from_season_and_episode(show, season, episode):
     absolute_number = None
 
     if season and episode:
-        dbData = [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes', show.indexerid, with_doc=True)
-                  if x['doc']['season'] == season
-                  and x['doc']['episode'] == episode]
+        dbData = [x['doc'] for x in
+                  sickrage.srCore.mainDB.db.get_many('tv_episodes_season_episode', (show.indexerid, season, episode),
+                                                     with_doc=True)]
 
         if len(dbData) == 1:
             absolute_number = int(dbData[0]["absolute_number"] or 0)
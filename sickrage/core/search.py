@@ -23,6 +23,7 @@ import io
 import os
 import re
 import threading
+import time
 from datetime import date, timedelta
 
 import sickrage
@@ -38,6 +39,131 @@ from sickrage.core.tv.show.history import FailedHistory, History
 from sickrage.notifiers import srNotifiers
 from sickrage.providers import NZBProvider, NewznabProvider, TorrentProvider, TorrentRssProvider
 
+try:
+    from futures import ThreadPoolExecutor, TimeoutError
+except ImportError:
+    from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+
+class srProviderSearchPool(object):
+    """
+    Runs provider searches in parallel on a shared worker pool, each provider only runs one search at a time
+    and keeps counters of its search latency, errors and timeouts.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.lock = threading.Lock()
+        self.executor = None
+        self.provider_locks = {}
+        self.provider_stats = {}
+
+    def _get_executor(self):
+        with self.lock:
+            if not self.executor:
+                self.executor = ThreadPoolExecutor(max(1, sickrage.srCore.srConfig.SEARCH_THREADS))
+            return self.executor
+
+    def _get_provider_lock(self, providerObj):
+        with self.lock:
+            return self.provider_locks.setdefault(providerObj.id, threading.Lock())
+
+    def _record(self, providerObj, latency=None, error=False, timeout=False):
+        with self.lock:
+            stats = self.provider_stats.setdefault(providerObj.id, {'name': providerObj.name,
+                                                                    'searches': 0,
+                                                                    'errors': 0,
+                                                                    'timeouts': 0,
+                                                                    'last_latency': 0.0,
+                                                                    'total_latency': 0.0})
+
+            if latency is not None:
+                stats['searches'] += 1
+                stats['last_latency'] = latency
+                stats['total_latency'] += latency
+            if error:
+                stats['errors'] += 1
+            if timeout:
+                stats['timeouts'] += 1
+
+    def submit(self, providerObj, threadName, func, *args, **kwargs):
+        """
+        Queues a search of a provider on the worker pool
+
+        :param providerObj: provider being searched
+        :param threadName: name of the thread the search was started from
+        :param func: search function to call
+        :return: future holding the search results
+        """
+
+        started = threading.Event()
+        timeout = max(1, sickrage.srCore.srConfig.PROVIDER_TIMEOUT)
+
+        def search():
+            with self._get_provider_lock(providerObj):
+                started.set()
+                start_time = time.time()
+                workerName = threading.currentThread().getName()
+                threading.currentThread().setName(threadName + "::[" + providerObj.name + "]")
+
+                try:
+                    # requests of a search that timed out fail instead of keeping the worker busy
+                    with sickrage.srCore.srWebSession.deadline(timeout):
+                        return func(*args, **kwargs)
+                except Exception:
+                    self._record(providerObj, error=True)
+                    raise
+                finally:
+                    self._record(providerObj, latency=time.time() - start_time)
+                    sickrage.srCore.srLogger.debug(
+                        "Searching " + providerObj.name + " took {}s".format(round(time.time() - start_time, 2)))
+                    threading.currentThread().setName(workerName)
+
+        future = self._get_executor().submit(search)
+        future.started = started
+        return future
+
+    def result(self, providerObj, future, timeout, queue_timeout=None):
+        """
+        Waits for a provider search to finish, the timeout only starts once the search is running
+
+        :param providerObj: provider being searched
+        :param future: future returned by submit
+        :param timeout: seconds the search itself may take
+        :param queue_timeout: seconds the search may wait for a free worker
+        :return: search results
+        """
+
+        try:
+            future.started.wait(queue_timeout)
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            self._record(providerObj, timeout=True)
+
+            # a search still waiting for a worker is dropped, a running one keeps the provider lock until its
+            # next request fails so later searches get a new lock instead of waiting for it
+            if not future.cancel():
+                with self.lock:
+                    self.provider_locks[providerObj.id] = threading.Lock()
+            raise
+
+    @property
+    def stats(self):
+        with self.lock:
+            stats = {}
+
+            for provider_id, provider_stats in self.provider_stats.items():
+                stats[provider_id] = dict(provider_stats)
+                stats[provider_id]['avg_latency'] = round(
+                    provider_stats['total_latency'] / max(1, provider_stats['searches']), 2)
+
+            return stats
+
+    def shutdown(self):
+        with self.lock:
+            if self.executor:
+                self.executor.shutdown(wait=False)
+                self.executor = None
+
 
 def _download_result(result):
     """
@@ -236,12 +362,12 @@ def pickBestResult(results, show):
                 "Ignoring " + cur_result.name + " because its not a valid scene release that we want, ignoring it")
             continue
 
-        if hasattr(cur_result, 'size'):
-            if sickrage.srCore.srConfig.USE_FAILED_DOWNLOADS and FailedHistory.hasFailed(cur_result.name,
-                                                                                         cur_result.size,
-                                                                                         cur_result.provider.name):
-                sickrage.srCore.srLogger.info(cur_result.name + " has previously failed, rejecting it")
-                continue
+        # release size and files are fetched from the provider on first access, only once the cheaper checks pass
+        if sickrage.srCore.srConfig.USE_FAILED_DOWNLOADS and FailedHistory.hasFailed(cur_result.name,
+                                                                                     cur_result.size,
+                                                                                     cur_result.provider.name):
+            sickrage.srCore.srLogger.info(cur_result.name + " has previously failed, rejecting it")
+            continue
 
         # quality definition video file size constraints check
         try:
@@ -415,10 +541,60 @@ def searchProviders(show, episodes, manualSearch=False, downCurQuality=False, ca
 
     origThreadName = threading.currentThread().getName()
 
+    def search_provider(providerObj):
+        results = {}
+        searchCount = 0
+        search_mode = providerObj.search_mode
+
+        # Always search for episode when manually searching when in sponly
+        if search_mode == 'sponly' and manualSearch == True:
+            search_mode = 'eponly'
+
+        while True:
+            searchCount += 1
+
+            # update provider RSS cache
+            if sickrage.srCore.srConfig.ENABLE_RSS_CACHE: providerObj.cache.update()
+
+            if len(episodes):
+                if search_mode == 'eponly':
+                    sickrage.srCore.srLogger.info("Performing episode search for " + show.name)
+                else:
+                    sickrage.srCore.srLogger.info("Performing season pack search for " + show.name)
+
+            # search provider for episodes
+            searchResults = providerObj.findSearchResults(show,
+                                                          episodes,
+                                                          search_mode,
+                                                          manualSearch,
+                                                          downCurQuality,
+                                                          cacheOnly)
+
+            if len(searchResults):
+                # make a list of all the results for this provider
+                for curEp in searchResults:
+                    if curEp in results:
+                        results[curEp] += searchResults[curEp]
+                    else:
+                        results[curEp] = searchResults[curEp]
+                break
+            elif not providerObj.search_fallback or searchCount == 2:
+                break
+
+            if search_mode == 'sponly':
+                sickrage.srCore.srLogger.debug("Fallback episode search initiated")
+                search_mode = 'eponly'
+            else:
+                sickrage.srCore.srLogger.debug("Fallback season pack search initiate")
+                search_mode = 'sponly'
+
+        return results
+
     def perform_searches():
         foundResults = {}
         finalResults = []
 
+        providers = []
         for providerID, providerObj in sickrage.srCore.providersDict.sort(
                 randomize=sickrage.srCore.srConfig.RANDOMIZE_PROVIDERS).items():
 
@@ -435,260 +611,230 @@ def searchProviders(show, episodes, manualSearch=False, downCurQuality=False, ca
                 sickrage.srCore.srLogger.debug("" + str(show.name) + " is not an anime, skiping")
                 continue
 
-            foundResults[providerObj.name] = {}
-
-            searchCount = 0
-            search_mode = providerObj.search_mode
-
-            # Always search for episode when manually searching when in sponly
-            if search_mode == 'sponly' and manualSearch == True:
-                search_mode = 'eponly'
+            providers.append(providerObj)
 
-            while True:
-                searchCount += 1
+        # search all providers in parallel, results are processed in provider order so the best result picked
+        # for each episode is the same as when searching one provider after another
+        timeout = max(1, sickrage.srCore.srConfig.PROVIDER_TIMEOUT)
+        futures = [(providerObj, sickrage.srCore.SEARCHPOOL.submit(providerObj, origThreadName,
+                                                                   search_provider, providerObj))
+                   for providerObj in providers]
 
+        try:
+            for providerObj, future in futures:
                 try:
-                    threading.currentThread().setName(origThreadName + "::[" + providerObj.name + "]")
-
-                    # update provider RSS cache
-                    if sickrage.srCore.srConfig.ENABLE_RSS_CACHE: providerObj.cache.update()
-
-                    if len(episodes):
-                        if search_mode == 'eponly':
-                            sickrage.srCore.srLogger.info("Performing episode search for " + show.name)
-                        else:
-                            sickrage.srCore.srLogger.info("Performing season pack search for " + show.name)
-
-                    # search provider for episodes
-                    searchResults = providerObj.findSearchResults(show,
-                                                                  episodes,
-                                                                  search_mode,
-                                                                  manualSearch,
-                                                                  downCurQuality,
-                                                                  cacheOnly)
+                    foundResults[providerObj.name] = sickrage.srCore.SEARCHPOOL.result(
+                        providerObj, future, timeout, timeout * len(futures))
+                except TimeoutError:
+                    sickrage.srCore.srLogger.warning(
+                        "Timed out after {}s while searching ".format(timeout) + providerObj.name + ", skipping")
+                    continue
                 except AuthException as e:
                     sickrage.srCore.srLogger.warning("Authentication error: {}".format(e.message))
-                    break
+                    continue
                 except Exception as e:
                     sickrage.srCore.srLogger.error(
                         "Error while searching " + providerObj.name + ", skipping: {}".format(e.message))
-                    break
-                finally:
-                    threading.currentThread().setName(origThreadName)
-
-                didSearch = True
-
-                if len(searchResults):
-                    # make a list of all the results for this provider
-                    for curEp in searchResults:
-                        if curEp in foundResults:
-                            foundResults[providerObj.name][curEp] += searchResults[curEp]
-                        else:
-                            foundResults[providerObj.name][curEp] = searchResults[curEp]
-                    break
-                elif not providerObj.search_fallback or searchCount == 2:
-                    break
+                    continue
 
-                if search_mode == 'sponly':
-                    sickrage.srCore.srLogger.debug("Fallback episode search initiated")
-                    search_mode = 'eponly'
-                else:
-                    sickrage.srCore.srLogger.debug("Fallback season pack search initiate")
-                    search_mode = 'sponly'
+                # skip to next provider if we have no results to process
+                if not len(foundResults[providerObj.name]):
+                    continue
 
-            # skip to next provider if we have no results to process
-            if not len(foundResults[providerObj.name]):
-                continue
+                # pick the best season NZB
+                bestSeasonResult = None
+                if SEASON_RESULT in foundResults[providerObj.name]:
+                    bestSeasonResult = pickBestResult(foundResults[providerObj.name][SEASON_RESULT], show)
 
-            # pick the best season NZB
-            bestSeasonResult = None
-            if SEASON_RESULT in foundResults[providerObj.name]:
-                bestSeasonResult = pickBestResult(foundResults[providerObj.name][SEASON_RESULT], show)
+                highest_quality_overall = 0
+                for cur_episode in foundResults[providerObj.name]:
+                    for cur_result in foundResults[providerObj.name][cur_episode]:
+                        if cur_result.quality != Quality.UNKNOWN and cur_result.quality > highest_quality_overall:
+                            highest_quality_overall = cur_result.quality
 
-            highest_quality_overall = 0
-            for cur_episode in foundResults[providerObj.name]:
-                for cur_result in foundResults[providerObj.name][cur_episode]:
-                    if cur_result.quality != Quality.UNKNOWN and cur_result.quality > highest_quality_overall:
-                        highest_quality_overall = cur_result.quality
+                sickrage.srCore.srLogger.debug(
+                    "The highest quality of any match is " + Quality.qualityStrings[highest_quality_overall])
 
-            sickrage.srCore.srLogger.debug(
-                "The highest quality of any match is " + Quality.qualityStrings[highest_quality_overall])
+                # see if every episode is wanted
+                if bestSeasonResult:
+                    searchedSeasons = {x.season for x in episodes}
 
-            # see if every episode is wanted
-            if bestSeasonResult:
-                searchedSeasons = {x.season for x in episodes}
+                    # get the quality of the season nzb
+                    seasonQual = bestSeasonResult.quality
+                    sickrage.srCore.srLogger.debug(
+                        "The quality of the season " + bestSeasonResult.provider.type + " is " +
+                        Quality.qualityStrings[
+                            seasonQual])
 
-                # get the quality of the season nzb
-                seasonQual = bestSeasonResult.quality
-                sickrage.srCore.srLogger.debug(
-                    "The quality of the season " + bestSeasonResult.provider.type + " is " +
-                    Quality.qualityStrings[
-                        seasonQual])
-
-                allEps = [int(x['doc']["episode"]) for x in
-                          sickrage.srCore.mainDB.db.get_many('tv_episodes', show.indexerid, with_doc=True)
-                          if x['doc']['season'] in searchedSeasons]
-
-                sickrage.srCore.srLogger.debug("Episode list: " + str(allEps))
-
-                allWanted = True
-                anyWanted = False
-                for curEpNum in allEps:
-                    for season in set([x.season for x in episodes]):
-                        if not show.wantEpisode(season, curEpNum, seasonQual, downCurQuality):
-                            allWanted = False
-                        else:
-                            anyWanted = True
+                    allEps = [int(x['doc']["episode"]) for x in
+                              sickrage.srCore.mainDB.db.get_many('tv_episodes', show.indexerid, with_doc=True)
+                              if x['doc']['season'] in searchedSeasons]
 
-                # if we need every ep in the season and there's nothing better then just download this and be done with it (unless single episodes are preferred)
-                if allWanted and bestSeasonResult.quality == highest_quality_overall:
-                    sickrage.srCore.srLogger.info(
-                        "Every ep in this season is needed, downloading the whole " + bestSeasonResult.provider.type + " " + bestSeasonResult.name)
+                    sickrage.srCore.srLogger.debug("Episode list: " + str(allEps))
 
-                    epObjs = []
+                    allWanted = True
+                    anyWanted = False
                     for curEpNum in allEps:
                         for season in set([x.season for x in episodes]):
-                            epObjs.append(show.getEpisode(season, curEpNum))
-
-                    bestSeasonResult.episodes = epObjs
-
-                    return [bestSeasonResult]
-
-                elif not anyWanted:
-                    sickrage.srCore.srLogger.debug(
-                        "No eps from this season are wanted at this quality, ignoring the result of " + bestSeasonResult.name)
-                else:
-                    if bestSeasonResult.provider.type == NZBProvider.type:
-                        sickrage.srCore.srLogger.debug(
-                            "Breaking apart the NZB and adding the individual ones to our results")
-
-                        # if not, break it apart and add them as the lowest priority results
-                        individualResults = splitNZBResult(bestSeasonResult)
-                        for curResult in individualResults:
-                            if len(curResult.episodes) == 1:
-                                epNum = curResult.episodes[0].episode
-                            elif len(curResult.episodes) > 1:
-                                epNum = MULTI_EP_RESULT
-
-                            if epNum in foundResults[providerObj.name]:
-                                foundResults[providerObj.name][epNum].append(curResult)
+                            if not show.wantEpisode(season, curEpNum, seasonQual, downCurQuality):
+                                allWanted = False
                             else:
-                                foundResults[providerObj.name][epNum] = [curResult]
+                                anyWanted = True
 
-                    # If this is a torrent all we can do is leech the entire torrent, user will have to select which eps not do download in his torrent client
-                    else:
-                        # Season result from Torrent Provider must be a full-season torrent, creating multi-ep result for it.
+                    # if we need every ep in the season and there's nothing better then just download this and be done with it (unless single episodes are preferred)
+                    if allWanted and bestSeasonResult.quality == highest_quality_overall:
                         sickrage.srCore.srLogger.info(
-                            "Adding multi-ep result for full-season torrent. Set the episodes you don't want to 'don't download' in your torrent client if desired!")
+                            "Every ep in this season is needed, downloading the whole " + bestSeasonResult.provider.type + " " + bestSeasonResult.name)
 
                         epObjs = []
                         for curEpNum in allEps:
                             for season in set([x.season for x in episodes]):
                                 epObjs.append(show.getEpisode(season, curEpNum))
-                        bestSeasonResult.episodes = epObjs
-
-                        if MULTI_EP_RESULT in foundResults[providerObj.name]:
-                            foundResults[providerObj.name][MULTI_EP_RESULT].append(bestSeasonResult)
-                        else:
-                            foundResults[providerObj.name][MULTI_EP_RESULT] = [bestSeasonResult]
 
-            # go through multi-ep results and see if we really want them or not, get rid of the rest
-            multiResults = {}
-            if MULTI_EP_RESULT in foundResults[providerObj.name]:
-                for _multiResult in foundResults[providerObj.name][MULTI_EP_RESULT]:
-
-                    sickrage.srCore.srLogger.debug(
-                        "Seeing if we want to bother with multi-episode result " + _multiResult.name)
+                        bestSeasonResult.episodes = epObjs
 
-                    # Filter result by ignore/required/whitelist/blacklist/quality, etc
-                    multiResult = pickBestResult(_multiResult, show)
-                    if not multiResult:
-                        continue
+                        return [bestSeasonResult]
 
-                    # see how many of the eps that this result covers aren't covered by single results
-                    neededEps = []
-                    notNeededEps = []
-                    for epObj in multiResult.episodes:
-                        # if we have results for the episode
-                        if epObj.episode in foundResults[providerObj.name] and len(
-                                foundResults[providerObj.name][epObj.episode]) > 0:
-                            notNeededEps.append(epObj.episode)
+                    elif not anyWanted:
+                        sickrage.srCore.srLogger.debug(
+                            "No eps from this season are wanted at this quality, ignoring the result of " + bestSeasonResult.name)
+                    else:
+                        if bestSeasonResult.provider.type == NZBProvider.type:
+                            sickrage.srCore.srLogger.debug(
+                                "Breaking apart the NZB and adding the individual ones to our results")
+
+                            # if not, break it apart and add them as the lowest priority results
+                            individualResults = splitNZBResult(bestSeasonResult)
+                            for curResult in individualResults:
+                                if len(curResult.episodes) == 1:
+                                    epNum = curResult.episodes[0].episode
+                                elif len(curResult.episodes) > 1:
+                                    epNum = MULTI_EP_RESULT
+
+                                if epNum in foundResults[providerObj.name]:
+                                    foundResults[providerObj.name][epNum].append(curResult)
+                                else:
+                                    foundResults[providerObj.name][epNum] = [curResult]
+
+                        # If this is a torrent all we can do is leech the entire torrent, user will have to select which eps not do download in his torrent client
                         else:
-                            neededEps.append(epObj.episode)
+                            # Season result from Torrent Provider must be a full-season torrent, creating multi-ep result for it.
+                            sickrage.srCore.srLogger.info(
+                                "Adding multi-ep result for full-season torrent. Set the episodes you don't want to 'don't download' in your torrent client if desired!")
+
+                            epObjs = []
+                            for curEpNum in allEps:
+                                for season in set([x.season for x in episodes]):
+                                    epObjs.append(show.getEpisode(season, curEpNum))
+                            bestSeasonResult.episodes = epObjs
+
+                            if MULTI_EP_RESULT in foundResults[providerObj.name]:
+                                foundResults[providerObj.name][MULTI_EP_RESULT].append(bestSeasonResult)
+                            else:
+                                foundResults[providerObj.name][MULTI_EP_RESULT] = [bestSeasonResult]
 
-                    sickrage.srCore.srLogger.debug(
-                        "Single-ep check result is neededEps: " + str(neededEps) + ", notNeededEps: " + str(
-                            notNeededEps))
+                # go through multi-ep results and see if we really want them or not, get rid of the rest
+                multiResults = {}
+                if MULTI_EP_RESULT in foundResults[providerObj.name]:
+                    for _multiResult in foundResults[providerObj.name][MULTI_EP_RESULT]:
 
-                    if not neededEps:
                         sickrage.srCore.srLogger.debug(
-                            "All of these episodes were covered by single episode results, ignoring this multi-episode result")
-                        continue
+                            "Seeing if we want to bother with multi-episode result " + _multiResult.name)
+
+                        # Filter result by ignore/required/whitelist/blacklist/quality, etc
+                        multiResult = pickBestResult(_multiResult, show)
+                        if not multiResult:
+                            continue
+
+                        # see how many of the eps that this result covers aren't covered by single results
+                        neededEps = []
+                        notNeededEps = []
+                        for epObj in multiResult.episodes:
+                            # if we have results for the episode
+                            if epObj.episode in foundResults[providerObj.name] and len(
+                                    foundResults[providerObj.name][epObj.episode]) > 0:
+                                notNeededEps.append(epObj.episode)
+                            else:
+                                neededEps.append(epObj.episode)
 
-                    # check if these eps are already covered by another multi-result
-                    multiNeededEps = []
-                    multiNotNeededEps = []
-                    for epObj in multiResult.episodes:
-                        if epObj.episode in multiResults:
-                            multiNotNeededEps.append(epObj.episode)
-                        else:
-                            multiNeededEps.append(epObj.episode)
+                        sickrage.srCore.srLogger.debug(
+                            "Single-ep check result is neededEps: " + str(neededEps) + ", notNeededEps: " + str(
+                                notNeededEps))
 
-                    sickrage.srCore.srLogger.debug(
-                        "Multi-ep check result is multiNeededEps: " + str(
-                            multiNeededEps) + ", multiNotNeededEps: " + str(
-                            multiNotNeededEps))
+                        if not neededEps:
+                            sickrage.srCore.srLogger.debug(
+                                "All of these episodes were covered by single episode results, ignoring this multi-episode result")
+                            continue
+
+                        # check if these eps are already covered by another multi-result
+                        multiNeededEps = []
+                        multiNotNeededEps = []
+                        for epObj in multiResult.episodes:
+                            if epObj.episode in multiResults:
+                                multiNotNeededEps.append(epObj.episode)
+                            else:
+                                multiNeededEps.append(epObj.episode)
 
-                    if not multiNeededEps:
                         sickrage.srCore.srLogger.debug(
-                            "All of these episodes were covered by another multi-episode nzbs, ignoring this multi-ep result")
-                        continue
+                            "Multi-ep check result is multiNeededEps: " + str(
+                                multiNeededEps) + ", multiNotNeededEps: " + str(
+                                multiNotNeededEps))
 
-                    # don't bother with the single result if we're going to get it with a multi result
-                    for epObj in multiResult.episodes:
-                        multiResults[epObj.episode] = multiResult
-                        if epObj.episode in foundResults[providerObj.name]:
+                        if not multiNeededEps:
                             sickrage.srCore.srLogger.debug(
-                                "A needed multi-episode result overlaps with a single-episode result for ep #" + str(
-                                    epObj.episode) + ", removing the single-episode results from the list")
-                            del foundResults[providerObj.name][epObj.episode]
-
-            # of all the single ep results narrow it down to the best one for each episode
-            finalResults += set(multiResults.values())
-            for curEp in foundResults[providerObj.name]:
-                if curEp in (MULTI_EP_RESULT, SEASON_RESULT):
-                    continue
+                                "All of these episodes were covered by another multi-episode nzbs, ignoring this multi-ep result")
+                            continue
+
+                        # don't bother with the single result if we're going to get it with a multi result
+                        for epObj in multiResult.episodes:
+                            multiResults[epObj.episode] = multiResult
+                            if epObj.episode in foundResults[providerObj.name]:
+                                sickrage.srCore.srLogger.debug(
+                                    "A needed multi-episode result overlaps with a single-episode result for ep #" + str(
+                                        epObj.episode) + ", removing the single-episode results from the list")
+                                del foundResults[providerObj.name][epObj.episode]
+
+                # of all the single ep results narrow it down to the best one for each episode
+                finalResults += set(multiResults.values())
+                for curEp in foundResults[providerObj.name]:
+                    if curEp in (MULTI_EP_RESULT, SEASON_RESULT):
+                        continue
 
-                if not len(foundResults[providerObj.name][curEp]) > 0:
-                    continue
+                    if not len(foundResults[providerObj.name][curEp]) > 0:
+                        continue
 
-                # if all results were rejected move on to the next episode
-                bestResult = pickBestResult(foundResults[providerObj.name][curEp], show)
-                if not bestResult:
-                    continue
+                    # if all results were rejected move on to the next episode
+                    bestResult = pickBestResult(foundResults[providerObj.name][curEp], show)
+                    if not bestResult:
+                        continue
 
-                # add result if its not a duplicate and
-                found = False
-                for i, result in enumerate(finalResults):
-                    for bestResultEp in bestResult.episodes:
-                        if bestResultEp in result.episodes:
-                            if result.quality < bestResult.quality:
-                                finalResults.pop(i)
-                            else:
-                                found = True
-                if not found:
-                    finalResults += [bestResult]
-
-            # check that we got all the episodes we wanted first before doing a match and snatch
-            wantedEpCount = 0
-            for wantedEp in episodes:
-                for result in finalResults:
-                    if wantedEp in result.episodes and isFinalResult(result):
-                        wantedEpCount += 1
-
-            # make sure we search every provider for results unless we found everything we wanted
-            if wantedEpCount == len(episodes):
-                break
+                    # add result if its not a duplicate and
+                    found = False
+                    for i, result in enumerate(finalResults):
+                        for bestResultEp in bestResult.episodes:
+                            if bestResultEp in result.episodes:
+                                if result.quality < bestResult.quality:
+                                    finalResults.pop(i)
+                                else:
+                                    found = True
+                    if not found:
+                        finalResults += [bestResult]
+
+                # check that we got all the episodes we wanted first before doing a match and snatch
+                wantedEpCount = 0
+                for wantedEp in episodes:
+                    for result in finalResults:
+                        if wantedEp in result.episodes and isFinalResult(result):
+                            wantedEpCount += 1
+
+                # make sure we search every provider for results unless we found everything we wanted
+                if wantedEpCount == len(episodes):
+                    break
+
+        finally:
+            # stop searches that have not started yet once we have everything we wanted
+            for providerObj, future in futures:
+                future.cancel()
 
         return finalResults
 
@@ -29,12 +29,17 @@ import traceback
 import sickrage
 from sickrage.core.common import DOWNLOADED, Quality, SNATCHED, SNATCHED_PROPER, cpu_presets
 from sickrage.core.exceptions import AuthException
-from sickrage.core.helpers import remove_non_release_groups
+from sickrage.core.helpers import remove_non_release_groups, tryInt
 from sickrage.core.nameparser import InvalidNameException, InvalidShowException, NameParser
 from sickrage.core.search import pickBestResult, snatchEpisode
 from sickrage.core.tv.show.history import History
 from sickrage.providers import NZBProvider, NewznabProvider, TorrentProvider, TorrentRssProvider
 
+try:
+    from futures import TimeoutError
+except ImportError:
+    from concurrent.futures import TimeoutError
+
 
 class srProperSearcher(object):
     def __init__(self, *args, **kwargs):
@@ -76,7 +81,7 @@ class srProperSearcher(object):
 
         origThreadName = threading.currentThread().getName()
 
-        # for each provider get a list of the
+        providers = []
         for providerID, providerObj in sickrage.srCore.providersDict.sort(
                 randomize=sickrage.srCore.srConfig.RANDOMIZE_PROVIDERS).items():
             # check provider type and provider is enabled
@@ -88,12 +93,24 @@ class srProperSearcher(object):
             elif not providerObj.isEnabled:
                 continue
 
-            threading.currentThread().setName(origThreadName + " :: [" + providerObj.name + "]")
+            providers += [providerObj]
 
+        # search all providers in parallel, propers are collected in provider order so the provider a proper
+        # is taken from is the same as when searching one provider after another
+        timeout = max(1, sickrage.srCore.srConfig.PROVIDER_TIMEOUT)
+        futures = []
+        for providerObj in providers:
             sickrage.srCore.srLogger.info("Searching for any new PROPER releases from " + providerObj.name)
+            futures += [(providerObj, sickrage.srCore.SEARCHPOOL.submit(providerObj, origThreadName,
+                                                                        providerObj.find_propers, search_date))]
 
+        for providerObj, future in futures:
             try:
-                curPropers = providerObj.find_propers(search_date)
+                curPropers = sickrage.srCore.SEARCHPOOL.result(providerObj, future, timeout, timeout * len(futures))
+            except TimeoutError:
+                sickrage.srCore.srLogger.warning(
+                    "Timed out after {}s while searching ".format(timeout) + providerObj.name + ", skipping")
+                continue
             except AuthException as e:
                 sickrage.srCore.srLogger.warning("Authentication error: {}".format(e.message))
                 continue
@@ -115,16 +132,14 @@ class srProperSearcher(object):
                     x.provider = providerObj
                     propers[name] = x
 
-            threading.currentThread().setName(origThreadName)
-
         # take the list of unique propers and get it sorted by
         sortedPropers = sorted(propers.values(), key=operator.attrgetter('date'), reverse=True)
-        finalPropers = []
+        candidates = []
 
+        myParser = NameParser(False)
         for curProper in sortedPropers:
 
             try:
-                myParser = NameParser(False)
                 parse_result = myParser.parse(curProper.name)
             except InvalidNameException:
                 sickrage.srCore.srLogger.debug(
@@ -173,26 +188,24 @@ class srProperSearcher(object):
                         "Proper " + bestResult.name + " doesn't have a release group and version, ignoring it")
                     continue
 
-            # check if we actually want this proper (if it's the right quality)            
-            dbData = [x['doc'] for x in
-                      sickrage.srCore.mainDB().db.get_many('tv_episodes', bestResult.indexerid, with_doc=True)
-                      if x['doc']['season'] == bestResult.season and x['doc']['episode'] == bestResult.episode]
-            if not dbData: continue
+            candidates += [bestResult]
+
+        # downloaded and snatched episodes of the shows we found propers for
+        episodes = self._get_episodes(set(x.indexerid for x in candidates))
+
+        finalPropers = []
+        for bestResult in candidates:
+            # check if we actually want this proper (if it's the right quality)
+            episode = episodes.get((bestResult.indexerid, bestResult.season, bestResult.episode))
+            if not episode: continue
 
             # only keep the proper if we have already retrieved the same quality ep (don't get better/worse ones)
-            oldStatus, oldQuality = Quality.splitCompositeStatus(int(dbData[0]["status"]))
-            if oldStatus not in (DOWNLOADED, SNATCHED) or oldQuality != bestResult.quality:
+            oldStatus, oldQuality, oldVersion, oldRelease_group = episode
+            if oldQuality != bestResult.quality:
                 continue
 
             # check if we actually want this proper (if it's the right release group and a higher version)
             if bestResult.show.is_anime:
-                dbData = [x['doc'] for x in
-                          sickrage.srCore.mainDB.db.get_many('tv_episodes', bestResult.indexerid, with_doc=True)
-                          if x['doc']['season'] == bestResult.season and x['doc']['episode'] == bestResult.episode]
-
-                oldVersion = int(dbData[0]["version"])
-                oldRelease_group = (dbData[0]["release_group"])
-
                 if -1 < oldVersion < bestResult.version:
                     sickrage.srCore.srLogger.info(
                         "Found new anime v" + str(bestResult.version) + " to replace existing v" + str(oldVersion))
@@ -212,6 +225,28 @@ class srProperSearcher(object):
 
         return finalPropers
 
+    @staticmethod
+    def _get_episodes(indexerids):
+        """
+        Snapshot of the downloaded and snatched episodes of the given shows
+
+        :param indexerids: indexer ids of the shows
+        :return: dict of (indexerid, season, episode) -> (status, quality, version, release_group)
+        """
+        episodes = {}
+
+        for indexerid in indexerids:
+            for dbData in [x['doc'] for x in
+                           sickrage.srCore.mainDB.db.get_many('tv_episodes', indexerid, with_doc=True)]:
+                status, quality = Quality.splitCompositeStatus(int(dbData["status"]))
+                if status not in (DOWNLOADED, SNATCHED):
+                    continue
+
+                episodes[(int(indexerid), int(dbData["season"]), int(dbData["episode"]))] = (
+                    status, quality, tryInt(dbData.get("version"), -1), dbData.get("release_group"))
+
+        return episodes
+
     def _downloadPropers(self, properList):
         """
         Download proper (snatch it)
@@ -263,8 +298,6 @@ class srProperSearcher(object):
                 result.release_group = curProper.release_group
                 result.version = curProper.version
                 result.content = curProper.content
-                result.size = curProper.provider._get_size(curProper.url)
-                result.files = curProper.provider._get_files(curProper.url)
 
                 # snatch it
                 snatchEpisode(result, SNATCHED_PROPER)
@@ -27,16 +27,25 @@ import sickrage.subtitles
 from sickrage.core.common import dateTimeFormat
 from sickrage.core.helpers import findCertainShow
 
+try:
+    from futures import ThreadPoolExecutor
+except ImportError:
+    from concurrent.futures import ThreadPoolExecutor
+
 
 class srSubtitleSearcher(object):
     """
     The SubtitleSearcher will be executed every hour but will not necessarly search
     and download subtitles. Only if the defined rule is true
+
+    Episodes wanting subtitles are queued in the database by the time they may be searched again, the queue is
+    kept current by TVEpisode.saveToDB and rebuilt on the first run or after the subtitle settings change
     """
 
     def __init__(self, *args, **kwargs):
         self.name = "SUBTITLESEARCHER"
         self.amActive = False
+        self.queue_built = False
 
     def run(self, force=False):
         if self.amActive or sickrage.srCore.srConfig.DEVELOPER:
@@ -47,105 +56,170 @@ class srSubtitleSearcher(object):
         # set thread name
         threading.currentThread().setName(self.name)
 
-        if len(sickrage.subtitles.getEnabledServiceList()) < 1:
-            sickrage.srCore.srLogger.warning(
-                'Not enough services selected. At least 1 service is required to search subtitles in the background'
-            )
-            return
+        try:
+            if len(sickrage.subtitles.getEnabledServiceList()) < 1:
+                sickrage.srCore.srLogger.warning(
+                    'Not enough services selected. At least 1 service is required to search subtitles in the '
+                    'background'
+                )
+                return
 
-        sickrage.srCore.srLogger.info('Checking for subtitles')
-
-        # get episodes on which we want subtitles
-        # criteria is:
-        #  - show subtitles = 1
-        #  - episode subtitles != config wanted languages or 'und' (depends on config multi)
-        #  - search count < 2 and diff(airdate, now) > 1 week : now -> 1d
-        #  - search count < 7 and diff(airdate, now) <= 1 week : now -> 4h -> 8h -> 16h -> 1d -> 1d -> 1d
-
-        today = datetime.date.today().toordinal()
-
-        results = []
-        for s in [s['doc'] for s in sickrage.srCore.mainDB.db.all('tv_shows', with_doc=True)]:
-            for e in [e['doc'] for e in
-                      sickrage.srCore.mainDB.db.get_many('tv_episodes', s['indexer_id'], with_doc=True)
-                      if s['subtitles'] == 1
-                      and e['doc']['location'] != ''
-                      and e['doc']['subtitles'] not in sickrage.subtitles.wanted_languages()
-                      and (e['doc']['subtitles_searchcount'] <= 2 or (
-                                        e['doc']['subtitles_searchcount'] <= 7 and (today - e['doc']['airdate'])))]:
-                results += [{
-                    'show_name': s['show_name'],
-                    'showid': e['showid'],
-                    'season': e['season'],
-                    'episode': e['episode'],
-                    'status': e['status'],
-                    'subtitles': e['subtitles'],
-                    'searchcount': e['subtitles_searchcount'],
-                    'lastsearch': e['subtitles_lastsearch'],
-                    'location': e['location'],
-                    'airdate_daydiff': (today - e['airdate'])
-                }]
-
-        if len(results) == 0:
-            sickrage.srCore.srLogger.info('No subtitles to download')
-            return
+            sickrage.srCore.srLogger.info('Checking for subtitles')
+
+            if force or not self.queue_built:
+                self.update_queue()
+
+            episodes = self._get_wanted_episodes()
+            if len(episodes) == 0:
+                sickrage.srCore.srLogger.info('No subtitles to download')
+                return
+
+            self._download_subtitles(episodes)
+        finally:
+            self.amActive = False
+
+    def invalidate(self):
+        """
+        Rebuild the queue on the next run, needed when the wanted languages change
+        """
+        self.queue_built = False
+
+    def update_queue(self, shows=None):
+        """
+        Sets the next subtitle search time of every episode of the given shows, all shows if none are given
+
+        :param shows: list of show objects
+        """
+        for show in shows or list(sickrage.srCore.SHOWLIST):
+            for dbData in [x['doc'] for x in
+                           sickrage.srCore.mainDB.db.get_many('tv_episodes', show.indexerid, with_doc=True)]:
+                next_search = self.next_search(dbData, show.subtitles)
+                if dbData.get('subtitles_nextsearch', 0) != next_search:
+                    dbData['subtitles_nextsearch'] = next_search
+                    sickrage.srCore.mainDB.db.update(dbData)
+
+        if not shows:
+            self.queue_built = True
+
+    def _get_wanted_episodes(self):
+        """
+        Episodes which are due for a subtitle search, episodes that are queued but no longer due are requeued
 
-        rules = self._getRules()
-        now = datetime.datetime.now()
-        for epToSub in results:
-            if not os.path.isfile(epToSub['location']):
+        :return: list of episode objects
+        """
+        now = self.timestamp(datetime.datetime.now())
+
+        episodes = []
+        for dbData in [x['doc'] for x in
+                       sickrage.srCore.mainDB.db.get_many('tv_episodes_subtitles', start=1, end=now, with_doc=True)]:
+            showObj = findCertainShow(sickrage.srCore.SHOWLIST, int(dbData['showid']))
+
+            # airdate and settings may have changed since the episode was queued
+            next_search = self.next_search(dbData, showObj.subtitles if showObj else False)
+            if not 0 < next_search <= now:
+                dbData['subtitles_nextsearch'] = next_search
+                sickrage.srCore.mainDB.db.update(dbData)
+                continue
+
+            if not os.path.isfile(dbData['location']):
                 sickrage.srCore.srLogger.debug(
                     'Episode file does not exist, cannot download subtitles for episode %dx%d of show %s' % (
-                        epToSub['season'], epToSub['episode'], epToSub['show_name']))
+                        dbData['season'], dbData['episode'], showObj.name))
                 continue
 
-            # http://bugs.python.org/issue7980#msg221094
-            # I dont think this needs done here, but keeping to be safe
-            datetime.datetime.strptime('20110101', '%Y%m%d')
-            if (
-                        (epToSub['airdate_daydiff'] > 7 and epToSub[
-                            'searchcount'] < 2 and now - datetime.datetime.strptime(
-                            epToSub['lastsearch'], dateTimeFormat) > datetime.timedelta(
-                            hours=rules['old'][epToSub['searchcount']])) or
-                        (
-                                            epToSub['airdate_daydiff'] <= 7 and
-                                            epToSub['searchcount'] < 7 and
-                                            now - datetime.datetime.strptime(
-                                            epToSub['lastsearch'], dateTimeFormat) > datetime.timedelta
-                                        (
-                                        hours=rules['new'][epToSub['searchcount']]
-                                    )
-                        )
-            ):
-
-                sickrage.srCore.srLogger.debug('Downloading subtitles for episode %dx%d of show %s' % (
-                    epToSub['season'], epToSub['episode'], epToSub['show_name']))
-
-                showObj = findCertainShow(sickrage.srCore.SHOWLIST, int(epToSub['showid']))
-                if not showObj:
-                    sickrage.srCore.srLogger.debug('Show not found')
-                    return
-
-                epObj = showObj.getEpisode(int(epToSub["season"]), int(epToSub["episode"]))
-                if isinstance(epObj, str):
-                    sickrage.srCore.srLogger.debug('Episode not found')
-                    return
-
-                existing_subtitles = epObj.subtitles
-
-                try:
-                    epObj.downloadSubtitles()
-                except Exception as e:
-                    sickrage.srCore.srLogger.debug('Unable to find subtitles')
-                    sickrage.srCore.srLogger.debug(str(e))
-                    return
-
-                newSubtitles = frozenset(epObj.subtitles).difference(existing_subtitles)
-                if newSubtitles:
-                    sickrage.srCore.srLogger.info('Downloaded subtitles for S%02dE%02d in %s' % (
-                        epToSub["season"], epToSub["episode"], ', '.join(newSubtitles)))
+            try:
+                episodes += [showObj.getEpisode(int(dbData["season"]), int(dbData["episode"]))]
+            except Exception:
+                sickrage.srCore.srLogger.debug('Episode not found')
 
-        self.amActive = False
+        return episodes
+
+    def _download_subtitles(self, episodes):
+        """
+        Downloads subtitles for several episodes at once, each worker reuses one provider pool for the whole run
+
+        :param episodes: list of episode objects
+        """
+        local = threading.local()
+        pools = []
+        pools_lock = threading.Lock()
+
+        def get_pool():
+            if not getattr(local, 'pool', None):
+                local.pool = sickrage.subtitles.get_provider_pool()
+                with pools_lock:
+                    pools.append(local.pool)
+            return local.pool
+
+        def download(epObj):
+            sickrage.srCore.srLogger.debug('Downloading subtitles for episode %dx%d of show %s' % (
+                epObj.season, epObj.episode, epObj.show.name))
+
+            existing_subtitles = epObj.subtitles
+
+            try:
+                with epObj.lock:
+                    epObj.downloadSubtitles(pool=get_pool())
+            except Exception as e:
+                sickrage.srCore.srLogger.debug('Unable to find subtitles')
+                sickrage.srCore.srLogger.debug(str(e))
+                return
+
+            newSubtitles = frozenset(epObj.subtitles).difference(existing_subtitles)
+            if newSubtitles:
+                sickrage.srCore.srLogger.info('Downloaded subtitles for S%02dE%02d in %s' % (
+                    epObj.season, epObj.episode, ', '.join(newSubtitles)))
+
+        executor = ThreadPoolExecutor(min(max(1, sickrage.srCore.srConfig.SUBTITLES_THREADS), len(episodes)))
+
+        try:
+            list(executor.map(download, episodes))
+        finally:
+            executor.shutdown(wait=True)
+            [pool.terminate() for pool in pools]
+
+    @staticmethod
+    def timestamp(date):
+        return int((date - datetime.datetime(1970, 1, 1)).total_seconds())
+
+    @staticmethod
+    def next_search(episode, show_subtitles):
+        """
+        Time at which an episode may be searched for subtitles again, following the rules below
+        criteria is:
+         - show subtitles = 1
+         - episode has a file and is missing wanted languages
+         - search count < 2 and diff(airdate, now) > 1 week : now -> 1d
+         - search count < 7 and diff(airdate, now) <= 1 week : now -> 4h -> 8h -> 16h -> 1d -> 1d -> 1d
+
+        :param episode: episode document
+        :param show_subtitles: subtitles setting of the episode's show
+        :return: timestamp, 0 if the episode doesn't want subtitles
+        """
+        if not show_subtitles or not episode.get('location'):
+            return 0
+
+        subtitles = [x for x in (episode.get('subtitles') or '').split(',') if x]
+        if not sickrage.subtitles.get_needed_languages(subtitles):
+            return 0
+
+        rules = srSubtitleSearcher._getRules()
+        searchcount = episode.get('subtitles_searchcount') or 0
+        airdate_daydiff = datetime.date.today().toordinal() - int(episode.get('airdate') or 1)
+
+        if airdate_daydiff > 7 and searchcount < 2:
+            hours = rules['old'][searchcount]
+        elif airdate_daydiff <= 7 and searchcount < 7:
+            hours = rules['new'][searchcount]
+        else:
+            return 0
+
+        try:
+            lastsearch = datetime.datetime.strptime(episode.get('subtitles_lastsearch'), dateTimeFormat)
+        except (TypeError, ValueError):
+            return 1
+
+        return max(1, srSubtitleSearcher.timestamp(lastsearch) + hours * 3600 + 1)
 
     @staticmethod
     def _getRules():
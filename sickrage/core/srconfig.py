@@ -95,6 +95,17 @@ class srConfig(object):
         self.WEB_IPV6 = 0
         self.WEB_COOKIE_SECRET = generateCookieSecret()
         self.WEB_USE_GZIP = 1
+        self.WEB_THREADS = 10
+        self.API_THREADS = 5
+        self.SEARCH_THREADS = 5
+        self.POSTPROCESS_THREADS = 3
+        self.SUBTITLES_THREADS = 3
+        self.PROVIDER_TIMEOUT = 120
+        self.HTTP_POOL_CONNECTIONS = 10
+        self.HTTP_POOL_MAXSIZE = 10
+        self.HTTP_CACHE_SIZE = 1000
+        self.NAMEPARSER_CACHE_SIZE = 1000
+        self.SHOW_QUEUE_THREADS = 3
         self.HANDLE_REVERSE_PROXY = 0
         self.PROXY_SETTING = ""
         self.PROXY_INDEXERS = 1
@@ -1003,6 +1014,19 @@ class srConfig(object):
         self.WEB_PASSWORD = self.check_setting_str('General', 'web_password', self.WEB_PASSWORD)
         self.WEB_COOKIE_SECRET = self.check_setting_str('General', 'web_cookie_secret', self.WEB_COOKIE_SECRET)
         self.WEB_USE_GZIP = bool(self.check_setting_int('General', 'web_use_gzip', self.WEB_USE_GZIP))
+        self.WEB_THREADS = self.check_setting_int('General', 'web_threads', self.WEB_THREADS)
+        self.API_THREADS = self.check_setting_int('General', 'api_threads', self.API_THREADS)
+        self.SEARCH_THREADS = self.check_setting_int('General', 'search_threads', self.SEARCH_THREADS)
+        self.POSTPROCESS_THREADS = self.check_setting_int('General', 'postprocess_threads', self.POSTPROCESS_THREADS)
+        self.SUBTITLES_THREADS = self.check_setting_int('General', 'subtitles_threads', self.SUBTITLES_THREADS)
+        self.PROVIDER_TIMEOUT = self.check_setting_int('General', 'provider_timeout', self.PROVIDER_TIMEOUT)
+        self.HTTP_POOL_CONNECTIONS = self.check_setting_int('General', 'http_pool_connections',
+                                                            self.HTTP_POOL_CONNECTIONS)
+        self.HTTP_POOL_MAXSIZE = self.check_setting_int('General', 'http_pool_maxsize', self.HTTP_POOL_MAXSIZE)
+        self.HTTP_CACHE_SIZE = self.check_setting_int('General', 'http_cache_size', self.HTTP_CACHE_SIZE)
+        self.NAMEPARSER_CACHE_SIZE = self.check_setting_int('General', 'nameparser_cache_size',
+                                                            self.NAMEPARSER_CACHE_SIZE)
+        self.SHOW_QUEUE_THREADS = self.check_setting_int('General', 'show_queue_threads', self.SHOW_QUEUE_THREADS)
         self.SSL_VERIFY = bool(self.check_setting_int('General', 'ssl_verify', self.SSL_VERIFY))
         self.LAUNCH_BROWSER = bool(self.check_setting_int('General', 'launch_browser', self.LAUNCH_BROWSER))
         self.INDEXER_DEFAULT_LANGUAGE = self.check_setting_str('General', 'indexerDefaultLang',
@@ -1507,6 +1531,17 @@ class srConfig(object):
                 'web_password': self.WEB_PASSWORD,
                 'web_cookie_secret': self.WEB_COOKIE_SECRET,
                 'web_use_gzip': int(self.WEB_USE_GZIP),
+                'web_threads': self.WEB_THREADS,
+                'api_threads': self.API_THREADS,
+                'search_threads': self.SEARCH_THREADS,
+                'postprocess_threads': self.POSTPROCESS_THREADS,
+                'subtitles_threads': self.SUBTITLES_THREADS,
+                'provider_timeout': self.PROVIDER_TIMEOUT,
+                'http_pool_connections': self.HTTP_POOL_CONNECTIONS,
+                'http_pool_maxsize': self.HTTP_POOL_MAXSIZE,
+                'http_cache_size': self.HTTP_CACHE_SIZE,
+                'nameparser_cache_size': self.NAMEPARSER_CACHE_SIZE,
+                'show_queue_threads': self.SHOW_QUEUE_THREADS,
                 'ssl_verify': int(self.SSL_VERIFY),
                 'download_url': self.DOWNLOAD_URL,
                 'cpu_preset': self.CPU_PRESET,
@@ -1525,6 +1560,7 @@ class srConfig(object):
                 'usenet_retention': int(self.USENET_RETENTION),
                 'autopostprocessor_frequency': int(self.AUTOPOSTPROCESSOR_FREQ),
                 'dailysearch_frequency': int(self.DAILY_SEARCHER_FREQ),
+                'namecache_frequency': int(self.NAMECACHE_FREQ),
                 'backlog_frequency': int(self.BACKLOG_SEARCHER_FREQ),
                 'update_frequency': int(self.VERSION_UPDATER_FREQ),
                 'showupdate_hour': int(self.SHOWUPDATE_HOUR),
@@ -35,7 +35,10 @@ from sickrage.core.helpers import isMediaFile, tryInt, replaceExtension, \
     safe_getattr, make_dirs, moveFile, delete_empty_folders
 from sickrage.core.nameparser import NameParser, InvalidNameException, InvalidShowException
 from sickrage.core.processors.post_processor import PostProcessor
+from sickrage.core.searchers.subtitle_searcher import srSubtitleSearcher
 from sickrage.core.scene_numbering import xem_refresh, get_scene_absolute_numbering, get_scene_numbering
+from sickrage.core.tv.show.coming_episodes import ComingEpisodes
+from sickrage.core.tv.show.stats import ShowStats
 from sickrage.core.updaters import tz_updater
 from sickrage.indexers import srIndexerApi
 from sickrage.indexers.exceptions import indexer_seasonnotfound, indexer_error, indexer_episodenotfound
@@ -289,7 +292,7 @@ class TVEpisode(object):
         if save_subtitles:
             self.saveToDB()
 
-    def downloadSubtitles(self):
+    def downloadSubtitles(self, pool=None):
         if not os.path.isfile(self.location):
             sickrage.srCore.srLogger.debug("%s: Episode file doesn't exist, can't download subtitles for S%02dE%02d" %
                                            (self.show.indexerid, self.season or 0, self.episode or 0))
@@ -299,7 +302,7 @@ class TVEpisode(object):
             "%s: Downloading subtitles for S%02dE%02d" % (
                 self.show.indexerid, self.season or 0, self.episode or 0))
 
-        self.subtitles, newSubtitles = download_subtitles(self)
+        self.subtitles, newSubtitles = download_subtitles(self, pool=pool)
 
         self.subtitles_searchcount += 1 if self.subtitles_searchcount else 1
         self.subtitles_lastsearch = datetime.datetime.now().strftime(dateTimeFormat)
@@ -378,12 +381,14 @@ class TVEpisode(object):
             self.show.indexerid, self.show.name, season or 0, episode or 0))
 
         dbData = [x['doc'] for x in
-                  sickrage.srCore.mainDB.db.get_many('tv_episodes', self.show.indexerid, with_doc=True)
-                  if x['doc']['season'] == season and x['doc']['episode'] == episode]
+                  sickrage.srCore.mainDB.db.get_many('tv_episodes_season_episode',
+                                                     (self.show.indexerid, season, episode), with_doc=True)]
 
         if len(dbData) > 1:
             for ep in dbData:
                 sickrage.srCore.mainDB.db.delete(ep)
+                ShowStats.update(self.show.indexerid, old=ep)
+                ComingEpisodes.invalidate()
             return False
         elif len(dbData) == 0:
             sickrage.srCore.srLogger.debug("%s: Episode S%02dE%02d not found in the database" % (
@@ -720,9 +725,12 @@ class TVEpisode(object):
         # delete myself from the DB
         sickrage.srCore.srLogger.debug("Deleting myself from the database")
 
-        [sickrage.srCore.mainDB.db.delete(x['doc']) for x in
-         sickrage.srCore.mainDB.db.get_many('tv_episodes', self.show.indexerid, with_doc=True)
-         if x['doc']['season'] == self.season and x['doc']['episode'] == self.episode]
+        for dbData in [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes_season_episode',
+                                                                            (self.show.indexerid, self.season,
+                                                                             self.episode), with_doc=True)]:
+            sickrage.srCore.mainDB.db.delete(dbData)
+            ShowStats.update(self.show.indexerid, old=dbData)
+            ComingEpisodes.invalidate()
 
         data = sickrage.srCore.notifiersDict['trakt'].trakt_episode_data_generate([(self.season, self.episode)])
         if sickrage.srCore.srConfig.USE_TRAKT and sickrage.srCore.srConfig.TRAKT_SYNC_WATCHLIST and data:
@@ -779,16 +787,29 @@ class TVEpisode(object):
             "release_group": self.release_group
         }
 
+        # queue the episode for subtitle searches
+        tv_episode['subtitles_nextsearch'] = srSubtitleSearcher.next_search(tv_episode, self.show.subtitles)
+
         try:
             dbData = \
                 [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes', self.show.indexerid, with_doc=True)
                  if x['doc']['indexerid'] == self.indexerid][0]
 
+            oldData = dict(dbData)
             dbData.update(tv_episode)
             sickrage.srCore.mainDB.db.update(dbData)
         except:
+            oldData = None
             sickrage.srCore.mainDB.db.insert(tv_episode)
 
+        # update show statistics
+        ShowStats.update(self.show.indexerid, old=oldData, new=tv_episode)
+
+        # coming episodes only change with the status, airdate or description of an episode
+        if not oldData or any(oldData.get(x) != tv_episode.get(x) for x in
+                              ['status', 'airdate', 'season', 'episode', 'name', 'description']):
+            ComingEpisodes.invalidate()
+
     def fullPath(self):
         if self.location is None or self.location == "":
             return None
@@ -43,6 +43,8 @@ from sickrage.core.exceptions import MultipleShowObjectsException, ShowNotFoundE
 from sickrage.core.helpers import list_media_files, isMediaFile, update_anime_support, findCertainShow, tryInt, \
     safe_getattr
 from sickrage.core.nameparser import NameParser, InvalidNameException, InvalidShowException
+from sickrage.core.tv.show.coming_episodes import ComingEpisodes
+from sickrage.core.tv.show.stats import ShowStats
 from sickrage.indexers import srIndexerApi
 from sickrage.indexers.config import INDEXER_TVRAGE
 from sickrage.indexers.exceptions import indexer_seasonnotfound, indexer_attributenotfound
@@ -50,7 +52,7 @@ from sickrage.indexers.exceptions import indexer_seasonnotfound, indexer_attribu
 
 class TVShow(object):
     def __init__(self, indexer, indexerid, lang=""):
-        self.lock = threading.Lock()
+        self.lock = threading.RLock()
 
         self._indexerid = int(indexerid)
         self._indexer = int(indexer)
@@ -476,8 +478,10 @@ class TVShow(object):
 
         # if we get an anime get the real season and episode
         if self.is_anime and absolute_number and not season and not episode:
-            dbData = [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes', self.indexerid, with_doc=True)
-                      if x['doc']['absolute_number'] == absolute_number and x['doc']['season'] != 0]
+            dbData = [x['doc'] for x in
+                      sickrage.srCore.mainDB.db.get_many('tv_episodes_absolute_number',
+                                                         (self.indexerid, absolute_number), with_doc=True)
+                      if x['doc']['season'] != 0]
 
             if len(dbData) == 1:
                 episode = int(dbData[0]["episode"])
@@ -494,24 +498,25 @@ class TVShow(object):
                     "No entries for absolute number: " + str(absolute_number) + " in show: " + self.name + " found.")
                 return None
 
-        if season not in self.episodes:
-            self.episodes[season] = {}
+        # post processing workers may ask for episodes of the same show at once
+        with self.lock:
+            season_episodes = self.episodes.setdefault(season, {})
 
-        if episode not in self.episodes[season] or self.episodes[season][episode] is None:
-            if noCreate:
-                return None
+            if season_episodes.get(episode) is None:
+                if noCreate:
+                    return None
 
-            from sickrage.core.tv.episode import TVEpisode
+                from sickrage.core.tv.episode import TVEpisode
 
-            if file:
-                ep = TVEpisode(self, season, episode, file=file)
-            else:
-                ep = TVEpisode(self, season, episode)
+                if file:
+                    ep = TVEpisode(self, season, episode, file=file)
+                else:
+                    ep = TVEpisode(self, season, episode)
 
-            if ep is not None:
-                self.episodes[season][episode] = ep
+                if ep is not None:
+                    season_episodes[episode] = ep
 
-        return self.episodes[season][episode]
+            return season_episodes[episode]
 
     def should_update(self, update_date=datetime.date.today()):
         # if show status 'Ended' always update (status 'Continuing')
@@ -1138,6 +1143,7 @@ class TVShow(object):
     def deleteShow(self, full=False):
         [sickrage.srCore.mainDB.db.delete(x['doc']) for x in
          sickrage.srCore.mainDB.db.get_many('tv_episodes', self.indexerid, with_doc=True)]
+        ShowStats.delete(self.indexerid)
         [sickrage.srCore.mainDB.db.delete(x['doc']) for x in
          sickrage.srCore.mainDB.db.get_many('tv_shows', self.indexerid, with_doc=True)]
         [sickrage.srCore.mainDB.db.delete(x['doc']) for x in
@@ -1146,10 +1152,14 @@ class TVShow(object):
          sickrage.srCore.mainDB.db.get_many('xem_refresh', self.indexerid, with_doc=True)]
         [sickrage.srCore.mainDB.db.delete(x['doc']) for x in
          sickrage.srCore.mainDB.db.get_many('scene_numbering', self.indexerid, with_doc=True)]
+        ComingEpisodes.invalidate()
         action = ('delete', 'trash')[sickrage.srCore.srConfig.TRASH_REMOVE_SHOW]
 
         # remove self from show list
-        sickrage.srCore.SHOWLIST = [x for x in sickrage.srCore.SHOWLIST if int(x.indexerid) != self.indexerid]
+        sickrage.srCore.SHOWLIST.remove_show(self.indexerid)
+
+        # drop cached scene names of the show
+        sickrage.srCore.NAMECACHE.invalidate(self)
 
         # clear the cache
         image_cache_dir = os.path.join(sickrage.CACHE_DIR, 'images')
@@ -1337,6 +1347,8 @@ class TVShow(object):
         except RecordNotFound:
             sickrage.srCore.mainDB.db.insert(tv_show)
 
+        ComingEpisodes.invalidate()
+
         update_anime_support()
 
         if self.imdbid and self.imdb_info:
@@ -1409,8 +1421,9 @@ class TVShow(object):
             sickrage.srCore.srLogger.debug("Don't want this quality, ignoring found episode")
             return False
 
-        dbData = [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes', self.indexerid, with_doc=True)
-                  if x['doc']['season'] == season and x['doc']['episode'] == episode]
+        dbData = [x['doc'] for x in
+                  sickrage.srCore.mainDB.db.get_many('tv_episodes_season_episode', (self.indexerid, season, episode),
+                                                     with_doc=True)]
 
         if not dbData or not len(dbData):
             sickrage.srCore.srLogger.debug("Unable to find a matching episode in database, ignoring found episode")
@@ -19,11 +19,12 @@
 from __future__ import unicode_literals
 
 import datetime
+import threading
 
 import sickrage
 from sickrage.core.common import Quality, get_quality_string, WANTED, UNAIRED, timeFormat, dateFormat
 from sickrage.core.helpers.srdatetime import srDateTime
-from sickrage.core.updaters.tz_updater import parse_date_time
+from sickrage.core.updaters.tz_updater import parse_date_times
 
 
 class ComingEpisodes:
@@ -40,9 +41,20 @@ class ComingEpisodes:
         'show': (lambda a, b: cmp((a['show_name'], a['localtime']), (b['show_name'], b['localtime']))),
     }
 
+    _cache = {}
+    _cache_lock = threading.RLock()
+
     def __init__(self):
         pass
 
+    @classmethod
+    def invalidate(cls):
+        """
+        Drops the cached coming episodes, called when episode statuses or show details change
+        """
+        with cls._cache_lock:
+            cls._cache.clear()
+
     @staticmethod
     def get_coming_episodes(categories, sort, group, paused=False):
         """
@@ -61,6 +73,30 @@ class ComingEpisodes:
         if sort not in ComingEpisodes.sorts.keys():
             sort = 'date'
 
+        # results are cached until an episode or show changes or the day rolls over
+        cache_key = (datetime.date.today().toordinal(), tuple(categories), sort, group, paused,
+                     sickrage.srCore.srConfig.COMING_EPS_MISSED_RANGE, sickrage.srCore.srConfig.FUZZY_DATING,
+                     sickrage.srCore.srConfig.DATE_PRESET, sickrage.srCore.srConfig.TIME_PRESET,
+                     sickrage.srCore.srConfig.TIMEZONE_DISPLAY)
+
+        with ComingEpisodes._cache_lock:
+            if cache_key not in ComingEpisodes._cache:
+                # drop results of previous days
+                if any(key[0] != cache_key[0] for key in ComingEpisodes._cache):
+                    ComingEpisodes._cache.clear()
+
+                ComingEpisodes._cache[cache_key] = ComingEpisodes._get_coming_episodes(categories, sort, group,
+                                                                                       paused)
+
+            results = ComingEpisodes._cache[cache_key]
+
+        if not group:
+            return [dict(result) for result in results]
+
+        return dict((category, [dict(result) for result in results[category]]) for category in results)
+
+    @staticmethod
+    def _get_coming_episodes(categories, sort, group, paused):
         today = datetime.date.today().toordinal()
         next_week = (datetime.date.today() + datetime.timedelta(days=7)).toordinal()
 
@@ -75,89 +111,56 @@ class ComingEpisodes:
                          Quality.ARCHIVED + \
                          Quality.IGNORED
 
+        later_qualities_list = Quality.DOWNLOADED + \
+                               Quality.SNATCHED + \
+                               Quality.SNATCHED_BEST + \
+                               Quality.SNATCHED_PROPER
+
+        shows = dict((s['doc']['indexer_id'], s['doc']) for s in
+                     sickrage.srCore.mainDB.db.all('tv_shows', with_doc=True))
+
+        # single pass over the episodes that aired recently or later, in airdate order
+        soon, later, missed = [], [], []
+        for e in [e['doc'] for e in
+                  sickrage.srCore.mainDB.db.get_many('tv_episodes_airdate_order', start=recently, with_doc=True)]:
+            if e['season'] == 0 or e['showid'] not in shows:
+                continue
+
+            if today <= e['airdate'] < next_week:
+                if e['status'] not in qualities_list:
+                    soon += [(shows[e['showid']], e)]
+            elif e['airdate'] >= next_week:
+                if e['status'] not in later_qualities_list:
+                    later += [(shows[e['showid']], e)]
+            elif e['status'] in [WANTED, UNAIRED]:
+                missed += [(shows[e['showid']], e)]
+
+        done_shows_list = [int(e['showid']) for s, e in soon]
+
         results = []
-        for s in [s['doc'] for s in sickrage.srCore.mainDB.db.all('tv_shows', with_doc=True)]:
-            for e in [e['doc'] for e in
-                      sickrage.srCore.mainDB.db.get_many('tv_episodes', s['indexer_id'], with_doc=True)
-                      if e['doc']['season'] != 0
-                      and today <= e['doc']['airdate'] < next_week
-                      and e['doc']['status'] not in qualities_list]:
-                results += [{
-                    'airdate': e['airdate'],
-                    'airs': s['airs'],
-                    'description': e['description'],
-                    'episode': e['episode'],
-                    'imdb_id': s['imdb_id'],
-                    'indexer': e['indexer'],
-                    'indexer_id': s['indexer_id'],
-                    'name': e['name'],
-                    'network': s['network'],
-                    'paused': s['paused'],
-                    'quality': s['quality'],
-                    'runtime': s['runtime'],
-                    'season': e['season'],
-                    'show_name': s['show_name'],
-                    'showid': e['showid'],
-                    'status': s['status']
-                }]
-
-        done_shows_list = [int(result['showid']) for result in results]
-
-        for s in [s['doc'] for s in sickrage.srCore.mainDB.db.all('tv_shows', with_doc=True)]:
-            for e in [e['doc'] for e in
-                      sickrage.srCore.mainDB.db.get_many('tv_episodes', s['indexer_id'], with_doc=True)
-                      if e['doc']['season'] != 0
-                      and e['doc']['showid'] not in done_shows_list
-                      and e['doc']['airdate'] >= next_week
-                      and e['doc'][
-                            'status'] not in Quality.DOWNLOADED + Quality.SNATCHED + Quality.SNATCHED_BEST + Quality.SNATCHED_PROPER]:
-                results += [{
-                    'airdate': e['airdate'],
-                    'airs': s['airs'],
-                    'description': e['description'],
-                    'episode': e['episode'],
-                    'imdb_id': s['imdb_id'],
-                    'indexer': e['indexer'],
-                    'indexer_id': s['indexer_id'],
-                    'name': e['name'],
-                    'network': s['network'],
-                    'paused': s['paused'],
-                    'quality': s['quality'],
-                    'runtime': s['runtime'],
-                    'season': e['season'],
-                    'show_name': s['show_name'],
-                    'showid': e['showid'],
-                    'status': s['status']
-                }]
-
-        for s in [s['doc'] for s in sickrage.srCore.mainDB.db.all('tv_shows', with_doc=True)]:
-            for e in [e['doc'] for e in
-                      sickrage.srCore.mainDB.db.get_many('tv_episodes', s['indexer_id'], with_doc=True)
-                      if e['doc']['season'] != 0
-                      and today > e['doc']['airdate'] >= recently
-                      and e['doc']['status'] in [WANTED, UNAIRED] and e['doc']['status'] not in qualities_list]:
-                results += [{
-                    'airdate': e['airdate'],
-                    'airs': s['airs'],
-                    'description': e['description'],
-                    'episode': e['episode'],
-                    'imdb_id': s['imdb_id'],
-                    'indexer': e['indexer'],
-                    'indexer_id': s['indexer_id'],
-                    'name': e['name'],
-                    'network': s['network'],
-                    'paused': s['paused'],
-                    'quality': s['quality'],
-                    'runtime': s['runtime'],
-                    'season': e['season'],
-                    'show_name': s['show_name'],
-                    'showid': e['showid'],
-                    'status': s['status']
-                }]
-
-        for index, item in enumerate(results):
-            results[index]['localtime'] = srDateTime.convert_to_setting(
-                parse_date_time(item['airdate'], item['airs'], item['network']))
+        for s, e in soon + [(s, e) for s, e in later if e['showid'] not in done_shows_list] + missed:
+            results += [{
+                'airdate': e['airdate'],
+                'airs': s['airs'],
+                'description': e['description'],
+                'episode': e['episode'],
+                'imdb_id': s['imdb_id'],
+                'indexer': e['indexer'],
+                'indexer_id': s['indexer_id'],
+                'name': e['name'],
+                'network': s['network'],
+                'paused': s['paused'],
+                'quality': s['quality'],
+                'runtime': s['runtime'],
+                'season': e['season'],
+                'show_name': s['show_name'],
+                'showid': e['showid'],
+                'status': s['status']
+            }]
+
+        for item, localtime in zip(results, parse_date_times(
+                [(item['airdate'], item['airs'], item['network']) for item in results])):
+            item['localtime'] = srDateTime.convert_to_setting(localtime)
 
         results.sort(ComingEpisodes.sorts[sort])
 
@@ -19,6 +19,7 @@
 from __future__ import unicode_literals
 
 import re
+import threading
 import urllib
 from datetime import datetime
 from datetime import timedelta
@@ -222,6 +223,18 @@ class History:
 
 
 class FailedHistory(object):
+    # names of failed releases, a name missing from this set has never failed so no database read is needed
+    failed_releases = None
+    failed_releases_lock = threading.Lock()
+
+    @staticmethod
+    def _failedReleases():
+        with FailedHistory.failed_releases_lock:
+            if FailedHistory.failed_releases is None:
+                FailedHistory.failed_releases = set(
+                    x['doc']['release'] for x in sickrage.srCore.failedDB.db.all('failed', with_doc=True))
+            return FailedHistory.failed_releases
+
     @staticmethod
     def prepareFailedName(release):
         """Standardizes release name for failed DB"""
@@ -243,8 +256,7 @@ class FailedHistory(object):
 
         release = FailedHistory.prepareFailedName(release)
 
-        dbData = [x['doc'] for x in sickrage.srCore.failedDB.db.all('history', with_doc=True) if
-                  x['doc']['release'] == release]
+        dbData = [x['doc'] for x in sickrage.srCore.failedDB.db.get_many('history_release', release, with_doc=True)]
 
         if len(dbData) == 0:
             sickrage.srCore.srLogger.warning("{}, Release not found in snatch history.".format(release))
@@ -275,6 +287,7 @@ class FailedHistory(object):
                 'size': size,
                 'provider': provider
             })
+            FailedHistory._failedReleases().add(release)
 
         FailedHistory.deleteLoggedSnatch(release, size, provider)
 
@@ -283,8 +296,9 @@ class FailedHistory(object):
     @staticmethod
     def logSuccess(release):
         release = FailedHistory.prepareFailedName(release)
-        for dbData in [x['doc'] for x in sickrage.srCore.failedDB.db.all('history', with_doc=True)
-                       if x['doc']['release'] == release]: sickrage.srCore.failedDB.db.delete(dbData)
+        for dbData in [x['doc'] for x in
+                       sickrage.srCore.failedDB.db.get_many('history_release', release, with_doc=True)]:
+            sickrage.srCore.failedDB.db.delete(dbData)
 
     @staticmethod
     def hasFailed(release, size, provider="%"):
@@ -302,17 +316,23 @@ class FailedHistory(object):
         """
 
         release = FailedHistory.prepareFailedName(release)
-        dbData = [x['doc'] for x in sickrage.srCore.failedDB.db.get_many('failed', release, with_doc=True)
-                  if all([x['doc']['size'] == size, x['doc']['provider'] == provider])]
+        if release not in FailedHistory._failedReleases():
+            return False
+
+        dbData = [x['doc'] for x in
+                  sickrage.srCore.failedDB.db.get_many('failed_release_size_provider', (release, size, provider),
+                                                       with_doc=True)
+                  if all([x['doc']['release'] == release, x['doc']['size'] == size,
+                          x['doc']['provider'] == provider])]
 
         return len(dbData) > 0
 
     @staticmethod
     def revertFailedEpisode(epObj):
         """Restore the episodes of a failed download to their original state"""
-        dbData = [x['doc'] for x in sickrage.srCore.failedDB.db.all('history', with_doc=True)
-                  if x['doc']['showid'] == epObj.show.indexerid
-                  and x['doc']['season'] == epObj.season]
+        dbData = [x['doc'] for x in
+                  sickrage.srCore.failedDB.db.get_many('history', epObj.show.indexerid, with_doc=True)
+                  if x['doc']['season'] == epObj.season]
 
         history_eps = dict([(res["episode"], res) for res in dbData])
 
@@ -394,7 +414,9 @@ class FailedHistory(object):
         :param provider: Provider to delete it from
         """
         release = FailedHistory.prepareFailedName(release)
-        for dbData in [x['doc'] for x in sickrage.srCore.failedDB.db.all('history', with_doc=True)
+        for dbData in [x['doc'] for x in
+                       sickrage.srCore.failedDB.db.get_many('history_release_size_provider', (release, size, provider),
+                                                            with_doc=True)
                        if x['doc']['release'] == release
                        and x['doc']['size'] == size
                        and x['doc']['provider'] == provider]: sickrage.srCore.failedDB.db.delete(dbData)
@@ -403,8 +425,10 @@ class FailedHistory(object):
     def trimHistory():
         """Trims history table to 1 month of history from today"""
         date = str((datetime.today() - timedelta(days=30)).strftime(History.date_format))
-        for dbData in [x['doc'] for x in sickrage.srCore.failedDB.db.all('history', with_doc=True) if
-                       x['doc']['date'] < date]:
+        for dbData in [x['doc'] for x in
+                       sickrage.srCore.failedDB.db.get_many('history_date', start=None, end=date, inclusive_end=False,
+                                                            with_doc=True)
+                       if x['doc']['date'] < date]:
             sickrage.srCore.failedDB.db.delete(dbData)
 
     @staticmethod
@@ -419,7 +443,9 @@ class FailedHistory(object):
 
         # Clear old snatches for this release if any exist
         dbData = sorted(
-            [x['doc'] for x in sickrage.srCore.failedDB.db.get_many('history', epObj.show.indexerid, with_doc=True)
+            [x['doc'] for x in
+             sickrage.srCore.failedDB.db.get_many('history_episode', (epObj.show.indexerid, epObj.season, epObj.episode),
+                                                  with_doc=True)
              if x['doc']['season'] == epObj.season
              and x['doc']['episode'] == epObj.episode], key=lambda d: d['date'])
 
@@ -427,7 +453,9 @@ class FailedHistory(object):
 
         # Search for release in snatch history
         for dbData in [x['doc'] for x in
-                       sickrage.srCore.failedDB.db.get_many('history', epObj.show.indexerid, with_doc=True)
+                       sickrage.srCore.failedDB.db.get_many('history_episode',
+                                                            (epObj.show.indexerid, epObj.season, epObj.episode),
+                                                            with_doc=True)
                        if x['doc']['season'] == epObj.season
                        and x['doc']['episode'] == epObj.episode]:
 
@@ -436,7 +464,8 @@ class FailedHistory(object):
             date = dbData["date"]
 
             # Clear any incomplete snatch records for this release if any exist
-            for x in [x['doc'] for x in sickrage.srCore.failedDB.db.all('history', with_doc=True)]:
+            for x in [x['doc'] for x in
+                      sickrage.srCore.failedDB.db.get_many('history_release', release, with_doc=True)]:
                 if x['release'] == release and x['date'] != date: sickrage.srCore.failedDB.db.delete(x)
 
             # Found a previously failed release
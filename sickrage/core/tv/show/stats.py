@@ -0,0 +1,309 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SickRage.
+#
+# SickRage is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SickRage is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SickRage.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+import bisect
+import datetime
+import threading
+
+import sickrage
+from sickrage.core.common import Quality, SKIPPED, WANTED, FAILED, UNAIRED
+
+
+class ShowStats(object):
+    """
+    Episode statistics for each show kept in the tv_stats table and updated as episodes are saved or deleted,
+    so the home page and api read one small document per show instead of scanning every episode.
+
+    statuses: episode count per status for all non-special episodes
+    aired: episode count per status for episodes with a season, episode and airdate
+    upcoming: sorted airdates per status of those episodes that had not aired yet when they were counted
+    recent: the latest airdates of those episodes that had aired when they were counted, None when unknown
+    file_size: total file size of those episodes
+    """
+
+    # bumped when the document layout changes, outdated statistics are rebuilt on startup
+    version = 2
+
+    # number of latest airdates kept for the previous airdate of a show
+    max_recent = 5
+
+    lock = threading.RLock()
+
+    @classmethod
+    def _new(cls, showid):
+        return {'_t': 'tv_stats', 'showid': showid, 'version': cls.version, 'statuses': {}, 'aired': {},
+                'upcoming': {}, 'recent': [], 'file_size': 0}
+
+    @staticmethod
+    def _today():
+        return datetime.date.today().toordinal()
+
+    @classmethod
+    def _add_recent(cls, stats, airdate):
+        if stats['recent'] is None:
+            return
+
+        # airdates older than every kept one are dropped once older ones were dropped before
+        if stats.get('recent_truncated') and stats['recent'] and airdate < stats['recent'][0]:
+            return
+
+        bisect.insort(stats['recent'], airdate)
+        if len(stats['recent']) > cls.max_recent:
+            del stats['recent'][0]
+            stats['recent_truncated'] = True
+
+    @classmethod
+    def _prune(cls, stats, today):
+        """
+        Moves the airdates of episodes that aired since they were counted from upcoming to recent
+        """
+        for status, airdates in stats['upcoming'].items():
+            i = bisect.bisect_left(airdates, today)
+            if status != UNAIRED:
+                for airdate in airdates[:i]:
+                    cls._add_recent(stats, airdate)
+
+            del airdates[:i]
+            if not airdates:
+                del stats['upcoming'][status]
+
+    @classmethod
+    def _apply(cls, stats, episode, sign, today):
+        season = int(episode.get('season') or 0)
+        number = int(episode.get('episode') or 0)
+        airdate = int(episode.get('airdate') or 0)
+        status = int(episode.get('status') or 0)
+
+        if season != 0:
+            stats['statuses'][status] = stats['statuses'].get(status, 0) + sign
+            if stats['statuses'][status] <= 0:
+                del stats['statuses'][status]
+
+        if season > 0 and number > 0 and airdate > 1:
+            stats['aired'][status] = stats['aired'].get(status, 0) + sign
+            if stats['aired'][status] <= 0:
+                del stats['aired'][status]
+
+            upcoming = stats['upcoming'].get(status, [])
+            if sign > 0 and airdate >= today:
+                bisect.insort(stats['upcoming'].setdefault(status, []), airdate)
+            elif sign > 0 and status != UNAIRED:
+                cls._add_recent(stats, airdate)
+            elif sign < 0 and airdate in upcoming:
+                upcoming.remove(airdate)
+                if not upcoming:
+                    del stats['upcoming'][status]
+            elif sign < 0 and status != UNAIRED and stats['recent'] and airdate in stats['recent']:
+                stats['recent'].remove(airdate)
+                if not stats['recent'] and stats.get('recent_truncated'):
+                    # older airdates were dropped, the previous airdate is rebuilt on the next read
+                    stats['recent'] = None
+
+            stats['file_size'] += sign * int(episode.get('file_size') or 0)
+
+    @classmethod
+    def _build(cls, showid, episodes):
+        stats = cls._new(showid)
+        today = cls._today()
+
+        for episode in episodes:
+            cls._apply(stats, episode, 1, today)
+
+        return stats
+
+    @classmethod
+    def _load(cls, showid):
+        for stats in [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_stats', showid, with_doc=True)]:
+            return stats
+
+        return cls._new(showid)
+
+    @classmethod
+    def _save(cls, stats):
+        if '_id' in stats:
+            sickrage.srCore.mainDB.db.update(stats)
+        else:
+            sickrage.srCore.mainDB.db.insert(stats)
+
+    @classmethod
+    def refresh(cls, showid):
+        """
+        Rebuilds the statistics of a show from its episodes
+        """
+        with cls.lock:
+            stats = cls._build(showid, [x['doc'] for x in
+                                        sickrage.srCore.mainDB.db.get_many('tv_episodes', showid, with_doc=True)])
+            for doc in [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_stats', showid, with_doc=True)]:
+                stats.update({'_id': doc['_id'], '_rev': doc['_rev']})
+
+            cls._save(stats)
+            return stats
+
+    @classmethod
+    def get(cls, showid):
+        stats = cls._load(showid)
+        if stats['recent'] is None:
+            stats = cls.refresh(showid)
+
+        return stats
+
+    @classmethod
+    def all(cls):
+        show_stats = dict((x['doc']['showid'], x['doc']) for x in
+                          sickrage.srCore.mainDB.db.all('tv_stats', with_doc=True))
+
+        for showid in [showid for showid, stats in show_stats.items() if stats['recent'] is None]:
+            show_stats[showid] = cls.refresh(showid)
+
+        return show_stats
+
+    @classmethod
+    def update(cls, showid, old=None, new=None):
+        """
+        Moves an episode between statistics buckets
+
+        :param showid: show indexer id
+        :param old: episode document before the change, None for new episodes
+        :param new: episode document after the change, None for deleted episodes
+        """
+        if old and new and all(old.get(x) == new.get(x) for x in
+                               ['season', 'episode', 'airdate', 'status', 'file_size']):
+            return
+
+        with cls.lock:
+            stats = cls._load(showid)
+            today = cls._today()
+
+            cls._prune(stats, today)
+            if old: cls._apply(stats, old, -1, today)
+            if new: cls._apply(stats, new, 1, today)
+
+            cls._save(stats)
+
+    @classmethod
+    def delete(cls, showid):
+        with cls.lock:
+            [sickrage.srCore.mainDB.db.delete(x['doc']) for x in
+             sickrage.srCore.mainDB.db.get_many('tv_stats', showid, with_doc=True)]
+
+    @classmethod
+    def rebuild(cls):
+        """
+        Rebuilds the statistics of every show from the episodes table
+        """
+        with cls.lock:
+            show_episodes = dict((x['doc']['indexer_id'], []) for x in
+                                 sickrage.srCore.mainDB.db.all('tv_shows', with_doc=True))
+            for episode in [x['doc'] for x in sickrage.srCore.mainDB.db.all('tv_episodes', with_doc=True)]:
+                show_episodes.setdefault(episode['showid'], []).append(episode)
+
+            [sickrage.srCore.mainDB.db.delete(x['doc']) for x in
+             sickrage.srCore.mainDB.db.all('tv_stats', with_doc=True)]
+
+            for showid, episodes in show_episodes.items():
+                sickrage.srCore.mainDB.db.insert(cls._build(showid, episodes))
+
+        sickrage.srCore.srLogger.debug("Rebuilt episode statistics for {} shows".format(len(show_episodes)))
+
+        return len(show_episodes)
+
+    @classmethod
+    def check(cls):
+        """
+        Rebuilds the statistics when a show has none or they were stored in an older layout
+
+        :return: True if the statistics were rebuilt
+        """
+        stats_versions = dict((x['doc']['showid'], x['doc'].get('version')) for x in
+                              sickrage.srCore.mainDB.db.all('tv_stats', with_doc=True))
+
+        if any(version != cls.version for version in stats_versions.values()) or \
+                any(x['doc']['indexer_id'] not in stats_versions for x in
+                    sickrage.srCore.mainDB.db.all('tv_shows', with_doc=True)):
+            cls.rebuild()
+            return True
+
+        return False
+
+    @staticmethod
+    def count(stats, statuses, until=None):
+        """
+        Counts aired episodes in the given statuses, when until is given only those aired on or before it
+        """
+        if until is None:
+            return sum(stats['aired'].get(status, 0) for status in statuses)
+
+        return sum(stats['aired'].get(status, 0) - len(stats['upcoming'].get(status, [])) +
+                   bisect.bisect_right(stats['upcoming'].get(status, []), until) for status in statuses)
+
+    @staticmethod
+    def airs_next(stats, today):
+        """
+        Next airdate on or after today of the wanted and unaired episodes
+        """
+        airs_next = [airdates[bisect.bisect_left(airdates, today)] for airdates in
+                     [stats['upcoming'].get(status, []) for status in (WANTED, UNAIRED)]
+                     if bisect.bisect_left(airdates, today) < len(airdates)]
+
+        return min(airs_next) if airs_next else None
+
+    @staticmethod
+    def airs_prev(stats, today):
+        """
+        Latest airdate before today of the episodes that are not unaired
+        """
+        airs_prev = [airdates[bisect.bisect_left(airdates, today) - 1] for status, airdates in
+                     stats['upcoming'].items() if status != UNAIRED and bisect.bisect_left(airdates, today)]
+        airs_prev += [airdate for airdate in stats['recent'] or [] if airdate < today][-1:]
+
+        return max(airs_prev) if airs_prev else None
+
+    @classmethod
+    def home(cls):
+        """
+        Statistics shown for each show on the home page
+
+        :return: tuple of per show statistics and the progress bar scale
+        """
+        show_stat = {}
+
+        today = cls._today()
+
+        status_quality = Quality.SNATCHED + Quality.SNATCHED_PROPER + Quality.SNATCHED_BEST
+        status_download = Quality.DOWNLOADED + Quality.ARCHIVED
+
+        max_download_count = 1000
+
+        for showid, stats in cls.all().items():
+            show_stat[showid] = {
+                'ep_snatched': cls.count(stats, status_quality),
+                'ep_downloaded': cls.count(stats, status_download),
+                'ep_total': cls.count(stats, status_quality + status_download) +
+                            cls.count(stats, [SKIPPED, WANTED, FAILED], today),
+                'ep_airs_next': cls.airs_next(stats, today),
+                'ep_airs_prev': cls.airs_prev(stats, today),
+            }
+
+            if show_stat[showid]['ep_total'] > max_download_count:
+                max_download_count = show_stat[showid]['ep_total']
+
+        max_download_count *= 100
+
+        return show_stat, max_download_count
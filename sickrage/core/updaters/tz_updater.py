@@ -29,6 +29,8 @@ import sickrage
 from sickrage.core.helpers import tryInt
 
 network_dict = {}
+network_tz_cache = {}
+airs_cache = {}
 time_regex = re.compile(r'(?P<hour>\d{1,2})(?:[:.]?(?P<minute>\d{2})?)? ?(?P<meridiem>[PA]\.? ?M?)?\b', re.I)
 sr_timezone = tz.tzwinlocal() if tz.tzwinlocal else tz.tzlocal()
 
@@ -95,10 +97,20 @@ def load_network_dict():
     Return network timezones from db
     """
 
-    global network_dict
+    global network_dict, network_tz_cache
     network_dict = dict([(x['doc']['network_name'], x['doc']['timezone']) for x in
                          sickrage.srCore.cacheDB.db.all('network_timezones', with_doc=True)])
 
+    # resolve each timezone once, networks mostly share a handful of zones
+    zones = {}
+    for zone in set(network_dict.values()):
+        try:
+            zones[zone] = tz.gettz(zone) or sr_timezone
+        except Exception:
+            zones[zone] = sr_timezone
+
+    network_tz_cache = dict([(network, zones[zone]) for network, zone in network_dict.items()])
+
 
 # get timezone of a network or return default timezone
 def get_network_timezone(network):
@@ -111,31 +123,24 @@ def get_network_timezone(network):
     if network is None:
         return sr_timezone
 
-    try:
-        return tz.gettz(network_dict[network]) or sr_timezone
-    except Exception:
-        return sr_timezone
+    return network_tz_cache.get(network, sr_timezone)
 
 
-# parse date and time string into local time
-def parse_date_time(d, t, network, dateOnly=False):
+# parse airs string into hour and minute
+def parse_airs(t):
     """
-    Parse date and time string into local time
-    :param d: date string
+    Parse a show airs string into hour and minute, results are cached per airs string
+
     :param t: time string
-    :param network: network to use as base
-    :return: datetime object containing local time
+    :return: tuple of hour and minute
     """
-
-    if not network_dict:
-        load_network_dict()
-
-    parsed_time = time_regex.search(t)
-    network_tz = get_network_timezone(network)
+    if t in airs_cache:
+        return airs_cache[t]
 
     hr = 0
     m = 0
 
+    parsed_time = time_regex.search(t)
     if parsed_time:
         hr = tryInt(parsed_time.group('hour'))
         m = tryInt(parsed_time.group('minute'))
@@ -151,10 +156,51 @@ def parse_date_time(d, t, network, dateOnly=False):
         hr = hr if 0 <= hr <= 23 else 0
         m = m if 0 <= m <= 59 else 0
 
+    airs_cache[t] = (hr, m)
+    return hr, m
+
+
+# parse date and time string into local time
+def parse_date_time(d, t, network, dateOnly=False):
+    """
+    Parse date and time string into local time
+    :param d: date string
+    :param t: time string
+    :param network: network to use as base
+    :return: datetime object containing local time
+    """
+
+    if not network_dict:
+        load_network_dict()
+
+    hr, m = parse_airs(t)
+    network_tz = get_network_timezone(network)
+
     result = datetime.fromordinal(max(tryInt(d), 1))
 
     return result.replace(hour=hr, minute=m, tzinfo=network_tz) if not dateOnly else result.replace(tzinfo=network_tz)
 
 
+# parse many date and time strings into local time
+def parse_date_times(items, dateOnly=False):
+    """
+    Parse (date, time, network) tuples into local time
+
+    :param items: iterable of (date string, time string, network) tuples
+    :return: list of datetime objects containing local time
+    """
+
+    if not network_dict:
+        load_network_dict()
+
+    results = []
+    for d, t, network in items:
+        hr, m = parse_airs(t) if not dateOnly else (0, 0)
+        results.append(datetime.fromordinal(max(tryInt(d), 1)).replace(hour=hr, minute=m,
+                                                                       tzinfo=get_network_timezone(network)))
+
+    return results
+
+
 def test_timeformat(t):
     return time_regex.search(t) is not None
@@ -23,48 +23,134 @@ import os
 import shelve
 import ssl
 import threading
+import time
 import urllib2
-from contextlib import closing
+from collections import OrderedDict
+from contextlib import contextmanager
 
 import certifi
 import cfscrape as cfscrape
 import requests
 from cachecontrol import CacheControlAdapter
+from requests.adapters import HTTPAdapter
 
 import sickrage
 from sickrage.core.helpers import chmodAsParent, remove_file_failed
 
 
 class DBCache(object):
-    def __init__(self, filename):
+    """
+    HTTP response cache backed by a single shelve store that stays open for the life of the session, the oldest
+    responses are evicted once more than maxsize are stored.
+    """
+
+    def __init__(self, filename, maxsize=1000):
         self.filename = filename
-        self.lock = threading.Lock()
+        self.maxsize = maxsize
+        self.lock = threading.RLock()
+        self.cache = None
+        self.keys = OrderedDict()
+
+    def _open(self):
+        if self.cache is None:
+            try:
+                self.cache = shelve.open(self.filename)
+                self.keys = OrderedDict((key, None) for key in self.cache.keys())
+            except Exception:
+                # start over with an empty store if the existing one is unreadable
+                self.cache = shelve.open(self.filename, flag='n')
+                self.keys = OrderedDict()
+
+        return self.cache
 
     def get(self, key):
-        with closing(shelve.open(self.filename)) as cache:
+        with self.lock:
+            cache = self._open()
             if key in cache:
                 return cache.get(key)
 
     def set(self, key, value):
         with self.lock:
-            with closing(shelve.open(self.filename)) as cache:
-                cache.setdefault(key, value)
+            cache = self._open()
+            cache[key] = value
+
+            self.keys.pop(key, None)
+            self.keys[key] = None
+            while len(self.keys) > self.maxsize:
+                del cache[self.keys.popitem(last=False)[0]]
+
+            cache.sync()
 
     def delete(self, key):
         with self.lock:
-            with closing(shelve.open(self.filename)) as cache:
-                if key in cache:
-                    del cache[key]
+            cache = self._open()
+            if key in cache:
+                del cache[key]
+                cache.sync()
+            self.keys.pop(key, None)
 
     def clear(self):
         with self.lock:
-            with closing(shelve.open(self.filename)) as cache:
-                cache.clear()
+            cache = self._open()
+            cache.clear()
+            cache.sync()
+            self.keys.clear()
+
+    def close(self):
+        with self.lock:
+            if self.cache is not None:
+                self.cache.close()
+                self.cache = None
 
 
 class srSession(cfscrape.CloudflareScraper):
     def __init__(self):
         super(srSession, self).__init__()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.cache_adapter = None
+        self.http_adapter = None
+
+    def _setup_adapters(self):
+        """
+        Mounts the connection pooled adapters once, pool sizes are read from the config on first use
+        """
+        with self.lock:
+            if self.cache_adapter:
+                return
+
+            pool_connections = max(1, sickrage.srCore.srConfig.HTTP_POOL_CONNECTIONS)
+            pool_maxsize = max(1, sickrage.srCore.srConfig.HTTP_POOL_MAXSIZE)
+
+            self.http_adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            self.cache_adapter = CacheControlAdapter(
+                DBCache(os.path.abspath(os.path.join(sickrage.DATA_DIR, 'sessions.db')),
+                        max(1, sickrage.srCore.srConfig.HTTP_CACHE_SIZE)),
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize)
+
+            self.mount('http://', self.cache_adapter)
+            self.mount('https://', self.cache_adapter)
+
+    @contextmanager
+    def deadline(self, seconds):
+        """
+        Requests made by the current thread inside the block time out once the given seconds have passed
+        """
+        self.local.deadline = time.time() + seconds
+        try:
+            yield
+        finally:
+            self.local.deadline = None
+
+    def get_adapter(self, url):
+        adapter = super(srSession, self).get_adapter(url)
+
+        # uncached requests share the same connection pools minus the cache
+        if adapter is self.cache_adapter and not getattr(self.local, 'cache', True):
+            return self.http_adapter
+
+        return adapter
 
     def request(self, method, url, headers=None, params=None, proxies=None, cache=True, verify=False, *args, **kwargs):
         if headers is None: headers = {}
@@ -90,11 +176,17 @@ class srSession(cfscrape.CloudflareScraper):
             proxies.update({"http": address, "https": address})
             headers.update({'Referer': address})
 
-        # setup caching adapter
-        if cache:
-            adapter = CacheControlAdapter(DBCache(os.path.abspath(os.path.join(sickrage.DATA_DIR, 'sessions.db'))))
-            self.mount('http://', adapter)
-            self.mount('https://', adapter)
+        # requests made within a deadline may only take the time that is left of it
+        deadline = getattr(self.local, 'deadline', None)
+        if deadline:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise requests.exceptions.Timeout("Deadline exceeded requesting url: '{}'".format(url))
+            kwargs['timeout'] = min(kwargs.get('timeout') or remaining, remaining)
+
+        # setup pooled and caching adapters
+        self._setup_adapters()
+        self.local.cache = cache
 
         # get web response
         response = super(srSession, self).request(
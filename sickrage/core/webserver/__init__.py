@@ -23,6 +23,8 @@ import shutil
 import socket
 import threading
 
+from concurrent.futures import ThreadPoolExecutor
+from mako.lookup import TemplateLookup
 from tornado.httpserver import HTTPServer
 from tornado.web import Application, RedirectHandler, StaticFileHandler
 
@@ -55,6 +57,9 @@ class srWebServer(threading.Thread):
         self.api_root = None
         self.app = None
         self.server = None
+        self.executor = None
+        self.api_executor = None
+        self.mako_lookup = None
 
     def run(self):
         self.started = True
@@ -64,6 +69,27 @@ class srWebServer(threading.Thread):
         if os.path.isdir(mako_cache):
             shutil.rmtree(mako_cache)
 
+        # thread pool shared by all web handlers
+        self.executor = ThreadPoolExecutor(max(1, sickrage.srCore.srConfig.WEB_THREADS))
+
+        # dedicated thread pool for api commands so slow commands can't starve the web interface
+        self.api_executor = ThreadPoolExecutor(max(1, sickrage.srCore.srConfig.API_THREADS))
+
+        # template lookup shared by all web handlers, only check for template changes when developing
+        self.mako_lookup = TemplateLookup(
+            directories=[os.path.join(sickrage.srCore.srConfig.GUI_DIR, 'views')],
+            module_directory=mako_cache,
+            filesystem_checks=sickrage.srCore.srConfig.DEVELOPER,
+            strict_undefined=True,
+            input_encoding='utf-8',
+            output_encoding='utf-8',
+            encoding_errors='replace',
+            future_imports=['unicode_literals']
+        )
+
+        if not sickrage.srCore.srConfig.DEVELOPER:
+            self.executor.submit(self.compile_templates)
+
         # video root
         if sickrage.srCore.srConfig.ROOT_DIRS:
             root_dirs = sickrage.srCore.srConfig.ROOT_DIRS.split('|')
@@ -192,9 +218,43 @@ class srWebServer(threading.Thread):
             sickrage.srCore.srLogger.warning(e.strerror)
             raise SystemExit
 
+    def compile_templates(self):
+        views_dir = os.path.join(sickrage.srCore.srConfig.GUI_DIR, 'views')
+
+        sickrage.srCore.srLogger.debug("Compiling web templates")
+
+        for root, dirs, files in os.walk(views_dir):
+            for template in [f for f in files if f.endswith('.mako')]:
+                uri = '/' + os.path.relpath(os.path.join(root, template), views_dir).replace(os.sep, '/')
+
+                try:
+                    self.mako_lookup.get_template(uri)
+                except Exception as e:
+                    sickrage.srCore.srLogger.debug("Unable to compile web template {}: {}".format(uri, e))
+
+    @property
+    def executor_stats(self):
+        stats = {}
+
+        for name, executor in [('web', self.executor), ('api', self.api_executor)]:
+            if not executor:
+                continue
+
+            stats[name] = {
+                'max_workers': executor._max_workers,
+                'workers': len(executor._threads),
+                'queued': executor._work_queue.qsize()
+            }
+
+        return stats
+
     def shutdown(self):
         if self.started:
             self.started = False
             self.server.close_all_connections()
             self.server.stop()
             sickrage.io_loop.stop()
+
+            for executor in [self.executor, self.api_executor]:
+                if executor:
+                    executor.shutdown(wait=False)
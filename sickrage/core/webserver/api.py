@@ -27,7 +27,10 @@ import time
 import traceback
 import urllib
 
+from tornado.concurrent import run_on_executor
 from tornado.escape import json_encode, recursive_unicode
+from tornado.gen import coroutine, Return
+from tornado.locks import BoundedSemaphore
 from tornado.web import RequestHandler
 
 import sickrage.subtitles
@@ -51,10 +54,12 @@ from sickrage.core.media.banner import Banner
 from sickrage.core.media.fanart import FanArt
 from sickrage.core.media.network import Network
 from sickrage.core.media.poster import Poster
+from sickrage.core.nameparser import name_parser_cache
 from sickrage.core.process_tv import processDir
 from sickrage.core.queues.search import BacklogQueueItem, ManualSearchQueueItem
 from sickrage.core.tv.show.coming_episodes import ComingEpisodes
 from sickrage.core.tv.show.history import History
+from sickrage.core.tv.show.stats import ShowStats
 from sickrage.core.updaters import tz_updater
 from sickrage.indexers import srIndexerApi
 from sickrage.indexers.exceptions import indexer_error, \
@@ -105,6 +110,11 @@ class ApiHandler(RequestHandler):
     """ api class that returns json results """
     version = 5  # use an int since float-point is unpredictable
 
+    _api_calls = None
+
+    _cmd_semaphores = {}
+
+    @coroutine
     def prepare(self, *args, **kwargs):
         args = args[1:]
         kwargs = dict([(k, (v, ''.join(v))[isinstance(v, list) and len(v) == 1]) for k, v in
@@ -120,17 +130,8 @@ class ApiHandler(RequestHandler):
         accessMsg = "API :: " + self.request.remote_ip + " - gave correct API KEY. ACCESS GRANTED"
         sickrage.srCore.srLogger.debug(accessMsg)
 
-        # set the original call_dispatcher as the local _call_dispatcher
-        _call_dispatcher = self.call_dispatcher
-        # if profile was set wrap "_call_dispatcher" in the profile function
-        if 'profile' in kwargs:
-            from profilehooks import profile
-
-            _call_dispatcher = profile(_call_dispatcher, immediate=True)
-            del kwargs["profile"]
-
         try:
-            outDict = self.route(_call_dispatcher, *args, **kwargs)
+            outDict = yield self.route(self.call_dispatcher, *args, **kwargs)
         except Exception as e:
             sickrage.srCore.srLogger.error("API :: {}".format(e.message))
             errorData = {
@@ -147,12 +148,45 @@ class ApiHandler(RequestHandler):
 
         self.finish(outputCallback(outDict))
 
+    @coroutine
     def route(self, function, *args, **kwargs):
         # threading.currentThread().setName('API')
-        return recursive_unicode(function(
+        result = yield function(
             **dict([(k, (v, ''.join(v))[isinstance(v, list) and len(v) == 1]) for k, v in
                     recursive_unicode(kwargs.items())])
-        ))
+        )
+
+        raise Return(recursive_unicode(result))
+
+    @property
+    def api_executor(self):
+        return sickrage.srCore.srWebServer.api_executor
+
+    @coroutine
+    def execute(self, cmd, function):
+        """ runs a api command on the api thread pool, limiting how many of the same command can run at once """
+        semaphore = self.cmd_semaphore(cmd)
+        if not semaphore:
+            result = yield self._execute(function)
+            raise Return(result)
+
+        # waiting for a slot happens on the io loop so queued commands don't hold api threads
+        with (yield semaphore.acquire()):
+            result = yield self._execute(function)
+        raise Return(result)
+
+    @run_on_executor(executor='api_executor')
+    def _execute(self, function):
+        return function()
+
+    def cmd_semaphore(self, cmd):
+        concurrency = getattr(self.api_calls.get(cmd), '_concurrency', 0)
+        if not concurrency:
+            return None
+
+        if cmd not in ApiHandler._cmd_semaphores:
+            ApiHandler._cmd_semaphores[cmd] = BoundedSemaphore(concurrency)
+        return ApiHandler._cmd_semaphores[cmd]
 
     def _out_as_image(self, _dict):
         self.set_header('Content-Type', _dict['image'].type)
@@ -173,8 +207,12 @@ class ApiHandler(RequestHandler):
 
     @property
     def api_calls(self):
-        return dict((cls._cmd, cls) for cls in ApiCall.__subclasses__() if '_cmd' in cls.__dict__)
+        if ApiHandler._api_calls is None:
+            ApiHandler._api_calls = dict(
+                (cls._cmd, cls) for cls in ApiCall.__subclasses__() if '_cmd' in cls.__dict__)
+        return ApiHandler._api_calls
 
+    @coroutine
     def call_dispatcher(self, *args, **kwargs):
         """ calls the appropriate CMD class
             looks for a cmd in args and kwargs
@@ -184,58 +222,78 @@ class ApiHandler(RequestHandler):
         sickrage.srCore.srLogger.debug("API :: all args: '" + str(args) + "'")
         sickrage.srCore.srLogger.debug("API :: all kwargs: '" + str(kwargs) + "'")
 
+        # if profile was set wrap the cmds in the profile function
+        profile = bool(kwargs.pop('profile', False))
+
         try:
             cmds = kwargs.pop('cmd', args[0] if len(args) else "").split('|') or []
         except Exception as e:
             cmds = []
 
-        outDict = {}
+        if not cmds:
+            result = yield self.execute('sr', CMD_SiCKRAGE(self.application, self.request, *args, **kwargs).run)
+            raise Return(result)
+
         multiCmds = bool(len(cmds) > 1)
-        for cmd in cmds:
-            curArgs, curKwargs = self.filter_params(cmd, *args, **kwargs)
-            cmdIndex = None
-            if len(cmd.split("_")) > 1:  # was a index used for this cmd ?
-                cmd, cmdIndex = cmd.split("_")  # this gives us the clear cmd and the index
-
-            sickrage.srCore.srLogger.debug("API :: " + cmd + ": curKwargs " + str(curKwargs))
-            if not (multiCmds and cmd in ('show.getbanner', 'show.getfanart', 'show.getnetworklogo',
-                                          'show.getposter')):  # skip these cmd while chaining
-                try:
-                    # backport old sb calls
-                    cmd = (cmd, 'sr' + cmd[2:])[cmd[:2] == 'sb']
-
-                    if cmd in self.api_calls:
-                        # call function and get response back
-                        curOutDict = self.api_calls[cmd](self.application, self.request, *curArgs,
-                                                         **curKwargs).run()
-                    elif _is_int(cmd):
-                        curOutDict = TVDBShorthandWrapper(cmd, self.application, self.request, *curArgs,
-                                                          **curKwargs).run()
-                    else:
-                        curOutDict = _responds(RESULT_ERROR, "No such cmd: '" + cmd + "'")
-                except ApiError as e:  # Api errors that we raised, they are harmless
-                    curOutDict = _responds(RESULT_ERROR, msg=e.message)
-            else:  # if someone chained one of the forbiden cmds they will get an error for this one cmd
-                curOutDict = _responds(RESULT_ERROR, msg="The cmd '" + cmd + "' is not supported while chaining")
-
-            if multiCmds:
-                # note: if multiple same cmds are issued but one has not an index defined it will override all others
-                # or the other way around, this depends on the order of the cmds
-                # this is not a bug
-                if cmdIndex is None:  # do we need a index dict for this cmd ?
-                    outDict[cmd] = curOutDict
-                else:
-                    if cmd not in outDict:
-                        outDict[cmd] = {}
-                    outDict[cmd][cmdIndex] = curOutDict
 
-                outDict = _responds(RESULT_SUCCESS, outDict)
+        # chained cmds are run concurrently
+        results = yield [self.dispatch_cmd(cmd, multiCmds, profile, *args, **kwargs) for cmd in cmds]
+
+        if not multiCmds:
+            raise Return(results[0][2])
+
+        outDict = {}
+        for cmd, cmdIndex, curOutDict in results:
+            # note: if multiple same cmds are issued but one has not an index defined it will override all others
+            # or the other way around, this depends on the order of the cmds
+            # this is not a bug
+            if cmdIndex is None:  # do we need a index dict for this cmd ?
+                outDict[cmd] = curOutDict
             else:
-                outDict = curOutDict
+                if cmd not in outDict:
+                    outDict[cmd] = {}
+                outDict[cmd][cmdIndex] = curOutDict
+
+        raise Return(_responds(RESULT_SUCCESS, outDict))
+
+    @coroutine
+    def dispatch_cmd(self, cmd, multiCmds, profile, *args, **kwargs):
+        """ runs a single cmd and returns a tuple of (cmd, cmd index, output) """
+        curArgs, curKwargs = self.filter_params(cmd, *args, **kwargs)
+        cmdIndex = None
+        if len(cmd.split("_")) > 1:  # was a index used for this cmd ?
+            cmd, cmdIndex = cmd.split("_")  # this gives us the clear cmd and the index
+
+        sickrage.srCore.srLogger.debug("API :: " + cmd + ": curKwargs " + str(curKwargs))
+        if not (multiCmds and cmd in ('show.getbanner', 'show.getfanart', 'show.getnetworklogo',
+                                      'show.getposter')):  # skip these cmd while chaining
+            try:
+                # backport old sb calls
+                cmd = (cmd, 'sr' + cmd[2:])[cmd[:2] == 'sb']
+
+                if cmd in self.api_calls:
+                    api_call = self.api_calls[cmd](self.application, self.request, *curArgs, **curKwargs)
+                elif _is_int(cmd):
+                    api_call = TVDBShorthandWrapper(cmd, self.application, self.request, *curArgs, **curKwargs)
+                else:
+                    api_call = None
 
-            return outDict
+                if api_call:
+                    run = api_call.run
+                    if profile:
+                        from profilehooks import profile as profile_run
+                        run = profile_run(run, immediate=True)
 
-        return CMD_SiCKRAGE(*args, **kwargs).run()
+                    # call function and get response back
+                    curOutDict = yield self.execute(cmd, run)
+                else:
+                    curOutDict = _responds(RESULT_ERROR, "No such cmd: '" + cmd + "'")
+            except ApiError as e:  # Api errors that we raised, they are harmless
+                curOutDict = _responds(RESULT_ERROR, msg=e.message)
+        else:  # if someone chained one of the forbiden cmds they will get an error for this one cmd
+            curOutDict = _responds(RESULT_ERROR, msg="The cmd '" + cmd + "' is not supported while chaining")
+
+        raise Return((cmd, cmdIndex, curOutDict))
 
     def filter_params(self, cmd, *args, **kwargs):
         """ return only params kwargs that are for cmd
@@ -282,6 +340,7 @@ class ApiCall(ApiHandler):
     _requiredParams = {}
     _optionalParams = {}
     _missing = []
+    _concurrency = 0  # max number of concurrent runs of this cmd, 0 is unlimited
 
     def __init__(self, application, request, *args, **kwargs):
         super(ApiCall, self).__init__(application, request, *args, **kwargs)
@@ -644,6 +703,7 @@ class CMD_Help(ApiCall):
 
 class CMD_ComingEpisodes(ApiCall):
     _cmd = "future"
+    _concurrency = 2
     _help = {
         "desc": "Get the coming episodes",
         "optionalParameters": {
@@ -728,8 +788,9 @@ class CMD_Episode(ApiCall):
         if not showObj:
             return _responds(RESULT_FAILURE, msg="Show not found")
 
-        dbData = [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes', self.indexerid, with_doc=True)
-                  if x['doc']['season'] == self.s and x['doc']['episode'] == self.e]
+        dbData = [x['doc'] for x in
+                  sickrage.srCore.mainDB.db.get_many('tv_episodes_season_episode', (self.indexerid, self.s, self.e),
+                                                     with_doc=True)]
 
         if not len(dbData) == 1:
             raise ApiError("Episode not found")
@@ -1032,6 +1093,7 @@ class CMD_Exceptions(ApiCall):
 
 class CMD_History(ApiCall):
     _cmd = "history"
+    _concurrency = 2
     _help = {
         "desc": "Get the downloaded and/or snatched history",
         "optionalParameters": {
@@ -1143,6 +1205,7 @@ class CMD_Failed(ApiCall):
 
 class CMD_Backlog(ApiCall):
     _cmd = "backlog"
+    _concurrency = 2
     _help = {"desc": "Get the backlogged episodes"}
 
     def __init__(self, application, request, *args, **kwargs):
@@ -1697,6 +1760,39 @@ class CMD_SiCKRAGESearchTVRAGE(CMD_SiCKRAGESearchIndexers):
         return _responds(RESULT_FAILURE, msg="TVRage is disabled, invalid result")
 
 
+class CMD_SiCKRAGECacheStats(ApiCall):
+    _cmd = "sr.cachestats"
+    _help = {"desc": "Get hit and miss counters of the name parser and scene name caches"}
+
+    def __init__(self, application, request, *args, **kwargs):
+        # required
+        # optional
+        # super, missing, help
+        super(CMD_SiCKRAGECacheStats, self).__init__(application, request, *args, **kwargs)
+
+    def run(self):
+        """ Get hit and miss counters of the name parser and scene name caches """
+        return _responds(RESULT_SUCCESS, {
+            'name_parser': name_parser_cache.stats,
+            'name_cache': sickrage.srCore.NAMECACHE.stats
+        })
+
+
+class CMD_SiCKRAGESearchStats(ApiCall):
+    _cmd = "sr.searchstats"
+    _help = {"desc": "Get search latency, error and timeout counters for each provider"}
+
+    def __init__(self, application, request, *args, **kwargs):
+        # required
+        # optional
+        # super, missing, help
+        super(CMD_SiCKRAGESearchStats, self).__init__(application, request, *args, **kwargs)
+
+    def run(self):
+        """ Get search latency, error and timeout counters for each provider """
+        return _responds(RESULT_SUCCESS, sickrage.srCore.SEARCHPOOL.stats)
+
+
 class CMD_SiCKRAGESetDefaults(ApiCall):
     _cmd = "sr.setdefaults"
     _help = {
@@ -1813,6 +1909,21 @@ class CMD_SiCKRAGEUpdate(ApiCall):
         return _responds(RESULT_FAILURE, msg="SiCKRAGE is already up to date")
 
 
+class CMD_SiCKRAGEWebStats(ApiCall):
+    _cmd = "sr.webstats"
+    _help = {"desc": "Get usage statistics of the web server and api thread pools"}
+
+    def __init__(self, application, request, *args, **kwargs):
+        # required
+        # optional
+        # super, missing, help
+        super(CMD_SiCKRAGEWebStats, self).__init__(application, request, *args, **kwargs)
+
+    def run(self):
+        """ Get usage statistics of the web server and api thread pools """
+        return _responds(RESULT_SUCCESS, sickrage.srCore.srWebServer.executor_stats)
+
+
 class CMD_Show(ApiCall):
     _cmd = "show"
     _help = {
@@ -2579,6 +2690,7 @@ class CMD_ShowSeasonList(ApiCall):
 
 class CMD_ShowSeasons(ApiCall):
     _cmd = "show.seasons"
+    _concurrency = 2
     _help = {
         "desc": "Get the list of episodes for one or all seasons of a show",
         "requiredParameters": {
@@ -2727,6 +2839,7 @@ class CMD_ShowSetQuality(ApiCall):
 
 class CMD_ShowStats(ApiCall):
     _cmd = "show.stats"
+    _concurrency = 2
     _help = {
         "desc": "Get episode statistics for a given show",
         "requiredParameters": {
@@ -2772,24 +2885,22 @@ class CMD_ShowStats(ApiCall):
             status, quality = Quality.splitCompositeStatus(statusCode)
             if quality not in [Quality.NONE]: episode_qualities_counts_snatch[statusCode] = 0
 
-        # the main loop that goes through all episodes
-        for row in [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes', self.indexerid, with_doc=True)
-                    if x['doc']['season'] != 0]:
-
-            status, quality = Quality.splitCompositeStatus(int(row["status"]))
+        # the main loop that goes through the episode counts of each status
+        for statusCode, count in ShowStats.get(self.indexerid)['statuses'].items():
+            status, quality = Quality.splitCompositeStatus(int(statusCode))
 
-            episode_status_counts_total["total"] += 1
+            episode_status_counts_total["total"] += count
 
             if status in Quality.DOWNLOADED + Quality.ARCHIVED:
-                episode_qualities_counts_download["total"] += 1
-                episode_qualities_counts_download[int(row["status"])] += 1
+                episode_qualities_counts_download["total"] += count
+                episode_qualities_counts_download[int(statusCode)] += count
             elif status in Quality.SNATCHED + Quality.SNATCHED_PROPER:
-                episode_qualities_counts_snatch["total"] += 1
-                episode_qualities_counts_snatch[int(row["status"])] += 1
+                episode_qualities_counts_snatch["total"] += count
+                episode_qualities_counts_snatch[int(statusCode)] += count
             elif status == 0:  # we dont count NONE = 0 = N/A
                 pass
             else:
-                episode_status_counts_total[status] += 1
+                episode_status_counts_total[status] += count
 
         # the outgoing container
         episodes_stats = {"downloaded": {}}
@@ -2929,6 +3040,7 @@ class CMD_Shows(ApiCall):
 
 class CMD_ShowsStats(ApiCall):
     _cmd = "shows.stats"
+    _concurrency = 2
     _help = {"desc": "Get the global shows and episodes statistics"}
 
     def __init__(self, application, request, *args, **kwargs):
@@ -2948,3 +3060,18 @@ class CMD_ShowsStats(ApiCall):
             'shows_active': stats['shows']['active'],
             'shows_total': stats['shows']['total'],
         })
+
+
+class CMD_ShowsStatsRebuild(ApiCall):
+    _cmd = "shows.stats.rebuild"
+    _help = {"desc": "Rebuild the episode statistics of every show from the episodes table"}
+
+    def __init__(self, application, request, *args, **kwargs):
+        # required
+        # optional
+        # super, missing, help
+        super(CMD_ShowsStatsRebuild, self).__init__(application, request, *args, **kwargs)
+
+    def run(self):
+        """ Rebuild the episode statistics of every show from the episodes table """
+        return _responds(RESULT_SUCCESS, {'shows': ShowStats.rebuild()}, "Show statistics rebuilt")
@@ -109,39 +109,8 @@
                 </tr>
                 </thead>
                 <tbody>
-                    % if sickrage.srCore.SHOWQUEUE.currentItem is not None:
-                        <tr>
-                        % try:
-                            <% showindexerid = sickrage.srCore.SHOWQUEUE.currentItem.show.indexerid %>
-                            <td>${showindexerid}</td>
-                        % except Exception:
-                            <td></td>
-                        % endtry
-                        % try:
-                            <% showname = sickrage.srCore.SHOWQUEUE.currentItem.show.name %>
-                            <td>${showname}</td>
-                        % except Exception:
-                            % if sickrage.srCore.SHOWQUEUE.currentItem.action_id == ShowQueueActions.ADD:
-                                <td>${sickrage.srCore.SHOWQUEUE.currentItem.showDir}</td>
-                            % else:
-                                <td></td>
-                            % endif
-                        % endtry
-                            <td>${sickrage.srCore.SHOWQUEUE.currentItem.is_alive()}</td>
-                            % if sickrage.srCore.SHOWQUEUE.currentItem.priority == 10:
-                                <td>LOW</td>
-                            % elif sickrage.srCore.SHOWQUEUE.currentItem.priority == 20:
-                                <td>NORMAL</td>
-                            % elif sickrage.srCore.SHOWQUEUE.currentItem.priority == 30:
-                                <td>HIGH</td>
-                            % else:
-                                <td>showQueue.currentItem.priority</td>
-                            % endif
-                            <td>${sickrage.srCore.SHOWQUEUE.currentItem.added.strftime(dateTimeFormat)}</td>
-                            <td>${ShowQueueActions.names[sickrage.srCore.SHOWQUEUE.currentItem.action_id]}</td>
-                        </tr>
-                    % endif
-                    % for _, _, item in sickrage.srCore.SHOWQUEUE.queue:
+                    <% items = sickrage.srCore.SHOWQUEUE.currentItems + [item for _, _, item in sickrage.srCore.SHOWQUEUE.queue] %>
+                    % for item in items:
                         <tr>
                         % try:
                             <% showindexerid = item.show.indexerid %>
@@ -30,13 +30,10 @@ import dateutil.tz
 import markdown2
 from CodernityDB.database import RecordNotFound
 from adba import aniDBAbstracter
-from concurrent.futures import ThreadPoolExecutor
 from mako.exceptions import html_error_template, RichTraceback
-from mako.lookup import TemplateLookup
 from tornado.concurrent import run_on_executor
 from tornado.escape import json_encode, json_decode, recursive_unicode
 from tornado.gen import coroutine
-from tornado.process import cpu_count
 from tornado.web import RequestHandler, authenticated
 
 import sickrage
@@ -58,6 +55,7 @@ from sickrage.core.helpers import argToBool, backupSR, check_url, \
     sanitizeFileName, tryInt, clean_url
 from sickrage.core.helpers.browser import foldersAtPath
 from sickrage.core.helpers.compat import cmp
+from sickrage.core.helpers.show_names import clear_word_matchers
 from sickrage.core.imdb_popular import imdbPopular
 from sickrage.core.media.util import indexerImage
 from sickrage.core.nameparser import validator
@@ -73,6 +71,7 @@ from sickrage.core.traktapi import srTraktAPI
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show.coming_episodes import ComingEpisodes
 from sickrage.core.tv.show.history import History as HistoryTool
+from sickrage.core.tv.show.stats import ShowStats
 from sickrage.core.updaters import tz_updater
 from sickrage.core.webserver.routes import Route
 from sickrage.indexers import srIndexerApi
@@ -82,20 +81,11 @@ from sickrage.providers import NewznabProvider, TorrentRssProvider
 class BaseHandler(RequestHandler):
     def __init__(self, application, request, **kwargs):
         super(BaseHandler, self).__init__(application, request, **kwargs)
-        self.executor = ThreadPoolExecutor(cpu_count())
         self.startTime = time.time()
 
-        # template settings
-        self.mako_lookup = TemplateLookup(
-            directories=[os.path.join(sickrage.srCore.srConfig.GUI_DIR, 'views')],
-            module_directory=os.path.join(sickrage.CACHE_DIR, 'mako'),
-            filesystem_checks=True,
-            strict_undefined=True,
-            input_encoding='utf-8',
-            output_encoding='utf-8',
-            encoding_errors='replace',
-            future_imports=['unicode_literals']
-        )
+        # shared web server resources
+        self.executor = sickrage.srCore.srWebServer.executor
+        self.mako_lookup = sickrage.srCore.srWebServer.mako_lookup
 
     def prepare(self):
         if not self.request.full_url().startswith(sickrage.srCore.srConfig.WEB_ROOT):
@@ -638,47 +628,7 @@ class Home(WebHandler):
 
     @staticmethod
     def show_statistics():
-        show_stat = {}
-
-        today = datetime.date.today().toordinal()
-
-        status_quality = Quality.SNATCHED + Quality.SNATCHED_PROPER + Quality.SNATCHED_BEST
-        status_download = Quality.DOWNLOADED + Quality.ARCHIVED
-
-        max_download_count = 1000
-
-        for epData in [x['doc'] for x in sickrage.srCore.mainDB.db.all('tv_episodes', with_doc=True)]:
-            showid = epData['showid']
-            if showid not in show_stat:
-                show_stat[showid] = {}
-                show_stat[showid]['ep_snatched'] = 0
-                show_stat[showid]['ep_downloaded'] = 0
-                show_stat[showid]['ep_total'] = 0
-                show_stat[showid]['ep_airs_next'] = None
-                show_stat[showid]['ep_airs_prev'] = None
-
-            season = epData['season']
-            episode = epData['episode']
-            airdate = epData['airdate']
-            status = epData['status']
-
-            if season > 0 and episode > 0 and airdate > 1:
-                if status in status_quality: show_stat[showid]['ep_snatched'] += 1
-                if status in status_download: show_stat[showid]['ep_downloaded'] += 1
-                if (airdate <= today and status in [SKIPPED, WANTED, FAILED]
-                    ) or (status in status_quality + status_download): show_stat[showid]['ep_total'] += 1
-
-                if show_stat[showid]['ep_total'] > max_download_count:
-                    max_download_count = show_stat[showid]['ep_total']
-
-                if airdate >= today and status in [WANTED, UNAIRED] and not show_stat[showid]['ep_airs_next']:
-                    show_stat[showid]['ep_airs_next'] = airdate
-                elif airdate < today > show_stat[showid]['ep_airs_prev'] and status != UNAIRED:
-                    show_stat[showid]['ep_airs_prev'] = airdate
-
-        max_download_count *= 100
-
-        return show_stat, max_download_count
+        return ShowStats.home()
 
     def is_alive(self, *args, **kwargs):
         if not all([kwargs.get('srcallback'), kwargs.get('_')]):
@@ -1418,7 +1368,11 @@ class Home(WebHandler):
             showObj.scene = scene
             showObj.anime = anime
             showObj.sports = sports
+            subtitles_changed = bool(showObj.subtitles) != bool(subtitles)
             showObj.subtitles = subtitles
+            if subtitles_changed:
+                sickrage.srCore.SUBTITLESEARCHER.update_queue([showObj])
+
             showObj.subtitles_sr_metadata = subtitles_sr_metadata
             showObj.air_by_date = air_by_date
             showObj.default_ep_status = int(defaultEpStatus)
@@ -1428,6 +1382,7 @@ class Home(WebHandler):
                 showObj.dvdorder = dvdorder
                 showObj.rls_ignore_words = rls_ignore_words.strip()
                 showObj.rls_require_words = rls_require_words.strip()
+                clear_word_matchers()
 
             # if we change location clear the db of episodes, change it, write to db, and rescan
             if os.path.normpath(showObj.location) != os.path.normpath(location):
@@ -1466,6 +1421,7 @@ class Home(WebHandler):
             try:
                 update_scene_exceptions(showObj.indexerid,
                                         exceptions_list)  # @UndefinedVdexerid)
+                sickrage.srCore.NAMECACHE.build(showObj, force=True)
                 time.sleep(cpu_presets[sickrage.srCore.srConfig.CPU_PRESET])
             except CantUpdateShowException as e:
                 errors.append("Unable to force an update on scene exceptions of the show.")
@@ -1908,8 +1864,9 @@ class Home(WebHandler):
 
             epInfo = curEp.split('x')
 
-            ep_result = [x['doc'] for x in sickrage.srCore.mainDB.db.get_many('tv_episodes', int(show), with_doc=True)
-                         if x['doc']['season'] == int(epInfo[0]) and x['doc']['episode'] == int(epInfo[1])]
+            ep_result = [x['doc'] for x in
+                         sickrage.srCore.mainDB.db.get_many('tv_episodes_season_episode',
+                                                            (int(show), int(epInfo[0]), int(epInfo[1])), with_doc=True)]
 
             if not ep_result:
                 sickrage.srCore.srLogger.warning("Unable to find an episode for " + curEp + ", skipping")
@@ -3927,6 +3884,7 @@ class ConfigSearch(Config):
         sickrage.srCore.srConfig.IGNORE_WORDS = ignore_words if ignore_words else ""
         sickrage.srCore.srConfig.REQUIRE_WORDS = require_words if require_words else ""
         sickrage.srCore.srConfig.IGNORED_SUBS_LIST = ignored_subs_list if ignored_subs_list else ""
+        clear_word_matchers()
 
         sickrage.srCore.srConfig.RANDOMIZE_PROVIDERS = sickrage.srCore.srConfig.checkbox_to_value(randomize_providers)
 
@@ -4726,6 +4684,9 @@ class ConfigSubtitles(Config):
         sickrage.srCore.srConfig.SUBTITLES_EXTRA_SCRIPTS = [x.strip() for x in subtitles_extra_scripts.split('|') if
                                                             x.strip()]
 
+        # wanted languages may have changed
+        sickrage.srCore.SUBTITLESEARCHER.invalidate()
+
         # Subtitles services
         services_str_list = service_order.split()
         subtitles_services_list = []
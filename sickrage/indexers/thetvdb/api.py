@@ -24,6 +24,7 @@ import io
 import os
 import pickle
 import re
+import threading
 import time
 import urlparse
 from collections import OrderedDict
@@ -79,15 +80,107 @@ class BaseUI:
         return allSeries[0]
 
 
-class ShowCache(OrderedDict):
-    def __init__(self, *args, **kwargs):
-        self.maxsize = 100
-        super(ShowCache, self).__init__(*args, **kwargs)
+class ShowCache(object):
+    """LRU cache of shows shared by all Tvdb instances, each show is lazily loaded from
+    and flushed to its own pickle file so shows can be written and invalidated independently
+    """
+
+    def __init__(self, path, maxsize=100):
+        self.path = path
+        self.maxsize = maxsize
+        self.shows = OrderedDict()
+        self.dirty = set()
+        self.lock = threading.RLock()
+
+    def _show_path(self, sid):
+        return os.path.join(self.path, '{}.db'.format(sid))
+
+    def _load(self, sid):
+        if sid in self.shows:
+            return True
+
+        if not os.path.isfile(self._show_path(sid)):
+            return False
+
+        try:
+            with io.open(self._show_path(sid), 'rb') as fp:
+                self._store(sid, pickle.load(fp))
+        except Exception:
+            return False
+
+        return True
+
+    def _store(self, sid, show):
+        self.shows.pop(sid, None)
+        self.shows[sid] = show
+
+        while len(self.shows) > self.maxsize:
+            oldest = next(iter(self.shows))
+            self.flush(oldest)
+            del self.shows[oldest]
+
+    def __contains__(self, sid):
+        with self.lock:
+            return self._load(int(sid))
+
+    def __getitem__(self, sid):
+        with self.lock:
+            sid = int(sid)
+            if not self._load(sid):
+                raise KeyError(sid)
+
+            self._store(sid, self.shows[sid])
+            return self.shows[sid]
+
+    def __setitem__(self, sid, show):
+        with self.lock:
+            self._store(int(sid), show)
+            self.dirty.add(int(sid))
+
+    def __delitem__(self, sid):
+        self.invalidate(sid)
+
+    def __repr__(self):
+        return repr(self.shows)
+
+    def touch(self, sid):
+        """Marks a show as modified so it gets written on the next flush
+        """
+        with self.lock:
+            self.dirty.add(int(sid))
+
+    def flush(self, sid=None):
+        """Writes a modified show, or all modified shows if no show id is given, to disk
+        """
+        with self.lock:
+            for cur_sid in ([int(sid)] if sid is not None else list(self.dirty)):
+                if cur_sid not in self.dirty:
+                    continue
+
+                self.dirty.discard(cur_sid)
+                if cur_sid not in self.shows:
+                    continue
+
+                try:
+                    if not os.path.isdir(self.path):
+                        os.makedirs(self.path)
+
+                    with io.open(self._show_path(cur_sid), 'wb') as fp:
+                        pickle.dump(self.shows[cur_sid], fp, pickle.HIGHEST_PROTOCOL)
+                except Exception as e:
+                    sickrage.srCore.srLogger.debug("Unable to write cache for show {}: {}".format(cur_sid, e))
 
-    def __setitem__(self, key, value, dict_setitem=dict.__setitem__):
-        super(ShowCache, self).__setitem__(key, value)
-        while len(self) > self.maxsize:
-            self.pop(list(self.keys())[0], None)
+    def invalidate(self, sid):
+        """Removes a single show from memory and disk, leaving all other cached shows untouched
+        """
+        with self.lock:
+            self.shows.pop(int(sid), None)
+            self.dirty.discard(int(sid))
+
+            try:
+                os.remove(self._show_path(int(sid)))
+            except OSError:
+                pass
 
 
 class Show(dict):
@@ -294,6 +387,9 @@ class Tvdb:
     'My Last Day'
     """
 
+    _show_cache = None
+    _show_cache_lock = threading.Lock()
+
     def __init__(self,
                  debug=False,
                  cache=True,
@@ -306,13 +402,18 @@ class Tvdb:
 
         if headers is None: headers = {}
 
-        self.shows = ShowCache()
-        if os.path.isfile(os.path.join(sickrage.DATA_DIR, 'thetvdb.db')):
-            with io.open(os.path.join(sickrage.DATA_DIR, 'thetvdb.db'), 'rb') as fp:
-                try:
-                    self.shows = ShowCache(pickle.load(fp))
-                except:
-                    pass
+        with Tvdb._show_cache_lock:
+            if Tvdb._show_cache is None:
+                # remove legacy single file cache, shows are now cached one file per show
+                if os.path.isfile(os.path.join(sickrage.DATA_DIR, 'thetvdb.db')):
+                    try:
+                        os.remove(os.path.join(sickrage.DATA_DIR, 'thetvdb.db'))
+                    except OSError:
+                        pass
+
+                Tvdb._show_cache = ShowCache(os.path.join(sickrage.DATA_DIR, 'thetvdb'))
+
+        self.shows = Tvdb._show_cache
 
         self.config = dict(apikey=apikey, debug_enabled=debug, custom_ui=custom_ui, cache_enabled=cache,
                            dvdorder=dvdorder, proxy=proxy, apitoken=None, api={}, headers=headers)
@@ -421,6 +522,7 @@ class Tvdb:
         if ep not in self.shows[sid][seas]:
             self.shows[sid][seas][ep] = Episode()
         self.shows[sid][seas][ep][attrib] = value
+        self.shows.touch(sid)
 
     def _setShowData(self, sid, key, value):
         """Sets self.shows[sid] to a new Show instance, or sets the data
@@ -432,9 +534,7 @@ class Tvdb:
             self.shows[sid].data['_actors'] = self._get_actors(sid)
 
         self.shows[sid].data[key] = value
-
-        with io.open(os.path.join(sickrage.DATA_DIR, 'thetvdb.db'), 'wb') as fp:
-            pickle.dump(self.shows, fp)
+        self.shows.touch(sid)
 
     def _cleanData(self, data):
         """Cleans up strings returned by TheTVDB.com
@@ -599,6 +699,7 @@ class Tvdb:
 
         if not len(episodes):
             sickrage.srCore.srLogger.debug('Series results incomplete')
+            self.shows.flush(sid)
             return
 
         for cur_ep in episodes:
@@ -637,6 +738,9 @@ class Tvdb:
         # set last updated
         self._setShowData(sid, 'last_updated', int(time.mktime(datetime.datetime.now().timetuple())))
 
+        # write all changes made to the show in one go
+        self.shows.flush(sid)
+
         return self.shows[int(sid)]
 
     @login_required
@@ -249,15 +249,31 @@ class GenericProvider(object):
 
         return title, url
 
+    def _fetch_metadata(self, url):
+        """Downloads the item and returns its total size and dict of files with sizes"""
+        sickrage.srCore.srLogger.debug("Provider type doesn't have _fetch_metadata() implemented yet")
+        return None
+
+    def _get_metadata(self, url):
+        """Gets the size and dict of files with sizes from the item, each item is only fetched once"""
+        metadata = sickrage.srCore.METADATACACHE.get(url)
+        if metadata is None:
+            metadata = self._fetch_metadata(url)
+            if metadata:
+                sickrage.srCore.METADATACACHE.set(url, metadata)
+            else:
+                metadata = {'size': -1, 'files': {}}
+                sickrage.srCore.METADATACACHE.set(url, metadata, failed=True)
+
+        return metadata
+
     def _get_size(self, item):
         """Gets the size from the item"""
-        sickrage.srCore.srLogger.error("Provider type doesn't have ability to provide download size implemented yet")
-        return -1
+        return self._get_metadata(item)['size']
 
     def _get_files(self, url):
         """Gets dict of files with sizes from the item"""
-        sickrage.srCore.srLogger.error("Provider type doesn't have _get_files() implemented yet")
-        return {}
+        return self._get_metadata(url)['files']
 
     def findSearchResults(self, show, episodes, search_mode, manualSearch=False, downCurQuality=False, cacheOnly=False):
 
@@ -400,8 +416,8 @@ class GenericProvider(object):
                 else:
                     airdate = parse_result.air_date.toordinal()
                     dbData = [x['doc'] for x in
-                              sickrage.srCore.mainDB.db.get_many('tv_episodes', showObj.indexerid, with_doc=True)
-                              if x['doc']['airdate'] == airdate]
+                              sickrage.srCore.mainDB.db.get_many('tv_episodes_airdate', (showObj.indexerid, airdate),
+                                                                 with_doc=True)]
 
                     if len(dbData) != 1:
                         sickrage.srCore.srLogger.warning(
@@ -443,8 +459,6 @@ class GenericProvider(object):
             result.release_group = release_group
             result.version = version
             result.content = None
-            result.size = self._get_size(url)
-            result.files = self._get_files(url)
 
             sickrage.srCore.srLogger.debug(
                 "FOUND RESULT:[{}] QUALITY:[{}] URL:[{}]".format(title, Quality.qualityStrings[quality], url))
@@ -586,40 +600,22 @@ class TorrentProvider(GenericProvider):
 
         return title, download_url
 
-    def _get_size(self, url):
-        size = -1
-
-        for url in self.make_url(url):
-            try:
-                resp = sickrage.srCore.srWebSession.get(url)
-                torrent = bencode.bdecode(resp.content)
-
-                total_length = 0
-                for file in torrent['info']['files']:
-                    total_length += int(file['length'])
-
-                if total_length > 0:
-                    size = total_length
-                    break
-            except Exception:
-                pass
-
-        return size
-
-    def _get_files(self, url):
-        files = {}
-
+    def _fetch_metadata(self, url):
         for url in self.make_url(url):
             try:
                 resp = sickrage.srCore.srWebSession.get(url)
                 torrent = bencode.bdecode(resp.content)
 
-                for file in torrent['info']['files']:
-                    files[file['path'][0]] = int(file['length'])
-            except Exception:
-                pass
+                if 'files' in torrent['info']:
+                    files = dict((file['path'][0], int(file['length'])) for file in torrent['info']['files'])
+                else:
+                    files = {torrent['info']['name']: int(torrent['info']['length'])}
 
-        return files
+                size = sum(files.values())
+                if size > 0:
+                    return {'size': size, 'files': files}
+            except Exception as e:
+                sickrage.srCore.srLogger.debug("Unable to get torrent metadata from {}: {}".format(url, repr(e)))
 
     def _get_season_search_strings(self, ep_obj):
 
@@ -728,40 +724,19 @@ class NZBProvider(GenericProvider):
         result.provider = self
         return result
 
-    def _get_size(self, url):
-        size = -1
-
+    def _fetch_metadata(self, url):
         try:
             resp = sickrage.srCore.srWebSession.get(url)
 
-            total_length = 0
+            files = {}
             for file in nzb_parser.parse(resp.content):
-                for segment in file.segments:
-                    total_length += int(segment.bytes)
-
-            if total_length > 0:
-                size = total_length
-        except Exception:
-            pass
+                files[file.subject] = sum(int(segment.bytes) for segment in file.segments)
 
-        return size
-
-    def _get_files(self, url):
-        files = {}
-
-        try:
-            resp = sickrage.srCore.srWebSession.get(url)
-
-            for file in nzb_parser.parse(resp.content):
-                total_length = 0
-                for segment in file.segments:
-                    total_length += int(segment.bytes)
-
-                files[file.subject] = total_length
-        except Exception:
-            pass
-
-        return files
+            size = sum(files.values())
+            if size > 0:
+                return {'size': size, 'files': files}
+        except Exception as e:
+            sickrage.srCore.srLogger.debug("Unable to get nzb metadata from {}: {}".format(url, repr(e)))
 
     def make_url(self, url):
         return super(NZBProvider, self).make_url(url)
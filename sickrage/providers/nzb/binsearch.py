@@ -78,23 +78,29 @@ class BinSearchCache(tv_cache.TVCache):
     def update(self):
         # check if we should update
         if self.should_update():
-            # clear cache
-            self.clear()
+            try:
+                self._begin_update()
 
-            # set updated
-            self.last_update = datetime.datetime.today()
+                # clear cache
+                self.clear()
 
-            for group in ['alt.binaries.hdtv', 'alt.binaries.hdtv.x264', 'alt.binaries.tv', 'alt.binaries.tvseries',
-                          'alt.binaries.teevee']:
-                url = self.provider.urls['base_url'] + '/rss.php?'
-                urlArgs = {'max': 1000, 'g': group}
+                # set updated
+                self.last_update = datetime.datetime.today()
 
-                url += urllib.urlencode(urlArgs)
+                for group in ['alt.binaries.hdtv', 'alt.binaries.hdtv.x264', 'alt.binaries.tv', 'alt.binaries.tvseries',
+                              'alt.binaries.teevee']:
+                    url = self.provider.urls['base_url'] + '/rss.php?'
+                    urlArgs = {'max': 1000, 'g': group}
 
-                sickrage.srCore.srLogger.debug("Cache update URL: %s " % url)
+                    url += urllib.urlencode(urlArgs)
 
-                for item in self.getRSSFeed(url)['entries'] or []:
-                    self._parseItem(item)
+                    sickrage.srCore.srLogger.debug("Cache update URL: %s " % url)
+
+                    self._parseItems(self.getRSSFeed(url)['entries'])
+
+                self._end_update()
+            finally:
+                self._reset_update()
 
         return True
 
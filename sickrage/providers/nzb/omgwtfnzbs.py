@@ -78,14 +78,6 @@ class OmgwtfnzbsProvider(NZBProvider):
     def _get_title_and_url(self, item):
         return item['release'], item['getnzb']
 
-    def _get_size(self, item):
-        try:
-            size = int(item['sizebytes'])
-        except (ValueError, TypeError, AttributeError, KeyError):
-            return -1
-
-        return size
-
     def search(self, search, search_mode='eponly', epcount=0, retention=0, epObj=None):
         results = []
         if not self._check_auth():
@@ -36,20 +36,26 @@ class WombleCache(tv_cache.TVCache):
     def update(self):
         # check if we should update
         if self.should_update():
-            # clear cache
-            self.clear()
+            try:
+                self._begin_update()
 
-            # set updated
-            self.last_update = datetime.datetime.today()
+                # clear cache
+                self.clear()
 
-            for url in [self.provider.urls['base_url'] + '/rss/?sec=tv-x264&fr=false',
-                        self.provider.urls['base_url'] + '/rss/?sec=tv-sd&fr=false',
-                        self.provider.urls['base_url'] + '/rss/?sec=tv-dvd&fr=false',
-                        self.provider.urls['base_url'] + '/rss/?sec=tv-hd&fr=false']:
-                sickrage.srCore.srLogger.debug("Cache update URL: %s" % url)
+                # set updated
+                self.last_update = datetime.datetime.today()
 
-                for item in self.getRSSFeed(url)['entries'] or []:
-                    self._parseItem(item)
+                for url in [self.provider.urls['base_url'] + '/rss/?sec=tv-x264&fr=false',
+                            self.provider.urls['base_url'] + '/rss/?sec=tv-sd&fr=false',
+                            self.provider.urls['base_url'] + '/rss/?sec=tv-dvd&fr=false',
+                            self.provider.urls['base_url'] + '/rss/?sec=tv-hd&fr=false']:
+                    sickrage.srCore.srLogger.debug("Cache update URL: %s" % url)
+
+                    self._parseItems(self.getRSSFeed(url)['entries'])
+
+                self._end_update()
+            finally:
+                self._reset_update()
 
         return True
 
@@ -22,7 +22,10 @@ import io
 import os
 import re
 import subprocess
+import threading
+import time
 import traceback
+from contextlib import contextmanager
 
 import subliminal
 from babelfish import language_converters, Language
@@ -53,6 +56,45 @@ PROVIDER_URLS = {
 }
 subtitle_extensions = ['srt', 'sub', 'ass', 'idx', 'ssa']
 
+# minimum seconds between two requests to the same provider, shared by all provider pools
+PROVIDER_INTERVALS = {'addic7ed': 5, 'itasa': 2, 'legendastv': 2}
+DEFAULT_PROVIDER_INTERVAL = 1
+
+provider_locks = {}
+provider_last_request = {}
+provider_locks_lock = threading.Lock()
+
+
+@contextmanager
+def provider_rate_limit(provider):
+    with provider_locks_lock:
+        lock = provider_locks.setdefault(provider, threading.Lock())
+
+    with lock:
+        delay = provider_last_request.get(provider, 0) + PROVIDER_INTERVALS.get(provider, DEFAULT_PROVIDER_INTERVAL) \
+                - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            yield
+        finally:
+            provider_last_request[provider] = time.time()
+
+
+class RateLimitedProviderPool(subliminal.ProviderPool):
+    """
+    Provider pool that spaces out the requests made to each provider, across all pools
+    """
+
+    def list_subtitles_provider(self, provider, video, languages):
+        with provider_rate_limit(provider):
+            return super(RateLimitedProviderPool, self).list_subtitles_provider(provider, video, languages)
+
+    def download_subtitle(self, subtitle):
+        with provider_rate_limit(subtitle.provider_name):
+            return super(RateLimitedProviderPool, self).download_subtitle(subtitle)
+
 
 def sortedServiceList():
     newList = []
@@ -83,7 +125,23 @@ def getEnabledServiceList():
     return [x['name'] for x in sortedServiceList() if x['enabled']]
 
 
-def download_subtitles(episode):
+def get_provider_configs():
+    return {
+        'addic7ed': {'username': sickrage.srCore.srConfig.ADDIC7ED_USER,
+                     'password': sickrage.srCore.srConfig.ADDIC7ED_PASS},
+        'itasa': {'username': sickrage.srCore.srConfig.ITASA_USER,
+                  'password': sickrage.srCore.srConfig.ITASA_PASS},
+        'legendastv': {'username': sickrage.srCore.srConfig.LEGENDASTV_USER,
+                       'password': sickrage.srCore.srConfig.LEGENDASTV_PASS},
+        'opensubtitles': {'username': sickrage.srCore.srConfig.OPENSUBTITLES_USER,
+                          'password': sickrage.srCore.srConfig.OPENSUBTITLES_PASS}}
+
+
+def get_provider_pool():
+    return RateLimitedProviderPool(providers=getEnabledServiceList(), provider_configs=get_provider_configs())
+
+
+def download_subtitles(episode, pool=None):
     existing_subtitles = episode.subtitles
 
     # First of all, check if we need subtitles
@@ -95,7 +153,6 @@ def download_subtitles(episode):
 
     subtitles_path = get_subtitles_path(episode.location)
     video_path = episode.location
-    providers = getEnabledServiceList()
 
     video = get_video(video_path, subtitles_path=subtitles_path, episode=episode)
     if not video:
@@ -104,17 +161,10 @@ def download_subtitles(episode):
                                         episode.episode))
         return existing_subtitles, None
 
-    provider_configs = {
-        'addic7ed': {'username': sickrage.srCore.srConfig.ADDIC7ED_USER,
-                     'password': sickrage.srCore.srConfig.ADDIC7ED_PASS},
-        'itasa': {'username': sickrage.srCore.srConfig.ITASA_USER,
-                  'password': sickrage.srCore.srConfig.ITASA_PASS},
-        'legendastv': {'username': sickrage.srCore.srConfig.LEGENDASTV_USER,
-                       'password': sickrage.srCore.srConfig.LEGENDASTV_PASS},
-        'opensubtitles': {'username': sickrage.srCore.srConfig.OPENSUBTITLES_USER,
-                          'password': sickrage.srCore.srConfig.OPENSUBTITLES_PASS}}
-
-    pool = subliminal.ProviderPool(providers=providers, provider_configs=provider_configs)
+    # pools passed in are reused for other episodes and terminated by the caller
+    own_pool = pool is None
+    if own_pool:
+        pool = get_provider_pool()
 
     try:
         subtitles_list = pool.list_subtitles(video, languages)
@@ -147,6 +197,9 @@ def download_subtitles(episode):
         sickrage.srCore.srLogger.info("Error occurred when downloading subtitles for: %s" % video_path)
         sickrage.srCore.srLogger.error(traceback.format_exc())
         return existing_subtitles, None
+    finally:
+        if own_pool:
+            pool.terminate()
 
     if sickrage.srCore.srConfig.SUBTITLES_HISTORY:
         from sickrage.core.tv.show.history import History
@@ -19,12 +19,153 @@
 
 from __future__ import print_function, unicode_literals
 
+import ast
+import glob
+import itertools
+import os
+import re
+import sys
+import tokenize
 import unittest
 
 from sickrage.core.common import Quality
 from tests import SiCKRAGETestCase
 
 
+def old_sceneQuality(name, anime=False):
+    """
+    Rule set sceneQuality used before its token table, kept to check the table against
+    """
+
+    ret = Quality.UNKNOWN
+    if not name:
+        return ret
+
+    name = os.path.basename(name)
+
+    check_name = lambda l, func: func([re.search(x, name, re.I) for x in l])
+
+    if anime:
+        dvdOptions = check_name([r"dvd", r"dvdrip"], any)
+        blueRayOptions = check_name([r"BD", r"blue?-?ray"], any)
+        sdOptions = check_name([r"360p", r"480p", r"848x480", r"XviD"], any)
+        hdOptions = check_name([r"720p", r"1280x720", r"960x720"], any)
+        fullHD = check_name([r"1080p", r"1920x1080"], any)
+
+        if sdOptions and not blueRayOptions and not dvdOptions:
+            ret = Quality.SDTV
+        elif dvdOptions:
+            ret = Quality.SDDVD
+        elif hdOptions and not blueRayOptions and not fullHD:
+            ret = Quality.HDTV
+        elif fullHD and not blueRayOptions and not hdOptions:
+            ret = Quality.FULLHDTV
+        elif hdOptions and not blueRayOptions and not fullHD:
+            ret = Quality.HDWEBDL
+        elif blueRayOptions and hdOptions and not fullHD:
+            ret = Quality.HDBLURAY
+        elif blueRayOptions and fullHD and not hdOptions:
+            ret = Quality.FULLHDBLURAY
+
+        return ret
+
+    if (check_name([r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip",
+                    r"xvid|divx|[xh].?26[45]"], all)
+        and not check_name([r"(720|1080)[pi]"], all)
+        and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
+        ret = Quality.SDTV
+    elif (check_name([r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray", r"xvid|divx|[xh].?26[45]"], all)
+          and not check_name([r"(720|1080)[pi]"], all)
+          and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
+        ret = Quality.SDDVD
+    elif (check_name([r"720p", r"hd.?tv", r"[xh].?26[45]"], all)
+          or check_name([r"hr.ws.pdtv.[xh].?26[45]"], any) and not check_name([r"1080[pi]"], all)):
+        ret = Quality.HDTV
+    elif (check_name([r"720p|1080i", r"hd.?tv", r"mpeg-?2"], all)
+          or check_name([r"1080[pi].hdtv", r"h.?26[45]"], all)):
+        ret = Quality.RAWHDTV
+    elif check_name([r"1080p", r"hd.?tv", r"[xh].?26[45]"], all):
+        ret = Quality.FULLHDTV
+    elif (check_name([r"720p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"720p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.HDWEBDL
+    elif (check_name([r"1080p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"1080p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.FULLHDWEBDL
+    elif check_name([r"720p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.HDBLURAY
+    elif check_name([r"1080p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.FULLHDBLURAY
+    elif check_name([r"2160p", r"hd.?tv", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_4K_TV
+    elif check_name([r"4320p", r"hd.?tv", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_8K_TV
+    elif (check_name([r"2160p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"2160p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.UHD_4K_WEBDL
+    elif (check_name([r"4320p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"4320p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.UHD_8K_WEBDL
+    elif check_name([r"2160p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_4K_BLURAY
+    elif check_name([r"4320p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_8K_BLURAY
+
+    return ret
+
+
+def old_nameQuality(name, anime=False):
+    quality = old_sceneQuality(name, anime)
+    if quality != Quality.UNKNOWN:
+        return quality
+
+    quality = Quality.qualityFromFileMeta(name)
+    if quality != Quality.UNKNOWN:
+        return quality
+
+    if name.lower().endswith(".ts"):
+        return Quality.RAWHDTV
+
+    return Quality.UNKNOWN
+
+
+def quality_names():
+    """
+    Every string literal of the test modules plus names built from the quality tokens
+    """
+    names = set()
+
+    for filename in glob.glob(os.path.join(os.path.dirname(__file__), '*.py')):
+        with open(filename) as f:
+            for token in tokenize.generate_tokens(f.readline):
+                if token[0] == tokenize.STRING:
+                    try:
+                        value = ast.literal_eval(token[1])
+                    except (ValueError, SyntaxError):
+                        continue
+                    if not isinstance(value, basestring):
+                        continue
+
+                    # nameQuality stats the name, so it has to be representable in the file system encoding
+                    try:
+                        value = unicode(value)
+                        value.encode(sys.getfilesystemencoding() or 'ascii')
+                    except (UnicodeDecodeError, UnicodeEncodeError):
+                        continue
+
+                    if '\n' not in value:
+                        names.add(value)
+
+    tokens = [['', '480p', '720p', '1080p', '1080i', '2160p', '4320p', '1280x720', '1920x1080'],
+              ['', 'HDTV', 'PDTV', 'HR.WS.PDTV', 'WEB-DL', 'WEBRip', 'iTunes', 'DVDRip', 'BluRay', 'BD', 'HDDVD'],
+              ['', 'x264', 'H.264', 'XviD', 'MPEG2', 'x265']]
+    for parts in itertools.product(*tokens):
+        names.add('Test.Show.S01E02.' + '.'.join(x for x in parts if x) + '-GROUP.mkv')
+        names.add('[Group] Test Show - 02 [' + ' '.join(x for x in parts if x) + '].ts')
+
+    return sorted(names)
+
+
 class QualityTests(SiCKRAGETestCase):
     # TODO: repack / proper ? air-by-date ? season rip? multi-ep?
 
@@ -121,6 +262,29 @@ class QualityTests(SiCKRAGETestCase):
     def test_UNKNOWN(self):
         self.assertEqual(Quality.UNKNOWN, Quality.nameQuality("Test.Show.S01E02-SICKRAGE"))
 
+    def test_ANIME(self):
+        self.assertEqual(Quality.SDTV, Quality.sceneQuality("[Group] Test Show - 02 [480p].mkv", anime=True))
+        self.assertEqual(Quality.HDTV, Quality.sceneQuality("[Group] Test Show - 02 [720p].mkv", anime=True))
+        self.assertEqual(Quality.FULLHDBLURAY,
+                         Quality.sceneQuality("[Group] Test Show - 02 [BD 1080p].mkv", anime=True))
+
+    def test_splitQuality(self):
+        quality = Quality.combineQualities([Quality.SDTV, Quality.HDTV], [Quality.FULLHDBLURAY])
+        anyQualities, bestQualities = Quality.splitQuality(quality)
+        self.assertEqual((anyQualities, bestQualities), ([Quality.SDTV, Quality.HDTV], [Quality.FULLHDBLURAY]))
+
+        # cached results are handed out as copies
+        anyQualities.append(Quality.SDDVD)
+        self.assertEqual(Quality.splitQuality(quality)[0], [Quality.SDTV, Quality.HDTV])
+
+    def test_old_rules(self):
+        for name in quality_names():
+            for anime in (False, True):
+                self.assertEqual(Quality.sceneQuality(name, anime), old_sceneQuality(name, anime),
+                                 "sceneQuality({!r}, anime={})".format(name, anime))
+                self.assertEqual(Quality.nameQuality(name, anime), old_nameQuality(name, anime),
+                                 "nameQuality({!r}, anime={})".format(name, anime))
+
 
 # def test_reverse_parsing(self):
 #        self.assertEqual(Quality.SDTV, Quality.nameQuality("Test Show - S01E02 - SDTV - GROUP"))
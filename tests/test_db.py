@@ -19,9 +19,15 @@
 
 from __future__ import print_function, unicode_literals
 
+import datetime
 import unittest
 
+import sickrage
+from sickrage.core.common import DOWNLOADED, Quality, UNAIRED, WANTED
+from sickrage.core.databases.failed import FailedDB
 from sickrage.core.databases.main import MainDB
+from sickrage.core.tv.show.history import FailedHistory
+from sickrage.core.tv.show.stats import ShowStats
 from tests import SiCKRAGETestDBCase
 
 
@@ -33,6 +39,113 @@ class DBBasicTests(SiCKRAGETestDBCase):
     def test_select(self):
         self.db.select("SELECT * FROM tv_episodes WHERE showid = ? AND location != ''", [0000])
 
+    def test_tv_episodes_indexes(self):
+        self.db.initialize()
+
+        for season in range(2):
+            for episode in range(1, 4):
+                self.db.db.insert({'_t': 'tv_episodes', 'showid': 1, 'season': season, 'episode': episode,
+                                   'absolute_number': season * 10 + episode, 'airdate': 700000 + season * 10 + episode})
+
+        self.assertEqual([x['doc']['episode'] for x in
+                          self.db.db.get_many('tv_episodes_season_episode', (1, 0, 2), with_doc=True)], [2])
+        self.assertEqual([x['doc']['season'] for x in
+                          self.db.db.get_many('tv_episodes_absolute_number', (1, 12), with_doc=True)], [1])
+        self.assertEqual([x['doc']['episode'] for x in
+                          self.db.db.get_many('tv_episodes_airdate', (1, 700013), with_doc=True)], [3])
+        self.assertEqual(len(list(self.db.db.get_many('tv_episodes_season_episode', (2, 0, 2)))), 0)
+        self.assertEqual([x['doc']['airdate'] for x in
+                          self.db.db.get_many('tv_episodes_airdate_order', start=700003, end=700012, with_doc=True)],
+                         [700003, 700011, 700012])
+
+        self.db.close()
+
+    def test_release_name_indexes(self):
+        self.db.initialize()
+
+        # synthetic library, lookups must not depend on its size
+        for showid in range(1, 21):
+            for episode in range(1, 251):
+                self.db.db.insert({'_t': 'tv_episodes', 'showid': showid, 'season': 1, 'episode': episode,
+                                   'release_name': 'Show.{}.S01E{:03d}.720p.HDTV.x264-GRP'.format(showid, episode)})
+                self.db.db.insert({'_t': 'history', 'showid': showid, 'season': 1, 'episode': episode,
+                                   'resource': '/downloads/Show.{}.S01E{:03d}.mkv'.format(showid, episode)})
+
+        self.assertEqual([(x['doc']['showid'], x['doc']['episode']) for x in
+                          self.db.db.get_many('tv_episodes_release_name', 'Show.7.S01E042.720p.HDTV.x264-GRP',
+                                              with_doc=True)], [(7, 42)])
+        self.assertEqual([(x['doc']['showid'], x['doc']['episode']) for x in
+                          self.db.db.get_many('history_resource', 'Show.3.S01E100.mkv', with_doc=True)], [(3, 100)])
+        self.assertEqual(len(list(self.db.db.get_many('history_resource', 'Show.3.S01E999.mkv'))), 0)
+        self.assertEqual([x['doc']['episode'] for x in
+                          self.db.db.get_many('history_release', 'show 3 s01e100.nzb', with_doc=True)], [100])
+
+        self.db.db.insert({'_t': 'history', 'showid': 21, 'season': 1, 'episode': 1, 'date': '20170101000000',
+                           'resource': 'Show.21.S01E01.720p.HDTV.x264-GRP[rartv]'})
+        self.db.db.insert({'_t': 'history', 'showid': 21, 'season': 1, 'episode': 2, 'date': '20170102000000',
+                           'resource': '[ www.site.com ] - Show 21 S01E02 720p HDTV x264-GRP'})
+        self.assertEqual([x['doc']['episode'] for x in
+                          self.db.db.get_many('history_release', 'Show.21.S01E01.720p.HDTV.x264-GRP.mkv',
+                                              with_doc=True)], [1])
+        self.assertEqual([x['doc']['episode'] for x in
+                          self.db.db.get_many('history_release', 'Show.21.S01E02.720p.HDTV.x264-GRP',
+                                              with_doc=True)], [2])
+        self.assertEqual([x['doc']['episode'] for x in
+                          self.db.db.get_many('history_date', start='20170102000000', end=None, with_doc=True)], [2])
+
+        self.db.close()
+
+    def test_tv_stats(self):
+        self.db.initialize()
+        sickrage.srCore.mainDB = self.db
+
+        episode = {'_t': 'tv_episodes', 'showid': 1, 'season': 1, 'episode': 1, 'airdate': 700000,
+                   'status': WANTED, 'file_size': 0}
+        ShowStats.update(1, new=episode)
+        self.assertEqual(ShowStats.get(1)['statuses'], {WANTED: 1})
+
+        downloaded = dict(episode, status=Quality.compositeStatus(DOWNLOADED, Quality.HDTV), file_size=100)
+        ShowStats.update(1, old=episode, new=downloaded)
+        self.assertEqual(ShowStats.home()[0][1]['ep_downloaded'], 1)
+        self.assertEqual(ShowStats.get(1)['file_size'], 100)
+
+        today = datetime.date.today().toordinal()
+        unaired = dict(episode, episode=2, airdate=today + 7, status=UNAIRED)
+        ShowStats.update(1, new=unaired)
+        self.assertEqual(ShowStats.home()[0][1]['ep_airs_next'], today + 7)
+        self.assertEqual(ShowStats.home()[0][1]['ep_airs_prev'], 700000)
+        self.assertEqual(ShowStats.count(ShowStats.get(1), [UNAIRED], today), 0)
+
+        ShowStats.update(1, old=downloaded)
+        ShowStats.update(1, old=unaired)
+        self.assertEqual(ShowStats.get(1)['statuses'], {})
+        self.assertFalse(ShowStats.check())
+
+        self.db.db.insert({'_t': 'tv_shows', 'indexer_id': 99})
+        self.assertTrue(ShowStats.check())
+        self.assertEqual(ShowStats.get(99)['statuses'], {})
+
+        self.db.close()
+
+    def test_failed_non_ascii_release(self):
+        failed_db = FailedDB()
+        failed_db.initialize()
+        sickrage.srCore.failedDB = failed_db
+        FailedHistory.failed_releases = None
+
+        release = FailedHistory.prepareFailedName('Show.Caf\xe9.S01E01.720p.HDTV.x264-GRP')
+        failed_db.db.insert({'_t': 'history', 'date': 20170101000000, 'size': 100, 'release': release,
+                             'provider': 'provider', 'showid': 1, 'season': 1, 'episode': 1, 'old_status': WANTED})
+        self.assertEqual(len(list(failed_db.db.get_many('history_episode', (1, 1, 1)))), 1)
+
+        FailedHistory.logFailed(release)
+        self.assertTrue(FailedHistory.hasFailed(release, 100, 'provider'))
+        self.assertFalse(FailedHistory.hasFailed(release, 200, 'provider'))
+        self.assertEqual(len(list(failed_db.db.get_many('history_release', release))), 0)
+
+        FailedHistory.failed_releases = None
+        failed_db.close()
+
 
 if __name__ == '__main__':
     print("==================")
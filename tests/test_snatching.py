@@ -22,10 +22,12 @@ from __future__ import unicode_literals
 import unittest
 
 import sickrage
-from sickrage.core.common import HD, SD, WANTED
+from sickrage.core.classes import NZBSearchResult
+from sickrage.core.common import HD, Quality, SD, WANTED
 from sickrage.core.search import searchProviders
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show import TVShow
+from sickrage.providers import NZBProvider
 from tests import SiCKRAGETestDBCase
 
 tests = {"Dexter": {"a": 1, "q": HD, "s": 5, "e": [7], "b": 'Dexter.S05E07.720p.BluRay.X264-REWARD',
@@ -63,6 +65,86 @@ class SearchTest(SiCKRAGETestDBCase):
         super(SearchTest, self).setUp()
 
 
+class FakeCache(object):
+    def update(self):
+        pass
+
+
+class FakeProvider(object):
+    id = 'fakeprovider'
+    name = 'FakeProvider'
+    type = NZBProvider.type
+    isEnabled = True
+    anime_only = False
+    search_mode = 'eponly'
+    search_fallback = False
+
+    def __init__(self):
+        self.cache = FakeCache()
+        self.results = {}
+
+    def findSearchResults(self, show, episodes, search_mode, manualSearch=False, downCurQuality=False,
+                          cacheOnly=False):
+        return self.results
+
+
+class FakeProviders(object):
+    def __init__(self, *providers):
+        self.providers = dict([(x.id, x) for x in providers])
+
+    def enabled(self):
+        return self.providers
+
+    def sort(self, key=None, randomize=False):
+        return self.providers
+
+
+class ProviderSearchTest(SiCKRAGETestDBCase):
+    def setUp(self):
+        super(ProviderSearchTest, self).setUp()
+        self.providersDict = sickrage.srCore.providersDict
+        self.config = dict([(x, getattr(sickrage.srCore.srConfig, x)) for x in
+                            ('USE_NZBS', 'ENABLE_RSS_CACHE', 'USE_FAILED_DOWNLOADS', 'RANDOMIZE_PROVIDERS')])
+
+        sickrage.srCore.srConfig.USE_NZBS = True
+        sickrage.srCore.srConfig.ENABLE_RSS_CACHE = False
+        sickrage.srCore.srConfig.USE_FAILED_DOWNLOADS = False
+        sickrage.srCore.srConfig.RANDOMIZE_PROVIDERS = False
+
+    def tearDown(self):
+        sickrage.srCore.providersDict = self.providersDict
+        for key, value in self.config.items():
+            setattr(sickrage.srCore.srConfig, key, value)
+        super(ProviderSearchTest, self).tearDown()
+
+    def test_results_from_provider_search(self):
+        show = TVShow(1, 1)
+        show.name = 'Dexter'
+        show.quality = HD
+        show.saveToDB()
+        sickrage.srCore.SHOWLIST.append(show)
+
+        episode = TVEpisode(show, 5, 7)
+        episode.status = WANTED
+        episode.saveToDB()
+
+        provider = FakeProvider()
+
+        result = NZBSearchResult([episode])
+        result.provider = provider
+        result.show = show
+        result.name = 'Dexter.S05E07.720p.BluRay.X264-REWARD'
+        result.quality = Quality.HDBLURAY
+        result.size = -1
+        result.files = {}
+        provider.results = {episode.episode: [result]}
+
+        sickrage.srCore.providersDict = FakeProviders(provider)
+
+        results = searchProviders(show, [episode])
+        self.assertEqual([result], results)
+
+
 def test_generator(tvdbdid, show_name, curData, forceSearch):
     def test(self):
         global searchItems